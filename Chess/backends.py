@@ -0,0 +1,134 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from Chess.coordinate import Position
+from Chess.exceptions import BackendUnavailable
+
+# Registry of the move generation backends a Board can use. A backend is chosen per Board
+# (`Board(backend="python")`), otherwise from the PYCHESS_BACKEND environment variable, which is
+# read every time a Board is built so running processes can be switched without a restart.
+#
+#   bitboard  the engine in Chess.bitboard (the default)
+#   python    the reference ray walker in Chess.state
+#   cpp       the reference filter over pseudolegal moves from libpychess's MoveAnalyser
+#
+# Boards, pieces and results always hold Chess.coordinate.Position, whichever backend is used. A
+# native backend has its own position type, which only appears at its boundary: `squares` holds
+# one of them per square, and results are mapped back onto Chess.helpers.SQUARES.
+
+ENV_VAR = "PYCHESS_BACKEND"
+DEFAULT = "bitboard"
+
+
+class Backend:
+    """Backend
+    Describes how a Board generates moves and which position type the backend works in."""
+
+    __slots__ = ('name', 'bitboards', 'native', 'position', '_squares')
+
+    def __init__(self, name: str, bitboards: bool = False, native: Any = None, position: type = Position) -> None:
+        """__init__.
+
+        :param self:
+        :param name:
+        :type name: str
+        :param bitboards: Generate legal moves with Chess.bitboard
+        :type bitboards: bool
+        :param native: Extension module providing MoveAnalyser, used for pseudolegal moves
+        :type native: Any
+        :param position: Position type of the backend's own objects
+        :type position: type
+        :rtype: None
+        """
+        self.name = name
+        self.bitboards = bitboards
+        self.native = native
+        self.position = position
+        self._squares: Optional[Tuple] = None
+
+    @property
+    def squares(self) -> Tuple:
+        """One position of the backend's own type per square, indexed (i << 3) | j."""
+        if self._squares is None:
+            if self.position is Position:
+                self._squares = tuple(Position.from_index(sq) for sq in range(64))
+            else:
+                self._squares = tuple(self.position((sq >> 3, sq & 7)) for sq in range(64))
+        return self._squares
+
+    def __repr__(self) -> str:
+        return f"Backend({self.name!r})"
+
+
+def _load_cpp() -> Backend:
+    try:
+        import libpychess
+    except ImportError as e:
+        raise BackendUnavailable("The cpp backend needs the libpychess extension on the python path") from e
+    return Backend("cpp", native=libpychess, position=libpychess.Position)
+
+
+_loaders: Dict[str, Callable[[], Backend]] = {
+    "bitboard": lambda: Backend("bitboard", bitboards=True),
+    "python": lambda: Backend("python"),
+    "cpp": _load_cpp,
+}
+_loaded: Dict[str, Backend] = {}
+
+
+def register(name: str, loader: Callable[[], Backend]) -> None:
+    """register.
+    Adds a backend. `loader` is called the first time the backend is asked for, and may raise
+    BackendUnavailable (e.g. when an extension module is missing).
+
+    :param name:
+    :type name: str
+    :param loader:
+    :type loader: Callable[[], Backend]
+    :rtype: None
+    """
+    _loaders[name] = loader
+    _loaded.pop(name, None)
+
+
+def get(name: Optional[str] = None) -> Backend:
+    """get.
+    The backend called `name`, or the one named by PYCHESS_BACKEND (the bitboard engine if
+    that is not set) when `name` is None.
+
+    :param name:
+    :type name: Optional[str]
+    :rtype: Backend
+    """
+    if name is None:
+        name = os.environ.get(ENV_VAR) or DEFAULT
+    backend = _loaded.get(name)
+    if backend is None:
+        if name not in _loaders:
+            raise ValueError(f"Unknown backend {name!r}, expected one of {', '.join(_loaders)}")
+        backend = _loaded[name] = _loaders[name]()
+    return backend
+
+
+def names() -> List[str]:
+    """Every registered backend, whether or not it can be loaded."""
+    return list(_loaders)
+
+
+def available() -> List[str]:
+    """available.
+    The registered backends which can be loaded in this process.
+
+    :rtype: List[str]
+    """
+    found = []
+    for name in _loaders:
+        try:
+            get(name)
+        except BackendUnavailable:
+            continue
+        found.append(name)
+    return found
@@ -0,0 +1,406 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple, Union
+import numpy as np
+from Chess.bitboard import BISHOP, KING, KNIGHT, PAWN, QUEEN, ROOK, Bitboards
+
+try:
+    # Native batch analysis, taking a POSITION_DTYPE array and returning an ANALYSIS_DTYPE buffer
+    from libpychess import analyse_batch as _native_analyse_batch
+except ImportError:
+    _native_analyse_batch = None
+
+# Move generation for many positions at once. Every position is held as twelve uint64
+# bitboards in a row of a structured array, and moves are generated set-wise with shifts
+# and Kogge-Stone fills over whole columns, so no Board or Piece objects are built.
+# Squares are numbered (i << 3) | j as in Chess.bitboard.
+
+# One packed position: the twelve boards in Chess.bitboard order, side to move and castling rights
+POSITION_DTYPE = np.dtype([("boards", "<u8", (12,)), ("to_move", "?"), ("castle", "?", (4,))])
+
+# Planes of the tensor encoding: the twelve boards, side to move (all ones for white) and
+# one plane per castling right in the order KQkq
+PLANES = 17
+
+# Result of `analyse`: legal_destinations and a set of the flags below for each position
+ANALYSIS_DTYPE = np.dtype([("destinations", "u1", (64,)), ("flags", "u1")])
+CHECK, MATE, STALEMATE = 1, 2, 4
+
+# Positions are processed in chunks of this many rows to bound the temporary arrays
+CHUNK = 1 << 16
+
+_FULL = np.uint64(0xFFFFFFFFFFFFFFFF)
+_NOT_A = np.uint64(0xFEFEFEFEFEFEFEFE)
+_NOT_H = np.uint64(0x7F7F7F7F7F7F7F7F)
+_NOT_AB = np.uint64(0xFCFCFCFCFCFCFCFC)
+_NOT_GH = np.uint64(0x3F3F3F3F3F3F3F3F)
+_RANK_3 = np.uint64(0xFF << 16)
+_RANK_6 = np.uint64(0xFF << 40)
+
+# (shift, mask) for each direction, keyed by (di, dj) as in Chess.tables. The mask clears the
+# squares a shift wraps onto from the other side of the board.
+_STEPS = {
+    (1, 0): (8, _FULL), (-1, 0): (-8, _FULL), (0, 1): (1, _NOT_A), (0, -1): (-1, _NOT_H),
+    (1, 1): (9, _NOT_A), (1, -1): (7, _NOT_H), (-1, 1): (-7, _NOT_A), (-1, -1): (-9, _NOT_H),
+}
+_KNIGHT_STEPS = ((17, _NOT_A), (15, _NOT_H), (10, _NOT_AB), (6, _NOT_GH),
+                 (-6, _NOT_AB), (-10, _NOT_GH), (-15, _NOT_A), (-17, _NOT_H))
+_ROOK_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_BISHOP_DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Index of the line a direction runs along: file, rank, diagonal, anti-diagonal
+_AXIS = {(1, 0): 0, (-1, 0): 0, (0, 1): 1, (0, -1): 1, (1, 1): 2, (-1, -1): 2, (1, -1): 3, (-1, 1): 3}
+
+# FEN piece letters -> board index, everything else (empty squares) -> -1
+_FEN_CODES = np.full(256, -1, dtype=np.int8)
+for _index, _symbol in enumerate("KQRNBPkqrnbp"):
+    _FEN_CODES[ord(_symbol)] = _index
+# Expands the digits of a FEN placement into that many empty squares (replaced in turn, which
+# is faster than str.translate with multi-character replacements)
+_EXPAND = [("/", "")] + [(str(n), "." * n) for n in range(2, 9)] + [("1", ".")]
+
+Positions = Union[Iterable[str], np.ndarray]
+
+
+def pack_fens(fens: Iterable[str]) -> np.ndarray:
+    """pack_fens.
+    Converts FEN strings into an array of POSITION_DTYPE. Only the placement, side to move
+    and castling fields are read.
+
+    :param fens:
+    :type fens: Iterable[str]
+    :rtype: np.ndarray
+    """
+    placements, sides, castles = [], [], []
+    for fen in fens:
+        fields = fen.split(" ", 3)
+        placement = fields[0]
+        for digit, squares in _EXPAND:
+            placement = placement.replace(digit, squares)
+        if len(placement) != 64:
+            raise ValueError(f"Invalid FEN placement: {fields[0]}")
+        placements.append(placement)
+        sides.append(fields[1] == "w")
+        castles.append(fields[2])
+
+    packed = np.zeros(len(placements), dtype=POSITION_DTYPE)
+    if not placements:
+        return packed
+    # FEN lists rank 8 first, flip the ranks so column sq holds square sq
+    codes = _FEN_CODES[np.frombuffer("".join(placements).encode("ascii"), dtype=np.uint8)]
+    codes = codes.reshape(-1, 8, 8)[:, ::-1, :].reshape(-1, 64)
+    for index in range(12):
+        bits = np.packbits(codes == index, axis=1, bitorder="little")
+        packed["boards"][:, index] = bits.view("<u8")[:, 0]
+    packed["to_move"] = sides
+    packed["castle"] = [("K" in castle, "Q" in castle, "k" in castle, "q" in castle) for castle in castles]
+    return packed
+
+
+def pack_bitboards(positions: Iterable[Bitboards]) -> np.ndarray:
+    """pack_bitboards.
+    Converts Bitboards (e.g. `Board._bb`) into an array of POSITION_DTYPE.
+
+    :param positions:
+    :type positions: Iterable[Bitboards]
+    :rtype: np.ndarray
+    """
+    positions = list(positions)
+    packed = np.zeros(len(positions), dtype=POSITION_DTYPE)
+    packed["boards"] = [bb.boards for bb in positions]
+    packed["to_move"] = [bb.to_move for bb in positions]
+    packed["castle"] = [bb.castle for bb in positions]
+    return packed
+
+
+def _as_positions(fens_or_packed: Positions) -> np.ndarray:
+    if isinstance(fens_or_packed, np.ndarray) and fens_or_packed.dtype == POSITION_DTYPE:
+        return fens_or_packed
+    if isinstance(fens_or_packed, str):
+        raise TypeError("Expected an iterable of FEN strings, not a single string")
+    return pack_fens(fens_or_packed)
+
+
+def planes(fens_or_packed: Positions, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """planes.
+    Encodes positions as uint8 planes of shape (N, PLANES, 8, 8), indexed [n, plane, i, j]
+    like Position.i and Position.j.
+
+    :param fens_or_packed: FEN strings, or an array of POSITION_DTYPE
+    :type fens_or_packed: Positions
+    :param out: Array to write into, allocated if not given
+    :type out: Optional[np.ndarray]
+    :rtype: np.ndarray
+    """
+    positions = _as_positions(fens_or_packed)
+    n = len(positions)
+    if out is None:
+        out = np.empty((n, PLANES, 8, 8), dtype=np.uint8)
+    elif out.shape != (n, PLANES, 8, 8):
+        raise ValueError(f"Expected an array of shape {(n, PLANES, 8, 8)}, got {out.shape}")
+    boards = positions["boards"].astype("<u8").view(np.uint8).reshape(n, 12, 8)
+    out[:, :12] = np.unpackbits(boards, axis=2, bitorder="little").reshape(n, 12, 8, 8)
+    out[:, 12] = positions["to_move"][:, None, None]
+    out[:, 13:] = positions["castle"][:, :, None, None]
+    return out
+
+
+def encode_fens(fens: Iterable[str], out: np.ndarray) -> int:
+    """encode_fens.
+    Streams FEN strings into `out` (e.g. a np.memmap of shape (N, PLANES, 8, 8)) a chunk at a
+    time, so only CHUNK positions are held in memory at once. Returns the number of rows written.
+
+    :param fens:
+    :type fens: Iterable[str]
+    :param out:
+    :type out: np.ndarray
+    :rtype: int
+    """
+    if out.shape[1:] != (PLANES, 8, 8):
+        raise ValueError(f"Expected an array of shape (N, {PLANES}, 8, 8), got {out.shape}")
+    fens = iter(fens)
+    written = 0
+    while True:
+        chunk = pack_fens(islice(fens, CHUNK))
+        if not len(chunk):
+            return written
+        if written + len(chunk) > len(out):
+            raise ValueError(f"More than {len(out)} positions to encode")
+        planes(chunk, out[written:written + len(chunk)])
+        written += len(chunk)
+
+
+def _shift(bb: np.ndarray, s: int) -> np.ndarray:
+    return bb << np.uint64(s) if s > 0 else bb >> np.uint64(-s)
+
+
+def _step(bb: np.ndarray, direction: Tuple[int, int]) -> np.ndarray:
+    s, mask = _STEPS[direction]
+    return _shift(bb, s) & mask
+
+
+def _ray(gen: np.ndarray, empty: np.ndarray, direction: Tuple[int, int]) -> np.ndarray:
+    """_ray.
+    Squares attacked along `direction` by the sliders in `gen`: every empty square up to and
+    including the first occupied one (a Kogge-Stone occluded fill).
+
+    :param gen: Bitboards of the sliding pieces
+    :type gen: np.ndarray
+    :param empty: Bitboards of the empty squares
+    :type empty: np.ndarray
+    :param direction:
+    :type direction: Tuple[int, int]
+    :rtype: np.ndarray
+    """
+    s, mask = _STEPS[direction]
+    empty = empty & mask
+    gen = gen | (empty & _shift(gen, s))
+    empty = empty & _shift(empty, s)
+    gen = gen | (empty & _shift(gen, 2 * s))
+    empty = empty & _shift(empty, 2 * s)
+    gen = gen | (empty & _shift(gen, 4 * s))
+    return _shift(gen, s) & mask
+
+
+def _knight_attacks(knights: np.ndarray) -> List[np.ndarray]:
+    return [_shift(knights, s) & mask for s, mask in _KNIGHT_STEPS]
+
+
+def _counts(moves: Iterable[np.ndarray], n: int) -> np.ndarray:
+    """Adds up the squares set in each set of moves, giving the number of moves onto each square."""
+    counts = np.zeros((n, 64), dtype=np.uint8)
+    for bb in moves:
+        counts += np.unpackbits(bb.astype("<u8").view(np.uint8).reshape(n, 8), axis=1, bitorder="little")
+    return counts
+
+
+class _Sides:
+    """_Sides
+    The boards of a chunk of positions split into the side to move and its opponent."""
+
+    __slots__ = ('n', 'white', 'own', 'enemy', 'own_occ', 'enemy_occ', 'empty', 'castle')
+
+    def __init__(self, positions: np.ndarray) -> None:
+        boards = positions["boards"]
+        self.n = len(positions)
+        self.white = positions["to_move"]
+        white = self.white[:, None]
+        self.own = np.where(white, boards[:, :6], boards[:, 6:])
+        self.enemy = np.where(white, boards[:, 6:], boards[:, :6])
+        self.own_occ = np.bitwise_or.reduce(self.own, axis=1)
+        self.enemy_occ = np.bitwise_or.reduce(self.enemy, axis=1)
+        self.empty = ~(self.own_occ | self.enemy_occ)
+        self.castle = positions["castle"]
+
+    def pawn_step(self, bb: np.ndarray, dj: int, forward: bool = True) -> np.ndarray:
+        """Steps pawns one rank towards (or away from) the opposing side, and dj files across."""
+        up = _step(bb, (1, dj))
+        down = _step(bb, (-1, dj))
+        return np.where(self.white == forward, up, down)
+
+
+def _pseudo_moves(sides: _Sides) -> List[np.ndarray]:
+    """The sets of moves of each piece kind in each direction, ignoring checks, pins and castling."""
+    own, empty, enemy_occ = sides.own, sides.empty, sides.enemy_occ
+    targets = ~sides.own_occ
+    moves = [bb & targets for bb in _knight_attacks(own[:, KNIGHT])]
+    moves += [_step(own[:, KING], d) & targets for d in _STEPS]
+    for dirs, kind in ((_ROOK_DIRS, ROOK), (_BISHOP_DIRS, BISHOP)):
+        sliders = own[:, kind] | own[:, QUEEN]
+        moves += [_ray(sliders, empty, d) & targets for d in dirs]
+    pawns = own[:, PAWN]
+    single = sides.pawn_step(pawns, 0) & empty
+    double_rank = np.where(sides.white, _RANK_3, _RANK_6)
+    moves += [single, sides.pawn_step(single & double_rank, 0) & empty]
+    moves += [sides.pawn_step(pawns, dj) & enemy_occ for dj in (1, -1)]
+    return moves
+
+
+def _legal_moves(sides: _Sides) -> Tuple[List[np.ndarray], np.ndarray]:
+    """The sets of legal moves of each piece kind in each direction, and the checking pieces."""
+    own, enemy, empty = sides.own, sides.enemy, sides.empty
+    own_occ, enemy_occ = sides.own_occ, sides.enemy_occ
+    king = own[:, KING]
+    zero = np.zeros(sides.n, dtype=np.uint64)
+
+    enemy_sliders = {}
+    for d in _ROOK_DIRS: enemy_sliders[d] = enemy[:, ROOK] | enemy[:, QUEEN]
+    for d in _BISHOP_DIRS: enemy_sliders[d] = enemy[:, BISHOP] | enemy[:, QUEEN]
+
+    # Squares attacked by the opponent, seen through our king so it cannot step back along a check
+    through_king = empty | king
+    attacked = sides.pawn_step(enemy[:, PAWN], 1, forward=False) | sides.pawn_step(enemy[:, PAWN], -1, forward=False)
+    for bb in _knight_attacks(enemy[:, KNIGHT]): attacked |= bb
+    for d in _STEPS:
+        attacked |= _step(enemy[:, KING], d)
+        attacked |= _ray(enemy_sliders[d], through_king, d)
+
+    # Look outward from the king for checks and pins
+    checkers = sides.pawn_step(king, 1) | sides.pawn_step(king, -1)
+    checkers &= enemy[:, PAWN]
+    for bb in _knight_attacks(king): checkers |= bb & enemy[:, KNIGHT]
+    check_lines = zero.copy()
+    pinned_on = [zero.copy() for _ in range(4)]
+    for d in _STEPS:
+        ray = _ray(king, empty, d)
+        hit = ray & enemy_sliders[d]
+        checkers |= hit
+        check_lines |= np.where(hit != 0, ray, zero)
+        # Look through the first piece of ours for a slider behind it
+        first = ray & own_occ
+        xray = _ray(king, empty | first, d)
+        pinner = xray & ~ray & enemy_sliders[d]
+        pinned_on[_AXIS[d]] |= np.where(pinner != 0, first, zero)
+    pinned = pinned_on[0] | pinned_on[1] | pinned_on[2] | pinned_on[3]
+
+    single_check = (checkers & (checkers - np.uint64(1))) == 0
+    check_mask = np.where(checkers == 0, _FULL, np.where(single_check, checkers | check_lines, zero))
+    targets = ~own_occ & check_mask
+
+    moves = [_step(king, d) & ~own_occ & ~attacked for d in _STEPS]
+
+    # Pinned pieces may only move along the line they are pinned on
+    moves += [bb & targets for bb in _knight_attacks(own[:, KNIGHT] & ~pinned)]
+    for dirs, kind in ((_ROOK_DIRS, ROOK), (_BISHOP_DIRS, BISHOP)):
+        sliders = own[:, kind] | own[:, QUEEN]
+        for d in dirs:
+            movers = sliders & ~(pinned & ~pinned_on[_AXIS[d]])
+            moves.append(_ray(movers, empty, d) & targets)
+
+    pawns = own[:, PAWN]
+    single = sides.pawn_step(pawns & ~(pinned & ~pinned_on[0]), 0) & empty
+    double_rank = np.where(sides.white, _RANK_3, _RANK_6)
+    moves += [single & check_mask, sides.pawn_step(single & double_rank, 0) & empty & check_mask]
+    for dj in (1, -1):
+        # Capturing towards +j runs along the diagonal for white and the anti-diagonal for black
+        axis = np.where(sides.white == (dj == 1), pinned_on[2], pinned_on[3])
+        moves.append(sides.pawn_step(pawns & ~(pinned & ~axis), dj) & enemy_occ & targets)
+
+    # Castling, with the same conditions as Chess.bitboard.castle_targets
+    not_checked = checkers == 0
+    rank = np.where(sides.white, np.uint64(0), np.uint64(56))
+    castles = zero.copy()
+    for right, rook, empties, safe, king_to in ((0, 7, (5, 6), (5, 6), 6), (1, 0, (1, 2, 3), (2, 3), 2)):
+        allowed = np.where(sides.white, sides.castle[:, right], sides.castle[:, right + 2]) & not_checked
+        allowed &= (king >> (rank + np.uint64(4))) & np.uint64(1) == 1
+        allowed &= (own[:, ROOK] >> (rank + np.uint64(rook))) & np.uint64(1) == 1
+        for sq in empties: allowed &= (empty >> (rank + np.uint64(sq))) & np.uint64(1) == 1
+        for sq in safe: allowed &= (attacked >> (rank + np.uint64(sq))) & np.uint64(1) == 0
+        castles |= np.where(allowed, np.uint64(1) << (rank + np.uint64(king_to)), zero)
+    moves.append(castles)
+    return moves, checkers
+
+
+def _destinations(fens_or_packed: Positions, generate) -> np.ndarray:
+    positions = _as_positions(fens_or_packed)
+    out = np.zeros((len(positions), 64), dtype=np.uint8)
+    for start in range(0, len(positions), CHUNK):
+        chunk = positions[start:start + CHUNK]
+        out[start:start + len(chunk)] = _counts(generate(_Sides(chunk)), len(chunk))
+    return out
+
+
+def legal_destinations(fens_or_packed: Positions) -> np.ndarray:
+    """legal_destinations.
+    Counts the legal moves onto each square for the side to move in every position.
+    Row n column sq is the number of pieces which can legally move to square sq in position n,
+    the same as counting the squares in `Board.moves.all_valid` (castling counts as a king move).
+
+    :param fens_or_packed: FEN strings, or an array of POSITION_DTYPE from `pack_fens`
+    :type fens_or_packed: Positions
+    :rtype: np.ndarray (N, 64) uint8
+    """
+    return _destinations(fens_or_packed, lambda sides: _legal_moves(sides)[0])
+
+
+def pseudo_legal_destinations(fens_or_packed: Positions) -> np.ndarray:
+    """pseudo_legal_destinations.
+    Counts the moves onto each square allowed by the movement of the pieces alone:
+    checks, pins and castling are not considered.
+
+    :param fens_or_packed: FEN strings, or an array of POSITION_DTYPE from `pack_fens`
+    :type fens_or_packed: Positions
+    :rtype: np.ndarray (N, 64) uint8
+    """
+    return _destinations(fens_or_packed, _pseudo_moves)
+
+
+def _analyse_chunk(positions: np.ndarray, out: np.ndarray) -> None:
+    moves, checkers = _legal_moves(_Sides(positions))
+    out["destinations"] = _counts(moves, len(positions))
+    check = checkers != 0
+    stuck = ~out["destinations"].any(axis=1)
+    out["flags"] = check * CHECK | (check & stuck) * MATE | (~check & stuck) * STALEMATE
+
+
+def analyse(fens_or_packed: Positions, threads: Optional[int] = None) -> np.ndarray:
+    """analyse.
+    Legal destinations (as `legal_destinations`) and CHECK/MATE/STALEMATE flags for every
+    position, in one contiguous array of ANALYSIS_DTYPE. Uses `libpychess.analyse_batch` when
+    the extension provides it, otherwise chunks of positions are spread over a thread pool
+    (NumPy releases the GIL for the array operations which make up most of the work).
+
+    :param fens_or_packed: FEN strings, or an array of POSITION_DTYPE
+    :type fens_or_packed: Positions
+    :param threads: Number of threads, all in the calling thread if None or 1
+    :type threads: Optional[int]
+    :rtype: np.ndarray
+    """
+    positions = _as_positions(fens_or_packed)
+    if _native_analyse_batch is not None:
+        return np.frombuffer(_native_analyse_batch(np.ascontiguousarray(positions), threads or 0),
+                             dtype=ANALYSIS_DTYPE)
+
+    out = np.zeros(len(positions), dtype=ANALYSIS_DTYPE)
+    chunks = [slice(start, start + CHUNK) for start in range(0, len(positions), CHUNK)]
+    if threads and threads > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda chunk: _analyse_chunk(positions[chunk], out[chunk]), chunks))
+    else:
+        for chunk in chunks:
+            _analyse_chunk(positions[chunk], out[chunk])
+    return out
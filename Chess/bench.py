@@ -0,0 +1,245 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import argparse
+import os
+import pickle
+import random
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+from Chess import backends, batch, bitboard
+from Chess.coordinate import Move
+from Chess.game import Game
+from Chess.state import Board, construct_board, move_from_packed
+
+# Benchmarks for the move generation pipeline. Run with `python3 -m Chess.bench`.
+# Games are read from the pickled move lists written by generate_data.py; if that file is
+# not available (e.g. the LFS objects have not been fetched) random games are used instead.
+
+CORPUS = "generated_data/lichess_db_standard_rated_2013-01.pickle"
+
+
+def corpus_games(path: str, n_games: int) -> Optional[List[List[Move]]]:
+    """corpus_games.
+    Resolves the first `n_games` games of the corpus into `Move` objects, stopping each game
+    at the first move which cannot be applied (en-passant, promotion...).
+
+    :param path: Pickled list of games, each a list of moves in standard notation
+    :type path: str
+    :param n_games:
+    :type n_games: int
+    :rtype: Optional[List[List[Move]]]
+    """
+    try:
+        with open(path, "rb") as f:
+            games = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+    resolved = []
+    for moves in games[:n_games]:
+        game = Game(start_state=Board())
+        sequence = []
+        for move_str in moves:
+            move = game.parse_move(move_str)
+            if not move or not game.execute_move(move):
+                break
+            sequence.append(move)
+        resolved.append(sequence)
+    return resolved
+
+
+def random_games(n_games: int, plies: int = 80, seed: int = 0) -> List[List[Move]]:
+    """random_games.
+    Plays `n_games` games of uniformly random legal moves, for use when the corpus is missing.
+
+    :param n_games:
+    :type n_games: int
+    :param plies: Maximum length of each game
+    :type plies: int
+    :param seed:
+    :type seed: int
+    :rtype: List[List[Move]]
+    """
+    rng = random.Random(seed)
+    games = []
+    for _ in range(n_games):
+        board = Board(lazy=True)
+        sequence = []
+        for _ in range(plies):
+            moves, _ = bitboard.legal_moves(board._bb)
+            if not moves:
+                break
+            move = move_from_packed(rng.choice(moves))
+            board.move(move)
+            sequence.append(move)
+        games.append(sequence)
+    return games
+
+
+def load_games(path: str, n_games: int) -> List[List[Move]]:
+    games = corpus_games(path, n_games)
+    if games is None:
+        print(f"Could not read {path}, using {n_games} random games")
+        games = random_games(n_games)
+    return games
+
+
+def replay(games: List[List[Move]], lazy: bool) -> float:
+    """replay.
+    Applies every game to a fresh board and reads the final FEN (the generate_data workload).
+    Returns the elapsed time in seconds.
+
+    :param games:
+    :type games: List[List[Move]]
+    :param lazy: Construct the boards in lazy mode
+    :type lazy: bool
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for moves in games:
+        board = Board(lazy=lazy)
+        for move in moves:
+            board.move(move)
+        board.to_fen()
+    return time.perf_counter() - start
+
+
+def bench_lazy(games: List[List[Move]]) -> None:
+    """Compares replaying games with eager and lazy boards."""
+    plies = sum(len(g) for g in games)
+    eager = replay(games, lazy=False)
+    lazy = replay(games, lazy=True)
+    print(f"{len(games)} games, {plies} plies")
+    print(f"eager: {1000 * eager / len(games):8.2f} ms/game")
+    print(f"lazy:  {1000 * lazy / len(games):8.2f} ms/game")
+    print(f"speedup: {eager / lazy:.1f}x")
+
+
+def bench_memory(games: List[List[Move]]) -> None:
+    """bench_memory.
+    Replays every game with tracemalloc running and reports the memory blocks still held by the
+    final boards, grouped by the file which allocated them, and the peak traced memory.
+
+    :param games:
+    :type games: List[List[Move]]
+    :rtype: None
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    boards = []
+    for moves in games:
+        board = Board()
+        for move in moves:
+            board.move(move)
+        board.to_fen()
+        boards.append(board)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = [stat for stat in after.compare_to(before, "filename") if stat.count_diff > 0]
+    print(f"{len(games)} games, {sum(len(g) for g in games)} plies")
+    print(f"held by the final boards: {sum(s.count_diff for s in stats)} blocks, "
+          f"{sum(s.size_diff for s in stats) / 1024:.0f} KiB")
+    for stat in stats[:6]:
+        print(f"  {stat.traceback[0].filename}: {stat.count_diff} blocks, {stat.size_diff / 1024:.0f} KiB")
+    print(f"peak: {peak / 1024 ** 2:.1f} MiB")
+
+
+def bench_board_bytes(games: List[List[Move]]) -> None:
+    """bench_board_bytes.
+    Measures the memory held by a Board (with its pieces, maps and bitboards), for boards in the
+    starting position and for boards at the end of each game.
+
+    :param games:
+    :type games: List[List[Move]]
+    :rtype: None
+    """
+    def held(make: Callable[[List[Move]], Board]) -> float:
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        boards = [make(moves) for moves in games]
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return (after - before) / len(boards)
+
+    def replayed(moves: List[Move]) -> Board:
+        board = Board(lazy=True)
+        for move in moves:
+            board.move(move)
+        return board
+
+    print(f"{len(games)} boards")
+    print(f"starting position: {held(lambda _: Board(lazy=True)):8.0f} bytes/board")
+    print(f"end of game:       {held(replayed):8.0f} bytes/board")
+
+
+def bench_batch(games: List[List[Move]], positions: int = 100_000) -> None:
+    """bench_batch.
+    Compares counting the legal moves onto each square with one Board per position against
+    Chess.batch.legal_destinations. The positions are every ply of the games, repeated up to
+    `positions` rows for the batch; the per-board loop runs once over the distinct positions.
+
+    :param games:
+    :type games: List[List[Move]]
+    :param positions: Number of positions in the batch
+    :type positions: int
+    :rtype: None
+    """
+    fens = []
+    for moves in games:
+        board = Board(lazy=True)
+        for move in moves:
+            board.move(move)
+            fens.append(board.to_fen())
+
+    start = time.perf_counter()
+    for fen in fens:
+        construct_board(fen).moves.all_valid
+    per_board = (time.perf_counter() - start) / len(fens)
+
+    repeated = (fens * (positions // len(fens) + 1))[:positions]
+    start = time.perf_counter()
+    packed = batch.pack_fens(repeated)
+    packing = time.perf_counter() - start
+    batch.legal_destinations(packed)
+    per_batch = (time.perf_counter() - start) / positions
+
+    print(f"per board: {1e6 * per_board:8.2f} us/position ({len(fens)} positions)")
+    print(f"batch:     {1e6 * per_batch:8.2f} us/position ({positions} positions, "
+          f"{1e6 * packing / positions:.2f} us packing the FENs)")
+    print(f"speedup: {per_board / per_batch:.1f}x")
+
+
+BENCHMARKS = {
+    "lazy": bench_lazy,
+    "memory": bench_memory,
+    "size": bench_board_bytes,
+    "batch": bench_batch,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Chess package")
+    parser.add_argument("benchmark", choices=list(BENCHMARKS), nargs="?", default="lazy")
+    parser.add_argument("--games", default=CORPUS, help="pickled move lists from generate_data.py")
+    parser.add_argument("-n", type=int, default=200, help="number of games")
+    parser.add_argument("--backend", help="move generation backend (see Chess.backends), or 'all' to run the "
+                                          "benchmark once with each backend available")
+    args = parser.parse_args()
+
+    games = load_games(args.games, args.n)
+    if args.backend == "all":
+        selected = backends.available()
+        print(f"Backends: {', '.join(selected)} (unavailable: "
+              f"{', '.join(sorted(set(backends.names()) - set(selected))) or 'none'})")
+    else:
+        selected = [args.backend or backends.get().name]
+    for name in selected:
+        # Boards pick the backend up from the environment as they are built
+        os.environ[backends.ENV_VAR] = name
+        print(f"== {name} ==")
+        BENCHMARKS[args.benchmark](games)
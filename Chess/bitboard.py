@@ -0,0 +1,604 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import random
+from array import array
+from typing import Dict, Iterator, List, Tuple
+from Chess.constants import BLACK, WHITE, PIECE_TYPES, MOVE_CAPTURE, MOVE_CASTLE
+from Chess.evaluation import ENDGAME, MIDDLEGAME, PHASE
+from Chess.magic import bishop_attacks, queen_attacks, rook_attacks
+from Chess.tables import BETWEEN, KING_ATTACKS, KNIGHT_ATTACKS, LINE, PAWN_ATTACKS
+
+# Squares are numbered the same way Position.__hash__ numbers them, (i << 3) | j,
+# so A1 = 0, H1 = 7, A8 = 56 and H8 = 63.
+FULL = 0xFFFFFFFFFFFFFFFF
+
+# Piece kinds index into the board list in the same order as PIECE_TYPES.
+# White boards are stored at 0-5 and black boards at 6-11.
+KING, QUEEN, ROOK, KNIGHT, BISHOP, PAWN = range(6)
+EMPTY = -1
+
+# Packed move layout: 6 bits from, 6 bits to, then the MOVE_CAPTURE and MOVE_CASTLE flags.
+# The 14 bits fit an unsigned short, so move lists are array('H') and hold no per-move objects.
+
+# Castling lookups indexed in the same order as Board._castle (K, Q, k, q):
+# (rights index, king start, rook start, squares which must be empty,
+#  squares which must not be attacked, king destination, rook destination)
+CASTLES = {
+    WHITE: ((0, 4, 7, (5, 6), (5, 6), 6, 5), (1, 4, 0, (1, 2, 3), (2, 3), 2, 3)),
+    BLACK: ((2, 60, 63, (61, 62), (61, 62), 62, 61), (3, 60, 56, (57, 58, 59), (58, 59), 58, 59)),
+}
+
+
+# Zobrist keys, seeded so a position hashes the same in every process
+_zobrist_random = random.Random(0x5EED)
+ZOBRIST_PIECES = [[_zobrist_random.getrandbits(64) for _ in range(64)] for _ in range(12)]
+ZOBRIST_CASTLE = [_zobrist_random.getrandbits(64) for _ in range(4)]
+ZOBRIST_BLACK = _zobrist_random.getrandbits(64)
+
+
+def offset(colour: bool) -> int:
+    """offset.
+    Index of the first board belonging to `colour`.
+
+    :param colour:
+    :type colour: bool
+    :rtype: int
+    """
+    return 0 if colour == WHITE else 6
+
+
+def bits(board: int) -> Iterator[int]:
+    """bits.
+    Yields the square index of every set bit, lowest first.
+
+    :param board:
+    :type board: int
+    :rtype: Iterator[int]
+    """
+    while board:
+        low = board & -board
+        yield low.bit_length() - 1
+        board ^= low
+
+
+def lsb(board: int) -> int:
+    """lsb.
+    Square index of the lowest set bit.
+
+    :param board:
+    :type board: int
+    :rtype: int
+    """
+    return (board & -board).bit_length() - 1
+
+
+def between(a: int, b: int) -> int:
+    """between.
+    Squares strictly between `a` and `b` when they share a rank, file or diagonal,
+    otherwise 0.
+
+    :param a:
+    :type a: int
+    :param b:
+    :type b: int
+    :rtype: int
+    """
+    return BETWEEN[a][b]
+
+
+def extend(a: int, b: int) -> int:
+    """extend.
+    The square one step past `b` on the line from `a` through `b`, or 0 if that
+    falls off the board or the squares do not share a line.
+
+    :param a:
+    :type a: int
+    :param b:
+    :type b: int
+    :rtype: int
+    """
+    # The neighbours of b on the line, less the one back towards a
+    return LINE[a][b] & KING_ATTACKS[b] & ~BETWEEN[a][b] & ~(1 << a)
+
+
+class Bitboards:
+    """Bitboards
+    Compact representation of a position: one 64-bit integer per piece kind and colour,
+    a 64 entry mailbox for piece-at-square lookups, the side to move and the castling rights.
+    Kept in sync with the Piece objects owned by Board so move generation never has
+    to touch them.
+
+    Attack maps are maintained alongside the pieces: `attacks[sq]` is the set of squares
+    attacked by the piece on `sq` and `attackers[sq]` is the set of squares holding a piece
+    (of either colour) which attacks `sq`. Changing a square only recomputes the piece
+    standing there and the sliders whose rays pass through it.
+
+    `key` is the Zobrist hash of the position, updated by XOR whenever a piece is placed or
+    lifted, a castling right changes (`set_castle`) or the side to move changes (`switch_side`).
+    The evaluation terms of Chess.evaluation (`middlegame`, `endgame` and `phase`) are updated
+    the same way.
+    """
+
+    __slots__ = ('boards', 'mailbox', 'occupied', 'to_move', 'castle', 'attacks', 'attackers', 'key',
+                 'middlegame', 'endgame', 'phase')
+
+    def __init__(self, to_move: bool = WHITE, castle: List[bool] = None) -> None:
+        """__init__.
+        Creates an empty board, use `from_pieces` to populate one.
+
+        :param self:
+        :param to_move: Colour which moves next
+        :type to_move: bool
+        :param castle: Castling rights in the same form as Board._castle
+        :type castle: List[bool]
+        :rtype: None
+        """
+        self.boards: List[int] = [0] * 12
+        self.mailbox: List[int] = [EMPTY] * 64
+        # Indexed by colour, so occupied[WHITE] and occupied[BLACK] both work
+        self.occupied: List[int] = [0, 0]
+        self.to_move: bool = to_move
+        self.castle: List[bool] = castle if castle is not None else [False] * 4
+        self.attacks: List[int] = [0] * 64
+        self.attackers: List[int] = [0] * 64
+        self.key: int = self.compute_key()
+        # Evaluation terms, see Chess.evaluation
+        self.middlegame: int = 0
+        self.endgame: int = 0
+        self.phase: int = 0
+
+    @classmethod
+    def from_pieces(cls, pieces, to_move: bool = WHITE, castle: List[bool] = None) -> 'Bitboards':
+        """from_pieces.
+        Builds the bitboards from a list of `Piece` objects, skipping captured pieces.
+
+        :param pieces: List[Piece]
+        :param to_move:
+        :type to_move: bool
+        :param castle:
+        :type castle: List[bool]
+        :rtype: 'Bitboards'
+        """
+        bb = cls(to_move, castle)
+        for piece in pieces:
+            if piece.is_active:
+                index = PIECE_TYPES.index(piece.kind) + offset(piece.colour)
+                bb._place((piece.position.i << 3) | piece.position.j, index)
+        bb.refresh_attacks()
+        return bb
+
+    def __repr__(self) -> str:
+        return self.placement()
+
+    def copy(self) -> 'Bitboards':
+        """Independent copy, including the castling rights (which are otherwise shared with Board)."""
+        bb = Bitboards.__new__(Bitboards)
+        bb.boards = self.boards[:]
+        bb.mailbox = self.mailbox[:]
+        bb.occupied = self.occupied[:]
+        bb.to_move = self.to_move
+        bb.castle = self.castle[:]
+        bb.attacks = self.attacks[:]
+        bb.attackers = self.attackers[:]
+        bb.key = self.key
+        bb.middlegame, bb.endgame, bb.phase = self.middlegame, self.endgame, self.phase
+        return bb
+
+    def _place(self, sq: int, index: int) -> None:
+        """Sets the bits for piece `index` on `sq` without touching the attack maps."""
+        bit = 1 << sq
+        self.boards[index] |= bit
+        self.occupied[index < 6] |= bit
+        self.mailbox[sq] = index
+        self.key ^= ZOBRIST_PIECES[index][sq]
+        self.middlegame += MIDDLEGAME[index][sq]
+        self.endgame += ENDGAME[index][sq]
+        self.phase += PHASE[index]
+
+    def _lift(self, sq: int) -> int:
+        """Clears the bits of the piece on `sq` without touching the attack maps."""
+        index = self.mailbox[sq]
+        bit = 1 << sq
+        self.boards[index] ^= bit
+        self.occupied[index < 6] ^= bit
+        self.mailbox[sq] = EMPTY
+        self.key ^= ZOBRIST_PIECES[index][sq]
+        self.middlegame -= MIDDLEGAME[index][sq]
+        self.endgame -= ENDGAME[index][sq]
+        self.phase -= PHASE[index]
+        return index
+
+    def _set_attacks(self, sq: int, attacks: int) -> None:
+        """Replaces the attack set of the piece on `sq` and updates the attackers of each target."""
+        bit = 1 << sq
+        attackers = self.attackers
+        old = self.attacks[sq]
+        # bits() inlined, this runs for every piece touched by a move
+        changed = old ^ attacks
+        while changed:
+            low = changed & -changed
+            attackers[low.bit_length() - 1] ^= bit
+            changed ^= low
+        self.attacks[sq] = attacks
+
+    def _sliders(self) -> int:
+        boards = self.boards
+        return (boards[QUEEN] | boards[ROOK] | boards[BISHOP]
+                | boards[QUEEN + 6] | boards[ROOK + 6] | boards[BISHOP + 6])
+
+    def _refresh_sliders(self, sliders: int) -> None:
+        """Recomputes the attacks of the sliding pieces on the squares in `sliders`."""
+        occ = self.occupancy
+        for sq in bits(sliders):
+            self._set_attacks(sq, attacks_from(self, sq, occ))
+
+    def refresh_attacks(self) -> None:
+        """Rebuilds both attack maps from scratch."""
+        self.attacks = [0] * 64
+        self.attackers = [0] * 64
+        occ = self.occupancy
+        for sq in bits(occ):
+            self._set_attacks(sq, attacks_from(self, sq, occ))
+
+    def put(self, sq: int, index: int) -> None:
+        """Places piece `index` on the empty square `sq`."""
+        sliders = self.attackers[sq] & self._sliders()
+        self._place(sq, index)
+        self._set_attacks(sq, attacks_from(self, sq, self.occupancy))
+        self._refresh_sliders(sliders)
+
+    def remove(self, sq: int) -> int:
+        """Removes and returns the piece on `sq`."""
+        sliders = self.attackers[sq] & self._sliders()
+        self._set_attacks(sq, 0)
+        index = self._lift(sq)
+        self._refresh_sliders(sliders)
+        return index
+
+    def move(self, start: int, end: int) -> None:
+        """Moves the piece on `start` onto the empty square `end`."""
+        sliders = (self.attackers[start] | self.attackers[end]) & self._sliders() & ~(1 << start)
+        self._set_attacks(start, 0)
+        self._place(end, self._lift(start))
+        self._set_attacks(end, attacks_from(self, end, self.occupancy))
+        self._refresh_sliders(sliders)
+
+    def make(self, mov: int) -> Tuple[int, Tuple[bool, ...]]:
+        """make.
+        Applies a packed move from `legal_moves` and passes the move to the other side.
+        Returns the captured piece and the previous castling rights for `unmake`.
+
+        :param self:
+        :param mov:
+        :type mov: int
+        :rtype: Tuple[int, Tuple[bool, ...]]
+        """
+        start, end = mov & 63, (mov >> 6) & 63
+        castle = tuple(self.castle)
+        captured = self.remove(end) if mov & MOVE_CAPTURE else EMPTY
+        self.move(start, end)
+        if mov & MOVE_CASTLE:
+            for _, _, rook, _, _, king_to, rook_to in CASTLES[self.to_move]:
+                if king_to == end:
+                    self.move(rook, rook_to)
+            first = 0 if self.to_move == WHITE else 2
+            self.set_castle(first, False)
+            self.set_castle(first + 1, False)
+        self.switch_side()
+        return captured, castle
+
+    def unmake(self, mov: int, undo: Tuple[int, Tuple[bool, ...]]) -> None:
+        """unmake.
+        Takes back a packed move applied with `make`.
+
+        :param self:
+        :param mov:
+        :type mov: int
+        :param undo: The value returned by `make`
+        :type undo: Tuple[int, Tuple[bool, ...]]
+        :rtype: None
+        """
+        start, end = mov & 63, (mov >> 6) & 63
+        captured, castle = undo
+        self.switch_side()
+        if mov & MOVE_CASTLE:
+            for _, _, rook, _, _, king_to, rook_to in CASTLES[self.to_move]:
+                if king_to == end:
+                    self.move(rook_to, rook)
+        self.move(end, start)
+        if captured != EMPTY:
+            self.put(end, captured)
+        for right, allowed in enumerate(castle):
+            self.set_castle(right, allowed)
+
+    def set_castle(self, right: int, allowed: bool) -> None:
+        """Sets castling right `right` (K, Q, k, q order) and updates the key."""
+        if self.castle[right] != allowed:
+            self.castle[right] = allowed
+            self.key ^= ZOBRIST_CASTLE[right]
+
+    def switch_side(self) -> None:
+        """Passes the move to the other colour and updates the key."""
+        self.to_move = not self.to_move
+        self.key ^= ZOBRIST_BLACK
+
+    def compute_key(self) -> int:
+        """Calculates the Zobrist key from scratch."""
+        key = 0 if self.to_move == WHITE else ZOBRIST_BLACK
+        for right, allowed in enumerate(self.castle):
+            if allowed: key ^= ZOBRIST_CASTLE[right]
+        for sq, index in enumerate(self.mailbox):
+            if index != EMPTY: key ^= ZOBRIST_PIECES[index][sq]
+        return key
+
+    def attackers_of(self, sq: int, colour: bool) -> int:
+        """Squares of the pieces of `colour` attacking `sq`."""
+        return self.attackers[sq] & self.occupied[colour]
+
+    def attack_count(self, sq: int, colour: bool) -> int:
+        """Number of pieces of `colour` attacking `sq`."""
+        return bin(self.attackers[sq] & self.occupied[colour]).count("1")
+
+    def is_attacked(self, sq: int, colour: bool) -> bool:
+        return bool(self.attackers[sq] & self.occupied[colour])
+
+    @property
+    def occupancy(self) -> int:
+        return self.occupied[0] | self.occupied[1]
+
+    def king_square(self, colour: bool) -> int:
+        return lsb(self.boards[KING + offset(colour)])
+
+    def placement(self) -> str:
+        """placement.
+        The piece placement field of a FEN string.
+
+        :param self:
+        :rtype: str
+        """
+        symbols = [k for k in PIECE_TYPES] + [k.lower() for k in PIECE_TYPES]
+        ranks = []
+        for i in range(7, -1, -1):
+            rank = []
+            empty = 0
+            for sq in range(i << 3, (i << 3) + 8):
+                index = self.mailbox[sq]
+                if index == EMPTY:
+                    empty += 1
+                    continue
+                if empty:
+                    rank.append(str(empty))
+                    empty = 0
+                rank.append(symbols[index])
+            if empty:
+                rank.append(str(empty))
+            ranks.append("".join(rank))
+        return "/".join(ranks)
+
+
+def attacks_from(bb: Bitboards, sq: int, occ: int) -> int:
+    """attacks_from.
+    Squares attacked by the piece standing on `sq` (pawns only attack diagonally).
+
+    :param bb:
+    :type bb: Bitboards
+    :param sq:
+    :type sq: int
+    :param occ: Occupancy to use for sliding pieces
+    :type occ: int
+    :rtype: int
+    """
+    index = bb.mailbox[sq]
+    kind = index % 6
+    if kind == PAWN: return PAWN_ATTACKS[index < 6][sq]
+    elif kind == KNIGHT: return KNIGHT_ATTACKS[sq]
+    elif kind == KING: return KING_ATTACKS[sq]
+    elif kind == ROOK: return rook_attacks(sq, occ)
+    elif kind == BISHOP: return bishop_attacks(sq, occ)
+    return queen_attacks(sq, occ)
+
+
+def attackers_to(bb: Bitboards, sq: int, colour: bool, occ: int) -> int:
+    """attackers_to.
+    Squares of the pieces of `colour` which attack `sq`.
+
+    :param bb:
+    :type bb: Bitboards
+    :param sq:
+    :type sq: int
+    :param colour:
+    :type colour: bool
+    :param occ:
+    :type occ: int
+    :rtype: int
+    """
+    o = offset(colour)
+    boards = bb.boards
+    queens = boards[QUEEN + o]
+    return (
+        (KNIGHT_ATTACKS[sq] & boards[KNIGHT + o])
+        | (KING_ATTACKS[sq] & boards[KING + o])
+        # A pawn of `colour` attacks sq if a pawn of the other colour on sq would attack it
+        | (PAWN_ATTACKS[not colour][sq] & boards[PAWN + o])
+        | (rook_attacks(sq, occ) & (boards[ROOK + o] | queens))
+        | (bishop_attacks(sq, occ) & (boards[BISHOP + o] | queens))
+    )
+
+
+def attacked_squares(bb: Bitboards, colour: bool, occ: int) -> int:
+    """attacked_squares.
+    Every square attacked by `colour` given the occupancy `occ`.
+
+    :param bb:
+    :type bb: Bitboards
+    :param colour:
+    :type colour: bool
+    :param occ:
+    :type occ: int
+    :rtype: int
+    """
+    o = offset(colour)
+    boards = bb.boards
+    attacked = 0
+    for sq in bits(boards[KNIGHT + o]): attacked |= KNIGHT_ATTACKS[sq]
+    for sq in bits(boards[PAWN + o]): attacked |= PAWN_ATTACKS[colour][sq]
+    for sq in bits(boards[KING + o]): attacked |= KING_ATTACKS[sq]
+    for sq in bits(boards[ROOK + o] | boards[QUEEN + o]): attacked |= rook_attacks(sq, occ)
+    for sq in bits(boards[BISHOP + o] | boards[QUEEN + o]): attacked |= bishop_attacks(sq, occ)
+    return attacked
+
+
+def king_threats(bb: Bitboards, colour: bool) -> Tuple[int, Dict[int, int]]:
+    """king_threats.
+    Looks outward from the king of `colour` for the enemy pieces attacking it and the pieces
+    of `colour` pinned to it, in one pass over the knight and pawn offsets and the sliding rays.
+    Returns the squares of the checking pieces and a mapping of pinned square -> pin line
+    (the squares between the king and the pinning piece, plus the pinning piece itself).
+
+    :param bb:
+    :type bb: Bitboards
+    :param colour:
+    :type colour: bool
+    :rtype: Tuple[int, Dict[int, int]]
+    """
+    o = offset(not colour)
+    boards = bb.boards
+    queens = boards[QUEEN + o]
+    ksq = bb.king_square(colour)
+    own = bb.occupied[colour]
+    occ = bb.occupancy
+    # An enemy pawn attacks the king from where a pawn of ours on the king square would attack
+    checkers = (KNIGHT_ATTACKS[ksq] & boards[KNIGHT + o]) | (PAWN_ATTACKS[colour][ksq] & boards[PAWN + o])
+    pinned = {}
+    for attacks, sliders in ((rook_attacks, boards[ROOK + o] | queens), (bishop_attacks, boards[BISHOP + o] | queens)):
+        if not sliders:
+            continue
+        seen = attacks(ksq, occ)
+        checkers |= seen & sliders
+        # Pieces of ours seen from the king; removing them reveals any x-ray attackers
+        blockers = seen & own
+        if not blockers:
+            continue
+        for pinner in bits(attacks(ksq, occ ^ blockers) & sliders & ~seen):
+            line = BETWEEN[ksq][pinner]
+            pin = line & blockers
+            if pin:
+                pinned[lsb(pin)] = line | (1 << pinner)
+    return checkers, pinned
+
+
+def pseudo_targets(bb: Bitboards, sq: int, occ: int) -> int:
+    """pseudo_targets.
+    Squares the piece on `sq` may move to before checks and pins are considered.
+
+    :param bb:
+    :type bb: Bitboards
+    :param sq:
+    :type sq: int
+    :param occ:
+    :type occ: int
+    :rtype: int
+    """
+    index = bb.mailbox[sq]
+    colour = index < 6
+    if index % 6 != PAWN:
+        return attacks_from(bb, sq, occ) & ~bb.occupied[colour]
+
+    targets = PAWN_ATTACKS[colour][sq] & bb.occupied[not colour]
+    step, start_rank = (8, 1) if colour == WHITE else (-8, 6)
+    push = sq + step
+    if 0 <= push < 64 and not (occ >> push) & 1:
+        targets |= 1 << push
+        if sq >> 3 == start_rank and not (occ >> (push + step)) & 1:
+            targets |= 1 << (push + step)
+    return targets
+
+
+def castle_targets(bb: Bitboards) -> List[int]:
+    """castle_targets.
+    Destination squares of the king for each castle which is currently allowed.
+    The caller is responsible for only asking when the side to move is not in check.
+
+    :param bb:
+    :type bb: Bitboards
+    :rtype: List[int]
+    """
+    colour = bb.to_move
+    o = offset(colour)
+    occ = bb.occupancy
+    enemy = bb.occupied[not colour]
+    attackers = bb.attackers
+    targets = []
+    for right, king, rook, empty, safe, king_to, _ in CASTLES[colour]:
+        if not bb.castle[right]:
+            continue
+        if bb.mailbox[king] != KING + o or bb.mailbox[rook] != ROOK + o:
+            continue
+        if any((occ >> s) & 1 for s in empty) or any(attackers[s] & enemy for s in safe):
+            continue
+        targets.append(king_to)
+    return targets
+
+
+def legal_moves(bb: Bitboards, captures: bool = False) -> Tuple[array, int]:
+    """legal_moves.
+    Generates every legal move for the side to move as a packed array('H') of
+    from | to << 6 | flags. Returns the moves and the squares of the pieces giving check.
+
+    Castling is generated from the rights in `bb.castle`, en-passant and promotion
+    are not supported (the same as the rest of the package).
+
+    :param bb:
+    :type bb: Bitboards
+    :param captures: Only generate the captures (e.g. for a quiescence search)
+    :type captures: bool
+    :rtype: Tuple[array, int]
+    """
+    us = bb.to_move
+    them = not us
+    o = offset(us)
+    own = bb.occupied[us]
+    enemy = bb.occupied[them]
+    occ = own | enemy
+    king = bb.boards[KING + o]
+    ksq = lsb(king)
+    attackers = bb.attackers
+
+    checkers, pinned = king_threats(bb, us)
+    # Squares behind the king on a checking slider's ray are still attacked once it steps back
+    behind = 0
+    for csq in bits(checkers & bb._sliders()):
+        behind |= extend(csq, ksq)
+
+    # Squares a move may end on
+    allowed = enemy if captures else ~own
+    moves = array('H')
+    for to in bits(KING_ATTACKS[ksq] & allowed & ~behind):
+        if attackers[to] & enemy:
+            continue
+        moves.append(ksq | (to << 6) | (MOVE_CAPTURE if (enemy >> to) & 1 else 0))
+
+    if checkers & (checkers - 1):
+        # Double check, only the king can move
+        return moves, checkers
+
+    if checkers:
+        mask = BETWEEN[ksq][lsb(checkers)] | checkers
+    else:
+        mask = FULL
+        if not captures:
+            for to in castle_targets(bb):
+                moves.append(ksq | (to << 6) | MOVE_CASTLE)
+    if captures:
+        mask &= enemy
+
+    for sq in bits(own ^ king):
+        targets = pseudo_targets(bb, sq, occ) & mask
+        if sq in pinned:
+            targets &= pinned[sq]
+        for to in bits(targets):
+            moves.append(sq | (to << 6) | (MOVE_CAPTURE if (enemy >> to) & 1 else 0))
+
+    return moves, checkers
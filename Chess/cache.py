@@ -0,0 +1,168 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Rough per-entry overhead: the OrderedDict slot and link, the key and the entry tuple
+_ENTRY_OVERHEAD = 200
+
+
+class MoveCache:
+    """MoveCache
+    Bounded least-recently-used map of position hash -> legal move generation output.
+    Board stores (packed moves, checkers, win state) under its Zobrist key, so repeated
+    positions skip move generation entirely. Entries are evicted oldest-first once either
+    the entry budget or the (estimated) byte budget is exceeded.
+    """
+
+    __slots__ = ('max_entries', 'max_bytes', 'hits', 'misses', 'evictions', '_store', '_bytes')
+
+    def __init__(self, max_entries: Optional[int] = 100_000, max_bytes: Optional[int] = None) -> None:
+        """__init__.
+
+        :param self:
+        :param max_entries: Maximum number of positions to hold (None for no limit)
+        :type max_entries: Optional[int]
+        :param max_bytes: Approximate memory budget in bytes (None for no limit)
+        :type max_bytes: Optional[int]
+        :rtype: None
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._store: 'OrderedDict[int, Tuple[Any, int]]' = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._store
+
+    @staticmethod
+    def sizeof(value: Tuple) -> int:
+        """sizeof.
+        Estimates the memory held by an entry. Packed move arrays report their own buffer,
+        tuples also hold an int object per item.
+
+        :param value:
+        :type value: Tuple
+        :rtype: int
+        """
+        size = _ENTRY_OVERHEAD + sys.getsizeof(value)
+        for item in value:
+            if isinstance(item, tuple):
+                size += sys.getsizeof(item) + 28 * len(item)
+            elif isinstance(item, array):
+                size += sys.getsizeof(item)
+        return size
+
+    def get(self, key: int) -> Optional[Tuple]:
+        """get.
+        Returns the entry stored for `key` (marking it most recently used) or None.
+
+        :param self:
+        :param key:
+        :type key: int
+        :rtype: Optional[Tuple]
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._store.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: int, value: Tuple) -> None:
+        """put.
+        Stores `value` under `key` and evicts the least recently used entries until
+        the cache is back within budget.
+
+        :param self:
+        :param key:
+        :type key: int
+        :param value:
+        :type value: Tuple
+        :rtype: None
+        """
+        if key in self._store:
+            self._bytes -= self._store.pop(key)[1]
+        size = self.sizeof(value)
+        self._store[key] = (value, size)
+        self._bytes += size
+        while self._store and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, evicted) = self._store.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Empties the cache and resets the counters."""
+        self._store.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the cached entries."""
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """stats.
+        Counters for reporting, e.g. at the end of a data generation run.
+
+        :param self:
+        :rtype: Dict[str, float]
+        """
+        return {
+            "entries": len(self._store),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# The process-wide cache used by Board, disabled until `enable` is called
+_cache: Optional[MoveCache] = None
+
+
+def enable(max_entries: Optional[int] = 100_000, max_bytes: Optional[int] = None) -> MoveCache:
+    """enable.
+    Turns on the process-wide move cache used by every Board, replacing any existing one.
+
+    :param max_entries:
+    :type max_entries: Optional[int]
+    :param max_bytes:
+    :type max_bytes: Optional[int]
+    :rtype: MoveCache
+    """
+    global _cache
+    _cache = MoveCache(max_entries, max_bytes)
+    return _cache
+
+
+def disable() -> None:
+    """Turns off the process-wide move cache."""
+    global _cache
+    _cache = None
+
+
+def active() -> Optional[MoveCache]:
+    """The process-wide move cache, or None if caching is disabled."""
+    return _cache
@@ -2,12 +2,8 @@
 module, and confirm that this submission complies with the policy. The content of this file is my own original work,
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
-# Use the C++ back end for calculating psuedolegal moves (~3x faster for batch calculation)
 from typing import Iterator
 
-
-USE_CPP = True
-
 # Define the values for piece/player colours
 WHITE = True
 BLACK = False
@@ -16,6 +12,10 @@ BLACK = False
 # piece instantiation
 PIECE_TYPES = ["K", "Q", "R", "N", "B", "P"]
 
+# Flags of a packed move: from | to << 6 | flags (see Move.to_int and Chess.bitboard)
+MOVE_CAPTURE = 1 << 12
+MOVE_CASTLE = 1 << 13
+
 class BaseEnum:
     """A simple enum class implementing __slots__ for very fast item recall.
 
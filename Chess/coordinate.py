@@ -3,7 +3,7 @@ module, and confirm that this submission complies with the policy. The content o
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
 from itertools import repeat
-from typing import List, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 import math
 import Chess.constants as cons
 
@@ -84,6 +84,10 @@ class Position:
     more intuitive. Coordinates are represented internally by (0-7)(0-7) still.
     Invalid positions may be instantiated however self.is_valid can be used to check
     them.
+
+    The 64 squares of the board are interned: `Position.of(i, j)` and `Position.from_index(sq)`
+    always return the same object for a square, so comparing them is an identity check and
+    no new object is allocated.
     """
     __slots__ = ('i', 'j')
 
@@ -104,6 +108,44 @@ class Position:
         else:
             self._from_grid(pos)
 
+    @classmethod
+    def of(cls, i: int, j: int) -> 'Position':
+        """of.
+        The interned position at row i, column j. Off-board coordinates give a new
+        (invalid) position.
+
+        :param i:
+        :type i: int
+        :param j:
+        :type j: int
+        :rtype: 'Position'
+        """
+        if 0 <= i < 8 and 0 <= j < 8:
+            return _SQUARES[(i << 3) | j]
+        return cls((i, j))
+
+    @staticmethod
+    def from_index(sq: int) -> 'Position':
+        """from_index.
+        The interned position of square index `sq` (i << 3 | j, the same as __hash__).
+
+        :param sq:
+        :type sq: int
+        :rtype: 'Position'
+        """
+        return _SQUARES[sq]
+
+    @staticmethod
+    def from_algebraic(pos: _TYPE_ALG) -> 'Position':
+        """from_algebraic.
+        The interned position of a square in algebraic notation, e.g. "E4".
+
+        :param pos:
+        :type pos: str
+        :rtype: 'Position'
+        """
+        return _SQUARES[algebraic_index(pos)]
+
     def _from_algebraic(self, pos: _TYPE_ALG) -> None:
         # file 0  A   65
         #      1  B   66
@@ -139,20 +181,21 @@ class Position:
         # if isinstance(o, Position): return self.algebraic == o.algebraic
         # Optimisation for the purpose of data generation - might remove since calling__hash__ 
         # directly feels almost wrong...
-        return self.__hash__() == o.__hash__()
+        return self is o or self.__hash__() == o.__hash__()
 
     def __ne__(self, o: 'Position') -> bool:
         """Support testing equality between two instances of this class"""
+        if self is o: return False
         assert isinstance(o, Position)
         return self.algebraic != o.algebraic
     
     def __add__(self, o: Vec) -> 'Position':
         """Support addition by a vector Vec"""
-        return Position((self.i + o.i, self.j + o.j))
+        return Position.of(self.i + o.i, self.j + o.j)
 
     def __sub__(self, o: Union[Vec, 'Position']) -> 'Position':
         """Support subtraction by a vector Vec"""
-        return Position((self.i - o.i, self.j - o.j))
+        return Position.of(self.i - o.i, self.j - o.j)
 
     def path_to(self, to: 'Position') -> List['Position']:
         """path_to.
@@ -172,13 +215,13 @@ class Position:
         rj = range(self.j, to.j, sign(dj))
         # If there is a straight or diagonal path between the pieces then give that
         if len(ri) == len(rj):
-            return [Position((i, j)) for i, j in zip(ri, rj)]
+            return [Position.of(i, j) for i, j in zip(ri, rj)]
         elif len(ri) == 0:
-            return [Position((i, j)) for i, j in zip(repeat(self.i), rj)]
+            return [Position.of(i, j) for i, j in zip(repeat(self.i), rj)]
         elif len(rj) == 0:
-            return [Position((i, j)) for i, j in zip(ri, repeat(self.j))]
+            return [Position.of(i, j) for i, j in zip(ri, repeat(self.j))]
         # Else just give the original location (used for the path of knights)
-        else: return [Position((self.i, self.j))]
+        else: return [Position.of(self.i, self.j)]
 
     def __hash__(self) -> int:
         """__hash__.
@@ -200,12 +243,29 @@ class Position:
         return f"{chr(self.j + 65)}{chr(self.i + 49)}"
 
 
+def algebraic_index(pos: str) -> int:
+    """algebraic_index.
+    Square index (i << 3 | j) of a square in algebraic notation, e.g. "E4" -> 28.
+
+    :param pos:
+    :type pos: str
+    :rtype: int
+    """
+    return ((int(pos[1]) - 1) << 3) | (ord(pos[0]) - 65)
+
+# The interned positions, indexed by square
+_SQUARES = tuple(Position((sq >> 3, sq & 7)) for sq in range(64))
+
 
 class Move():
     """Move wrapper class.
     Simple class to wrap properties required to execute a move and define an API for
-    view functions to use to interact with Board and Game."""
-    __slots__ = ('__start', '__end', '__takes', '__is_castle')
+    view functions to use to interact with Board and Game.
+
+    Moves are small slotted values: they compare and hash by their fields and are not
+    changed once created. `to_int` packs a move into the 14 bit layout used by
+    Chess.bitboard and `from_int` turns one back into a Move."""
+    __slots__ = ('start', 'end', 'takes', 'is_castle')
 
     def __init__(self, 
                  start: Position, 
@@ -225,23 +285,47 @@ class Move():
         :param castle: If the move is castling (optional, default False)
         :type castle: str
         """
-        self.__start = start
-        self.__end = end
-        self.__takes = takes
-        self.__is_castle = castle
+        self.start = start
+        self.end = end
+        self.takes = takes
+        self.is_castle = castle
 
-    @property
-    def start(self) -> Position:
-        return self.__start
+    def __repr__(self) -> str:
+        return f"Move({self.start!r}, {self.end!r}, {self.takes}, {self.is_castle!r})"
 
-    @property
-    def end(self) -> Position:
-        return self.__end
+    def __eq__(self, o) -> bool:
+        return isinstance(o, Move) and (self.start == o.start and self.end == o.end
+                                        and self.takes == o.takes and self.is_castle == o.is_castle)
 
-    @property
-    def takes(self) -> bool:
-        return self.__takes
+    def __hash__(self) -> int:
+        return hash((self.start, self.end, self.takes, self.is_castle))
 
-    @property
-    def is_castle(self) -> str:
-        return self.__is_castle
+    def to_int(self) -> int:
+        """to_int.
+        Packs the move as from | to << 6 | flags.
+
+        :param self:
+        :rtype: int
+        """
+        packed = ((self.start.i << 3) | self.start.j) | ((self.end.i << 3) | self.end.j) << 6
+        if self.takes: packed |= cons.MOVE_CAPTURE
+        if self.is_castle: packed |= cons.MOVE_CASTLE
+        return packed
+
+    @classmethod
+    def from_int(cls, packed: int, squares: Sequence = None) -> 'Move':
+        """from_int.
+        Unpacks a move packed by `to_int` (or generated by Chess.bitboard).
+
+        :param packed:
+        :type packed: int
+        :param squares: Position of each square index, defaults to the interned Positions
+        :type squares: Sequence
+        :rtype: 'Move'
+        """
+        if squares is None: squares = _SQUARES
+        end = (packed >> 6) & 63
+        castle = ''
+        if packed & cons.MOVE_CASTLE:
+            castle = 'short' if end & 7 == 6 else 'long'
+        return cls(squares[packed & 63], squares[end], bool(packed & cons.MOVE_CAPTURE), castle)
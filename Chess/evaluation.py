@@ -0,0 +1,152 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+from typing import List, Sequence, Tuple
+
+# Static evaluation by material and piece-square tables, in centipawns from white's point of
+# view. Chess.bitboard.Bitboards keeps the middlegame and endgame scores and the game phase up
+# to date as pieces are placed and lifted, so reading them never looks at the board.
+#
+# The material values and tables (other than the endgame pawn table) are Tomasz Michniewski's
+# "Simplified Evaluation Function", https://www.chessprogramming.org/Simplified_Evaluation_Function
+# Tables are written as seen from white, rank 8 first, so white's value on square sq is
+# table[sq ^ 56] and black's is table[sq].
+
+# Indexed like the bitboards (K, Q, R, N, B, P)
+PIECE_VALUES = (0, 900, 500, 320, 330, 100)
+
+_KING_MIDDLEGAME = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20, 20, 0, 0, 0, 0, 20, 20,
+    20, 30, 10, 0, 0, 10, 30, 20,
+)
+_KING_ENDGAME = (
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10, 0, 0, -10, -20, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -30, 0, 0, 0, 0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+)
+_QUEEN = (
+    -20, -10, -10, -5, -5, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 5, 5, 5, 0, -10,
+    -5, 0, 5, 5, 5, 5, 0, -5,
+    0, 0, 5, 5, 5, 5, 0, -5,
+    -10, 5, 5, 5, 5, 5, 0, -10,
+    -10, 0, 5, 0, 0, 0, 0, -10,
+    -20, -10, -10, -5, -5, -10, -10, -20,
+)
+_ROOK = (
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5, 10, 10, 10, 10, 10, 10, 5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    0, 0, 0, 5, 5, 0, 0, 0,
+)
+_KNIGHT = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20, 0, 0, 0, 0, -20, -40,
+    -30, 0, 10, 15, 15, 10, 0, -30,
+    -30, 5, 15, 20, 20, 15, 5, -30,
+    -30, 0, 15, 20, 20, 15, 0, -30,
+    -30, 5, 10, 15, 15, 10, 5, -30,
+    -40, -20, 0, 5, 5, 0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+_BISHOP = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 10, 10, 5, 0, -10,
+    -10, 5, 5, 10, 10, 5, 5, -10,
+    -10, 0, 10, 10, 10, 10, 0, -10,
+    -10, 10, 10, 10, 10, 10, 10, -10,
+    -10, 5, 0, 0, 0, 0, 5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+_PAWN_MIDDLEGAME = (
+    0, 0, 0, 0, 0, 0, 0, 0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5, 5, 10, 25, 25, 10, 5, 5,
+    0, 0, 0, 20, 20, 0, 0, 0,
+    5, -5, -10, 0, 0, -10, -5, 5,
+    5, 10, 10, -20, -20, 10, 10, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+)
+# Passed and advanced pawns matter more once the pieces are off
+_PAWN_ENDGAME = (
+    0, 0, 0, 0, 0, 0, 0, 0,
+    80, 80, 80, 80, 80, 80, 80, 80,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    30, 30, 30, 30, 30, 30, 30, 30,
+    20, 20, 20, 20, 20, 20, 20, 20,
+    10, 10, 10, 10, 10, 10, 10, 10,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+)
+
+# Contribution of each piece to the game phase, 24 with every piece on the board and 0 with
+# only kings and pawns
+PHASE_WEIGHTS = (0, 4, 2, 1, 1, 0)
+TOTAL_PHASE = 24
+
+
+def _signed_tables(tables: Sequence[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
+    """Material plus position for each of the 12 bitboard indexes, negated for black."""
+    white = [tuple(value + table[sq ^ 56] for sq in range(64)) for value, table in zip(PIECE_VALUES, tables)]
+    black = [tuple(-(value + table[sq]) for sq in range(64)) for value, table in zip(PIECE_VALUES, tables)]
+    return white + black
+
+
+# MIDDLEGAME[index][sq] and ENDGAME[index][sq] are the score of bitboard piece `index` on `sq`
+MIDDLEGAME = _signed_tables((_KING_MIDDLEGAME, _QUEEN, _ROOK, _KNIGHT, _BISHOP, _PAWN_MIDDLEGAME))
+ENDGAME = _signed_tables((_KING_ENDGAME, _QUEEN, _ROOK, _KNIGHT, _BISHOP, _PAWN_ENDGAME))
+PHASE = PHASE_WEIGHTS * 2
+
+
+def taper(middlegame: int, endgame: int, phase: int) -> int:
+    """taper.
+    Blends the middlegame and endgame scores by the game phase.
+
+    :param middlegame:
+    :type middlegame: int
+    :param endgame:
+    :type endgame: int
+    :param phase: Sum of PHASE_WEIGHTS over the pieces on the board
+    :type phase: int
+    :rtype: int
+    """
+    phase = min(phase, TOTAL_PHASE)
+    return (middlegame * phase + endgame * (TOTAL_PHASE - phase)) // TOTAL_PHASE
+
+
+def evaluate(mailbox: Sequence[int]) -> Tuple[int, int, int]:
+    """evaluate.
+    Computes the middlegame score, endgame score and phase from scratch. Bitboards keeps the
+    same three values incrementally, this is for building them and checking them.
+
+    :param mailbox: Bitboard index of the piece on each square, negative for empty squares
+    :type mailbox: Sequence[int]
+    :rtype: Tuple[int, int, int]
+    """
+    middlegame = endgame = phase = 0
+    for sq, index in enumerate(mailbox):
+        if index < 0:
+            continue
+        middlegame += MIDDLEGAME[index][sq]
+        endgame += ENDGAME[index][sq]
+        phase += PHASE[index]
+    return middlegame, endgame, phase
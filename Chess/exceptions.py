@@ -7,3 +7,6 @@ class InvalidPiece(ValueError):
 
 class MoveParseError(ValueError):
     pass
+
+class BackendUnavailable(ImportError):
+    pass
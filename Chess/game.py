@@ -3,19 +3,20 @@ module, and confirm that this submission complies with the policy. The content o
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
 import re
-from typing import Callable, Optional, Union
-from Chess.state import Board
-from Chess.coordinate import Move
-from Chess.exceptions import MoveParseError
+from typing import Callable, Iterable, Optional, Union
+from Chess import bitboard
+from Chess.constants import PIECE_TYPES, WHITE
+from Chess.magic import bishop_attacks, queen_attacks, rook_attacks
+from Chess.state import Board, SQUARES
+from Chess.tables import KING_ATTACKS, KNIGHT_ATTACKS, PAWN_ATTACKS
+from Chess.coordinate import Move, algebraic_index
 import logging, logging.handlers
 
-try: 
-    from libpychess import Position
-except ImportError: 
-    from Chess.coordinate import Position
-
 log = logging.getLogger("Game")
 
+# Matches standard notation moves: piece, start file/square, capture, destination or castles
+MOVE_PATTERN = r'([KQRNB])?([a-h]\d?)?(x)?([a-z]\d)|(O-O)(-O)?'
+
 class Game():
     """Game
     Wrapper for Board which tracks the changes applied to state over time and implements a very
@@ -29,7 +30,7 @@ class Game():
         self.__view_callback = view_callback
 
         if start_state: board = start_state
-        else: board = Board()
+        else: board = Board(lazy=True)
 
         self.__state = board
         self.move_hist = [];
@@ -83,8 +84,8 @@ class Game():
             end_j = 6
             castles = 'short'
 
-        start = Position((start_i, start_j))
-        end = Position((end_i, end_j))
+        start = SQUARES[(start_i << 3) | start_j]
+        end = SQUARES[(end_i << 3) | end_j]
         takes = False
 
         return Move(start, end, takes, castles)
@@ -99,8 +100,7 @@ class Game():
         :type move_str: str
         :rtype: Move
         """
-        pattern = r'([KQRNB])?([a-h]\d?)?(x)?([a-z]\d)|(O-O)(-O)?'
-        matches = re.findall(pattern, move_str)
+        matches = re.findall(MOVE_PATTERN, move_str)
 
         if not matches:
             log.error(f"Failed to parse {move_str}: no regex match on this string")
@@ -121,14 +121,14 @@ class Game():
             log.error(f"Failed to parse {move_str}: no destination square provided")
             log.debug(f"Failed at state: {self.peek.to_fen()}")
             return None
-        end = Position(move_repr[3].upper())
+        end = SQUARES[algebraic_index(move_repr[3].upper())]
 
         if end in self.peek.loc_map:
             takes = True
 
         start = move_repr[1]
         if len(start) == 2:
-            start = Position(start.upper())
+            start = SQUARES[algebraic_index(start.upper())]
         else:
             piece = move_repr[0]
             if not piece: piece = "P"
@@ -155,6 +155,118 @@ class Game():
 
         return Move(start, end, takes)
 
+    def __resolve_trusted(self, move_str: str) -> Optional[Move]:
+        """__resolve_trusted.
+        Resolve a move in standard chess notation which is already known to be legal.
+        Rather than filtering the full legal ResultSet, the pieces of the right kind which can
+        reach the destination are found directly from the bitboards, and pins are only checked
+        if more than one piece could make the move.
+
+        :param self:
+        :param move_str:
+        :type move_str: str
+        :rtype: Optional[Move]
+        """
+        matches = re.findall(MOVE_PATTERN, move_str)
+        if not matches:
+            log.error(f"Failed to parse {move_str}: no regex match on this string")
+            return None
+        move_repr = matches.pop()
+
+        bb = self.peek._bb
+        us = bb.to_move
+        if move_repr[4]:
+            move = self.__parse_castle('long' if move_repr[5] else 'short')
+            rook = (move.start.i << 3) | (0 if move_repr[5] else 7)
+            if bb.mailbox[rook] != bitboard.ROOK + bitboard.offset(us):
+                return None
+            return move
+
+        if not move_repr[3]:
+            return None
+        end = algebraic_index(move_repr[3].upper())
+        end_pos = SQUARES[end]
+        takes = bool((bb.occupied[not us] >> end) & 1)
+
+        hint = move_repr[1]
+        if len(hint) == 2:
+            return Move(SQUARES[algebraic_index(hint.upper())], end_pos, takes)
+
+        kind = PIECE_TYPES.index(move_repr[0] or "P")
+        pieces = bb.boards[kind + bitboard.offset(us)]
+        occ = bb.occupancy
+        if kind == bitboard.KNIGHT: candidates = KNIGHT_ATTACKS[end] & pieces
+        elif kind == bitboard.KING: candidates = KING_ATTACKS[end] & pieces
+        elif kind == bitboard.ROOK: candidates = rook_attacks(end, occ) & pieces
+        elif kind == bitboard.BISHOP: candidates = bishop_attacks(end, occ) & pieces
+        elif kind == bitboard.QUEEN: candidates = queen_attacks(end, occ) & pieces
+        elif takes:
+            # A pawn of ours captures onto `end` from where an enemy pawn on `end` would attack
+            candidates = PAWN_ATTACKS[not us][end] & pieces
+        else:
+            step = -8 if us == WHITE else 8
+            behind = end + step
+            candidates = 0
+            if 0 <= behind < 64:
+                candidates = (1 << behind) & pieces
+                double_rank = 3 if us == WHITE else 4
+                if not candidates and end >> 3 == double_rank and not (occ >> behind) & 1:
+                    candidates = (1 << (behind + step)) & pieces
+
+        if hint:
+            file_mask = 0x0101010101010101 << (ord(hint) - ord("a"))
+            candidates &= file_mask
+
+        if candidates & (candidates - 1):
+            # Ambiguous, drop pieces which are pinned off the line to the destination
+            for pinned, line in bitboard.king_threats(bb, us)[1].items():
+                if (candidates >> pinned) & 1 and not (line >> end) & 1:
+                    candidates ^= 1 << pinned
+
+        if not candidates or candidates & (candidates - 1):
+            log.warning(f"Failed to resolve {move_str}: {bin(candidates).count('1')} candidate pieces found.")
+            return None
+        return Move(SQUARES[bitboard.lsb(candidates)], end_pos, takes)
+
+    def replay(self, moves: Iterable[str], verify: bool = False) -> Union[Board, int]:
+        """replay.
+        Apply a sequence of moves in standard chess notation, such as a game read from a PGN file.
+        By default the moves are trusted to be legal and resolved without generating the legal
+        moves of each position (use a lazy Board to skip that work entirely). With verify=True
+        each move is checked against the full set of legal moves, as `execute_move_str` does.
+
+        Returns the final board, or the index of the first move which could not be applied.
+
+        :param self:
+        :param moves:
+        :type moves: Iterable[str]
+        :param verify:
+        :type verify: bool
+        :rtype: Union[Board, int]
+        """
+        for ply, move_str in enumerate(moves):
+            if verify:
+                applied = self.execute_move_str(move_str)
+            else:
+                self.move_hist.append(move_str)
+                move = self.__resolve_trusted(move_str)
+                applied = bool(move) and self.peek.move(move)
+            if not applied:
+                return ply
+        return self.peek
+
+    def parse_move(self, move_str: str) -> Optional[Move]:
+        """parse_move.
+        Resolve a move given in standard chess notation against the current state without
+        executing it.
+
+        :param self:
+        :param move_str:
+        :type move_str: str
+        :rtype: Optional[Move]
+        """
+        return self.__parse_move(move_str)
+
     @property
     def peek(self) -> Board:
         """peek.
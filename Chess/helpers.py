@@ -4,55 +4,57 @@ with any significant material copied or adapted from other sources clearly indic
 
 import re
 from typing import List
-from Chess.coordinate import Move
+from Chess.coordinate import Move, Position, algebraic_index
 from Chess.pieces import King, Queen, Rook, Knight, Bishop, Pawn
 from Chess.constants import PIECE_TYPES, WHITE, BLACK
 
-try:
-    from libpychess import Position
-except ImportError:
-    from Chess.coordinate import Position
+# The interned Position of every square, indexed (i << 3) | j
+SQUARES = tuple(Position.from_index(sq) for sq in range(64))
+
+def square(i: int, j: int):
+    """The shared Position of row i, column j (see SQUARES)."""
+    return SQUARES[(i << 3) | j]
 
 def new_game():
     """new_game.
     Returns the pieces of a starting position. Probably not required since the implementation of
     construct_board."""
     white_pieces = [
-        Rook(colour=WHITE, position=Position((0,0))),
-        Knight(colour=WHITE, position=Position((0,1))),
-        Bishop(colour=WHITE, position=Position((0,2))),
-        Queen(colour=WHITE, position=Position((0,3))),
-        King(colour=WHITE, position=Position((0,4))),
-        Bishop(colour=WHITE, position=Position((0,5))),
-        Knight(colour=WHITE, position=Position((0,6))),
-        Rook(colour=WHITE, position=Position((0,7))),
-        Pawn(colour=WHITE, position=Position((1,0))),
-        Pawn(colour=WHITE, position=Position((1,1))),
-        Pawn(colour=WHITE, position=Position((1,2))),
-        Pawn(colour=WHITE, position=Position((1,3))),
-        Pawn(colour=WHITE, position=Position((1,4))),
-        Pawn(colour=WHITE, position=Position((1,5))),
-        Pawn(colour=WHITE, position=Position((1,6))),
-        Pawn(colour=WHITE, position=Position((1,7))),
+        Rook(colour=WHITE, position=square(0, 0)),
+        Knight(colour=WHITE, position=square(0, 1)),
+        Bishop(colour=WHITE, position=square(0, 2)),
+        Queen(colour=WHITE, position=square(0, 3)),
+        King(colour=WHITE, position=square(0, 4)),
+        Bishop(colour=WHITE, position=square(0, 5)),
+        Knight(colour=WHITE, position=square(0, 6)),
+        Rook(colour=WHITE, position=square(0, 7)),
+        Pawn(colour=WHITE, position=square(1, 0)),
+        Pawn(colour=WHITE, position=square(1, 1)),
+        Pawn(colour=WHITE, position=square(1, 2)),
+        Pawn(colour=WHITE, position=square(1, 3)),
+        Pawn(colour=WHITE, position=square(1, 4)),
+        Pawn(colour=WHITE, position=square(1, 5)),
+        Pawn(colour=WHITE, position=square(1, 6)),
+        Pawn(colour=WHITE, position=square(1, 7)),
     ]
 
     black_pieces = [
-        Rook(colour=BLACK, position=Position((7,0))),
-        Knight(colour=BLACK, position=Position((7,1))),
-        Bishop(colour=BLACK, position=Position((7,2))),
-        Queen(colour=BLACK, position=Position((7,3))),
-        King(colour=BLACK, position=Position((7,4))),
-        Bishop(colour=BLACK, position=Position((7,5))),
-        Knight(colour=BLACK, position=Position((7,6))),
-        Rook(colour=BLACK, position=Position((7,7))),
-        Pawn(colour=BLACK, position=Position((6,0))),
-        Pawn(colour=BLACK, position=Position((6,1))),
-        Pawn(colour=BLACK, position=Position((6,2))),
-        Pawn(colour=BLACK, position=Position((6,3))),
-        Pawn(colour=BLACK, position=Position((6,4))),
-        Pawn(colour=BLACK, position=Position((6,5))),
-        Pawn(colour=BLACK, position=Position((6,6))),
-        Pawn(colour=BLACK, position=Position((6,7))),
+        Rook(colour=BLACK, position=square(7, 0)),
+        Knight(colour=BLACK, position=square(7, 1)),
+        Bishop(colour=BLACK, position=square(7, 2)),
+        Queen(colour=BLACK, position=square(7, 3)),
+        King(colour=BLACK, position=square(7, 4)),
+        Bishop(colour=BLACK, position=square(7, 5)),
+        Knight(colour=BLACK, position=square(7, 6)),
+        Rook(colour=BLACK, position=square(7, 7)),
+        Pawn(colour=BLACK, position=square(6, 0)),
+        Pawn(colour=BLACK, position=square(6, 1)),
+        Pawn(colour=BLACK, position=square(6, 2)),
+        Pawn(colour=BLACK, position=square(6, 3)),
+        Pawn(colour=BLACK, position=square(6, 4)),
+        Pawn(colour=BLACK, position=square(6, 5)),
+        Pawn(colour=BLACK, position=square(6, 6)),
+        Pawn(colour=BLACK, position=square(6, 7)),
     ]
 
     return (white_pieces, black_pieces)
@@ -67,7 +69,7 @@ def create_piece(kind, colour, index):
     :param index: Position of the piece 
     :type index: (int, int) | str
     """
-    position = Position(index)
+    position = SQUARES[algebraic_index(index)] if isinstance(index, str) else square(*index)
     if kind == "K":
         return King(colour=colour, position=position)
     elif kind == "Q":
@@ -150,7 +152,7 @@ def parse_match(move_repr: List[str]):
     start = move_repr[1]
     if len(start) == 2:
         ## ALG_POS
-        start = Position(start.upper())
+        start = SQUARES[algebraic_index(start.upper())]
 
     if move_repr[2] == '':
         takes = False
@@ -159,7 +161,7 @@ def parse_match(move_repr: List[str]):
 
     if move_repr[3] == '': raise ValueError("No destination supplied")
     ## ALG_POS
-    end = Position(move_repr[3].upper())
+    end = SQUARES[algebraic_index(move_repr[3].upper())]
 
     return (start, end, piece, takes)
 
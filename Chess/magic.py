@@ -0,0 +1,48 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+from typing import List, Tuple
+from Chess.magics import BISHOP_MAGICS, ROOK_MAGICS
+from Chess.tables import BISHOP_DIRS, BISHOP_MASKS, ROOK_DIRS, ROOK_MASKS, slide, subsets
+
+# Magic bitboard lookups for sliding pieces. The occupancy of the squares which can block a
+# slider (its relevant mask) is multiplied by a per-square magic number so the top bits form a
+# collision-free index into a table of precomputed attack sets. The multipliers are generated
+# offline by generate_magics.py and stored in Chess.magics.
+
+FULL = 0xFFFFFFFFFFFFFFFF
+
+
+def _build(masks: List[int], magics: List[int], dirs) -> Tuple[List[int], List[List[int]]]:
+    """Returns the shift and the attack table of every square."""
+    shifts = []
+    tables = []
+    for sq in range(64):
+        shift = 64 - bin(masks[sq]).count("1")
+        table = [0] * (1 << (64 - shift))
+        for occ in subsets(masks[sq]):
+            table[((occ * magics[sq]) & FULL) >> shift] = slide(sq, occ, dirs)
+        shifts.append(shift)
+        tables.append(table)
+    return shifts, tables
+
+
+ROOK_SHIFTS, ROOK_TABLES = _build(ROOK_MASKS, ROOK_MAGICS, ROOK_DIRS)
+BISHOP_SHIFTS, BISHOP_TABLES = _build(BISHOP_MASKS, BISHOP_MAGICS, BISHOP_DIRS)
+
+
+def rook_attacks(sq: int, occ: int) -> int:
+    """Squares attacked by a rook on `sq` given the board occupancy `occ`."""
+    return ROOK_TABLES[sq][((occ & ROOK_MASKS[sq]) * ROOK_MAGICS[sq] & FULL) >> ROOK_SHIFTS[sq]]
+
+
+def bishop_attacks(sq: int, occ: int) -> int:
+    """Squares attacked by a bishop on `sq` given the board occupancy `occ`."""
+    return BISHOP_TABLES[sq][((occ & BISHOP_MASKS[sq]) * BISHOP_MAGICS[sq] & FULL) >> BISHOP_SHIFTS[sq]]
+
+
+def queen_attacks(sq: int, occ: int) -> int:
+    """Squares attacked by a queen on `sq` given the board occupancy `occ`."""
+    return (ROOK_TABLES[sq][((occ & ROOK_MASKS[sq]) * ROOK_MAGICS[sq] & FULL) >> ROOK_SHIFTS[sq]]
+            | BISHOP_TABLES[sq][((occ & BISHOP_MASKS[sq]) * BISHOP_MAGICS[sq] & FULL) >> BISHOP_SHIFTS[sq]])
@@ -0,0 +1,39 @@
+"""Magic multipliers for Chess.magic, generated by generate_magics.py. Do not edit by hand."""
+
+ROOK_MAGICS = [
+    0x0280024002208010, 0x00C000401000A000, 0x4080100020000884, 0x0480040800801000,
+    0x1480040002800800, 0x2200100108040200, 0x1080420001000080, 0x3480002040801100,
+    0x0000802080004000, 0x0002401000402008, 0x0400802000100080, 0x8002004200082011,
+    0x8082002008100600, 0x0000800400020080, 0x4817000482002100, 0x8010800100004080,
+    0x0000808000400020, 0x101000401040200A, 0x0240820010220040, 0x8820210010050008,
+    0x0054008008000480, 0x0404008002000480, 0x6D10040010080201, 0x0000060004014089,
+    0x0200800100204100, 0x4882002200408105, 0x80C0200080100080, 0x1000100080080080,
+    0x40C0040080080080, 0x0040040080020080, 0x0000010400484230, 0x0800886A00040081,
+    0x2810400020800880, 0x05A0400080802000, 0x201A021182004120, 0x00C0800800801000,
+    0x0001001005000800, 0x0020800400800200, 0x4000800100800200, 0x005500084100008A,
+    0x0000208040008014, 0x09A0002040008080, 0xC080208042020010, 0x8002004020120008,
+    0x2008080004008080, 0x440A000804020010, 0x2009910210240008, 0x8008141040820001,
+    0x0880804200211200, 0x0080802000400280, 0x0000102000410100, 0x5010000A22110100,
+    0x0810080080040080, 0x090C008002000480, 0x0200800200010080, 0x4000404100840200,
+    0x0805004820108001, 0x0802002040810012, 0x0040C1009020006D, 0x0020201000050109,
+    0x00420004A0089082, 0x4003001A04002805, 0x00601208100110C4, 0x8410008401004022,
+]
+
+BISHOP_MAGICS = [
+    0x00C0410401004900, 0x0008102400404042, 0x40100400A8208080, 0x40B4124200803121,
+    0x0401104040014828, 0x14808804C0004200, 0x0004044C44040400, 0x0100840411040200,
+    0x1411060410020200, 0x5000880144009A01, 0x0000100102282410, 0x002202208200048C,
+    0x0064211040000000, 0x0005010108408000, 0x8878004110082004, 0x0A029202308A1800,
+    0x00106908A0010400, 0x920804A002044042, 0x4001081204010204, 0x4008202444010000,
+    0x0202000420210002, 0x0546801508094000, 0x0401000C84412048, 0x9000240044024800,
+    0x1204200004200408, 0x0010024104680200, 0x0010900008102020, 0x0200404104010200,
+    0xC002040002008200, 0x00100C804100A080, 0x0008024449013840, 0x2801010140404810,
+    0x0102104200102200, 0x48031CA210101004, 0x0002080100420200, 0x108AA00800110104,
+    0x0C04040400001010, 0x1800880200011101, 0x00092211A1040408, 0x0004040282305042,
+    0x0002101009010601, 0x8060480C340A9110, 0x108A010402000101, 0x00C0018401200C00,
+    0x800020220C806400, 0x0048200802100020, 0x0008022404408414, 0x018404508C220603,
+    0x0021280802080080, 0x060A120612022000, 0x6402004404040000, 0x0000001084044028,
+    0x0120004012820409, 0x0202040810410000, 0x1045300411040980, 0x040802008216006C,
+    0x0901002A10020884, 0x288000C216942002, 0x4240000A01008820, 0x0082009000840440,
+    0x5084099010220221, 0x00C0000430120210, 0x1020054830014200, 0x0222109001004880,
+]
@@ -0,0 +1,263 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import argparse
+import sys
+import time
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+from Chess import backends, bitboard
+from Chess.bitboard import Bitboards
+from Chess.cache import MoveCache
+from Chess.constants import ResultKeys
+from Chess.coordinate import Move
+from Chess.pieces import King
+from Chess.state import Board, construct_board
+
+# Perft (performance test) counts the leaf nodes of the legal move tree to a fixed depth,
+# which checks move generation against well known totals and measures its speed.
+# Run with `python3 -m Chess.perft [FEN] -d DEPTH [--divide]` or `python3 -m Chess.perft --suite`.
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Well known positions and their leaf counts. Only depths whose trees contain no en-passant
+# or promotion are listed, since neither is implemented.
+SUITE: List[Tuple[str, str, Dict[int, int]]] = [
+    ("start", START_FEN, {1: 20, 2: 400, 3: 8902, 4: 197281}),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", {1: 48}),
+    ("position 6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     {1: 46, 2: 2079, 3: 89890}),
+]
+
+
+def square_name(sq: int) -> str:
+    """Algebraic name of a square index, e.g. 12 -> 'e2'."""
+    return "abcdefgh"[sq & 7] + str((sq >> 3) + 1)
+
+
+def perft_bitboards(bb: Bitboards, depth: int, table: Optional[MoveCache] = None) -> int:
+    """perft_bitboards.
+    Counts the leaf nodes `depth` plies below the position using the bitboard engine directly.
+    Moves are applied and taken back with `Bitboards.make` and `Bitboards.unmake`.
+
+    :param bb:
+    :type bb: Bitboards
+    :param depth:
+    :type depth: int
+    :param table: Cache of subtree counts keyed by Zobrist key and depth
+    :type table: Optional[MoveCache]
+    :rtype: int
+    """
+    moves, _ = bitboard.legal_moves(bb)
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+
+    if table is not None:
+        key = (bb.key << 4) | depth
+        entry = table.get(key)
+        if entry is not None:
+            return entry[0]
+
+    nodes = 0
+    for mov in moves:
+        undo = bb.make(mov)
+        nodes += perft_bitboards(bb, depth - 1, table)
+        bb.unmake(mov, undo)
+
+    if table is not None:
+        table.put(key, (nodes,))
+    return nodes
+
+
+def board_moves(board: Board) -> List[Move]:
+    """board_moves.
+    Flattens the legal ResultSet of a board into `Move` objects.
+
+    :param board:
+    :type board: Board
+    :rtype: List[Move]
+    """
+    moves = []
+    for piece, result in board.moves.items():
+        start = board.piece_map[piece]
+        for end in result[ResultKeys.capture]:
+            moves.append(Move(start, end, True))
+        for end in result[ResultKeys.passive]:
+            castle = ""
+            if isinstance(piece, King) and abs(end.j - start.j) == 2:
+                castle = "short" if end.j == 6 else "long"
+            moves.append(Move(start, end, False, castle))
+    return moves
+
+
+def perft_board(board: Board, depth: int, table: Optional[MoveCache] = None) -> int:
+    """perft_board.
+    Counts the leaf nodes `depth` plies below the position through the `Board` api,
+    so it measures whichever move generator Board is configured with.
+
+    :param board: Ideally a lazy board, so positions are only evaluated when needed
+    :type board: Board
+    :param depth:
+    :type depth: int
+    :param table:
+    :type table: Optional[MoveCache]
+    :rtype: int
+    """
+    if depth <= 1:
+        return len(board_moves(board)) if depth == 1 else 1
+
+    if table is not None:
+        key = (board.zobrist << 4) | depth
+        entry = table.get(key)
+        if entry is not None:
+            return entry[0]
+
+    nodes = 0
+    for mov in board_moves(board):
+        board.push(mov)
+        nodes += perft_board(board, depth - 1, table)
+        board.pop()
+
+    if table is not None:
+        table.put(key, (nodes,))
+    return nodes
+
+
+def divide_bitboards(fen: str, depth: int, table: Optional[MoveCache] = None) -> Dict[str, int]:
+    bb = construct_board(fen)._bb
+    counts = {}
+    for mov in bitboard.legal_moves(bb)[0]:
+        undo = bb.make(mov)
+        counts[square_name(mov & 63) + square_name((mov >> 6) & 63)] = perft_bitboards(bb, depth - 1, table)
+        bb.unmake(mov, undo)
+    return counts
+
+
+def divide_board(fen: str, depth: int, table: Optional[MoveCache] = None, backend: Optional[str] = None) -> Dict[str, int]:
+    board = construct_board(fen, lazy=True, backend=backend)
+    counts = {}
+    for mov in board_moves(board):
+        board.push(mov)
+        counts[str(mov.start).lower() + str(mov.end).lower()] = perft_board(board, depth - 1, table)
+        board.pop()
+    return counts
+
+
+# Backend name -> function returning the per root move counts of a FEN to a depth. "board" uses
+# whichever Chess.backends backend Board picks by default (see PYCHESS_BACKEND), the others
+# after it go through Board with that move generation backend.
+BACKENDS: Dict[str, Callable[[str, int, Optional[MoveCache]], Dict[str, int]]] = {
+    "bitboard": divide_bitboards,
+    "board": divide_board,
+    "python": partial(divide_board, backend="python"),
+    "cpp": partial(divide_board, backend="cpp"),
+}
+
+
+def available(backend: str) -> bool:
+    """Whether a perft backend can run in this process (cpp needs libpychess)."""
+    if backend in ("bitboard", "board"):
+        return True
+    return backend in backends.available()
+
+
+def describe(backend: str) -> str:
+    """describe.
+    Name of the move generator a perft backend actually runs, e.g. 'board (python)'.
+
+    :param backend: Key of BACKENDS
+    :type backend: str
+    :rtype: str
+    """
+    if backend == "bitboard":
+        return backend
+    return f"board ({backends.get(None if backend == 'board' else backend).name})"
+
+
+def perft(fen: str, depth: int, backend: str = "bitboard", hash_entries: int = 0) -> Tuple[Dict[str, int], float]:
+    """perft.
+    Runs a perft to `depth` (at least 1) and returns the counts for each root move
+    and the time taken in seconds.
+
+    :param fen:
+    :type fen: str
+    :param depth:
+    :type depth: int
+    :param backend: Key of BACKENDS
+    :type backend: str
+    :param hash_entries: Size of the subtree count cache, 0 to disable it
+    :type hash_entries: int
+    :rtype: Tuple[Dict[str, int], float]
+    """
+    table = MoveCache(max_entries=hash_entries) if hash_entries else None
+    start = time.perf_counter()
+    counts = BACKENDS[backend](fen, depth, table)
+    return counts, time.perf_counter() - start
+
+
+def run_suite(backend: str, hash_entries: int = 0, max_nodes: Optional[int] = None) -> bool:
+    """run_suite.
+    Runs every position in SUITE, printing the leaf counts and nodes/second.
+    Returns True if every count matched, or if the backend is not available here.
+
+    :param backend:
+    :type backend: str
+    :param hash_entries:
+    :type hash_entries: int
+    :param max_nodes: Skip depths with more leaves than this
+    :type max_nodes: Optional[int]
+    :rtype: bool
+    """
+    if not available(backend):
+        print(f"{backend}: skipped, the backend is not available")
+        return True
+    label = describe(backend)
+    passed = True
+    total_nodes = 0
+    total_time = 0.0
+    for name, fen, expected in SUITE:
+        for depth, count in sorted(expected.items()):
+            if max_nodes is not None and count > max_nodes:
+                continue
+            counts, elapsed = perft(fen, depth, backend, hash_entries)
+            nodes = sum(counts.values())
+            ok = nodes == count
+            passed &= ok
+            total_nodes += nodes
+            total_time += elapsed
+            print(f"{'ok  ' if ok else 'FAIL'} {label:<16} {name:<12} depth {depth}: {nodes:>9} "
+                  f"(expected {count}) {nodes / elapsed:>10.0f} nodes/s")
+    if total_time:
+        print(f"{label}: {total_nodes} nodes in {total_time:.2f}s, {total_nodes / total_time:.0f} nodes/s")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count the leaf nodes of the legal move tree")
+    parser.add_argument("fen", nargs="?", default=START_FEN)
+    parser.add_argument("-d", "--depth", type=int, default=3)
+    parser.add_argument("--divide", action="store_true", help="print the count below each root move")
+    parser.add_argument("--hash", type=int, default=0, help="entries in the subtree count cache (0 disables it)")
+    parser.add_argument("--backend", choices=list(BACKENDS) + ["all"], default="bitboard",
+                        help="'board' uses Board with its default backend (PYCHESS_BACKEND), 'python' and 'cpp' "
+                             "use Board with that backend, 'all' runs each one available")
+    parser.add_argument("--suite", action="store_true", help="run the bundled positions instead of FEN")
+    parser.add_argument("--max-nodes", type=int, default=None, help="skip suite entries larger than this")
+    args = parser.parse_args()
+
+    selected = list(BACKENDS) if args.backend == "all" else [args.backend]
+    if args.suite:
+        passed = [run_suite(backend, args.hash, args.max_nodes) for backend in selected]
+        sys.exit(0 if all(passed) else 1)
+
+    for backend in selected:
+        if not available(backend):
+            print(f"{backend}: skipped, the backend is not available")
+            continue
+        counts, elapsed = perft(args.fen, max(args.depth, 1), backend, args.hash)
+        if args.divide:
+            for move, count in sorted(counts.items()):
+                print(f"{move}: {count}")
+        nodes = sum(counts.values())
+        print(f"{describe(backend)} depth {args.depth}: {nodes} nodes in {elapsed:.3f}s ({nodes / elapsed:.0f} nodes/s)")
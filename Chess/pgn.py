@@ -0,0 +1,164 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import argparse
+import mmap
+import re
+import time
+from typing import Dict, Iterator, List, Tuple
+
+# Streaming reader for PGN files. The file is memory mapped and read a line at a time, so
+# only the game being parsed is ever held in memory, whatever the size of the file.
+
+Game = Tuple[Dict[str, str], List[str]]
+
+# [Tag "Value"], with backslash escapes inside the value
+_HEADER = re.compile(rb'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_ESCAPE = re.compile(r'\\(.)')
+
+# Movetext is reduced to the moves of the main line by removing, in order: comments ({...} and
+# ; to the end of the line, which include clock annotations such as { [%clk 0:03:00] }),
+# variations (innermost first, as they may be nested) and annotation glyphs (e4!, Nf3?!).
+# Every move starts with a file or piece letter, which no move number, NAG or result does.
+_COMMENTS = re.compile(rb"\{[^}]*\}?|;[^\n]*")
+_VARIATION = re.compile(rb"\([^()]*\)")
+_GLYPHS = re.compile(rb"[!?]+")
+_MOVE = re.compile(r"[a-hKQRNBO][^\s$()]*")
+
+_COMMENT_MARKS = re.compile(rb"[{};]")
+
+
+def movetext_tokens(movetext: bytes) -> List[str]:
+    """movetext_tokens.
+    Extracts the moves of the main line from PGN movetext, skipping comments, NAGs,
+    variations (which may be nested), move numbers and the result.
+
+    :param movetext:
+    :type movetext: bytes
+    :rtype: List[str]
+    """
+    text = _COMMENTS.sub(b" ", movetext)
+    while b"(" in text:
+        text, removed = _VARIATION.subn(b" ", text)
+        if not removed:
+            # A variation which is never closed runs to the end of the game
+            text = text[:text.index(b"(")]
+    text = _GLYPHS.sub(b"", text)
+    return _MOVE.findall(text.decode("ascii", "replace"))
+
+
+class PGNReader:
+    """PGNReader
+    Iterates over the games of a PGN file as (headers, SAN moves) pairs. Counts the games and
+    bytes read and the time spent, to report throughput once (or while) iterating.
+    """
+
+    __slots__ = ('path', 'games', 'bytes_read', 'seconds')
+
+    def __init__(self, path: str) -> None:
+        """__init__.
+
+        :param self:
+        :param path: PGN file to read
+        :type path: str
+        :rtype: None
+        """
+        self.path = path
+        self.games = 0
+        self.bytes_read = 0
+        self.seconds = 0.0
+
+    def __iter__(self) -> Iterator[Game]:
+        with open(self.path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            with mm:
+                yield from self.__games(mm)
+
+    def __games(self, mm: mmap.mmap) -> Iterator[Game]:
+        start = time.perf_counter()
+        headers: Dict[str, str] = {}
+        movetext: List[bytes] = []
+        # Unclosed { comments carry on over line breaks, and may hold lines starting with [
+        open_comment = False
+        for line in iter(mm.readline, b""):
+            stripped = line.strip()
+            if not open_comment and stripped.startswith(b"["):
+                header = _HEADER.match(stripped)
+                if header:
+                    if movetext:
+                        # A tag after movetext starts the next game
+                        self.seconds += time.perf_counter() - start
+                        yield self.__finish(headers, movetext, mm)
+                        start = time.perf_counter()
+                        headers, movetext = {}, []
+                    tag, value = header.groups()
+                    value = value.decode("utf-8", "replace")
+                    if "\\" in value:
+                        value = _ESCAPE.sub(r"\1", value)
+                    headers[tag.decode("ascii")] = value
+                    continue
+            if stripped.startswith(b"%") and not open_comment:
+                # Escaped line, for use by other programs
+                continue
+            if stripped:
+                movetext.append(stripped)
+                open_comment = _still_open(stripped, open_comment)
+        if headers or movetext:
+            self.seconds += time.perf_counter() - start
+            yield self.__finish(headers, movetext, mm)
+            return
+        self.seconds += time.perf_counter() - start
+
+    def __finish(self, headers: Dict[str, str], movetext: List[bytes], mm: mmap.mmap) -> Game:
+        start = time.perf_counter()
+        moves = movetext_tokens(b"\n".join(movetext))
+        self.games += 1
+        self.bytes_read = mm.tell()
+        self.seconds += time.perf_counter() - start
+        return headers, moves
+
+    @property
+    def mb_per_second(self) -> float:
+        """Megabytes of PGN parsed per second of time spent in the reader."""
+        return self.bytes_read / 1e6 / self.seconds if self.seconds else 0.0
+
+
+def _still_open(line: bytes, open_comment: bool) -> bool:
+    """Whether a { comment is still open at the end of `line`."""
+    if b";" not in line:
+        # Comments do not nest, so only the last brace on the line matters
+        opened, closed = line.rfind(b"{"), line.rfind(b"}")
+        return opened > closed or (closed < 0 and open_comment)
+    for char in _COMMENT_MARKS.findall(line):
+        if open_comment:
+            if char == b"}": open_comment = False
+        elif char == b"{": open_comment = True
+        else: break  # the rest of the line is a ; comment
+    return open_comment
+
+
+def read_games(path: str) -> Iterator[Game]:
+    """read_games.
+    Yields (headers, SAN moves) for every game of a PGN file in constant memory.
+
+    :param path:
+    :type path: str
+    :rtype: Iterator[Game]
+    """
+    return iter(PGNReader(path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read a PGN file and report the throughput")
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    reader = PGNReader(args.path)
+    moves = sum(len(tokens) for _, tokens in reader)
+    print(f"{reader.games} games, {moves} moves, {reader.bytes_read / 1e6:.1f} MB in {reader.seconds:.2f} s "
+          f"({reader.mb_per_second:.1f} MB/s)")
@@ -2,22 +2,39 @@
 module, and confirm that this submission complies with the policy. The content of this file is my own original work,
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
-from typing import List
-from Chess.constants import PIECE_TYPES, WHITE, BLACK, USE_CPP
+from itertools import count
+from typing import Tuple
+from Chess.constants import PIECE_TYPES, WHITE, BLACK
 from Chess.coordinate import Vec
 from Chess.exceptions import InvalidPiece
 
-try:
-    from libpychess import Position
-except ImportError:
-    from Chess.coordinate import Position
+from Chess.coordinate import Position
+
+# Colours and kinds accepted by Piece, as sets for constant time validation
+_COLOURS = frozenset((WHITE, BLACK))
+_KINDS = frozenset(PIECE_TYPES)
+
+# Projection tables, one per kind (and colour for pawns) shared by every piece of that kind
+_KING_PROJECTIONS = (Vec(1, 1), Vec(1, 0), Vec(1, -1), Vec(0, 1), Vec(0, -1), Vec(-1, 1), Vec(-1, 0), Vec(-1, -1))
+_ROOK_PROJECTIONS = (Vec(1, 0), Vec(0, 1), Vec(0, -1), Vec(-1, 0))
+_BISHOP_PROJECTIONS = (Vec(1, 1), Vec(1, -1), Vec(-1, 1), Vec(-1, -1))
+_KNIGHT_PROJECTIONS = (Vec(1, 2), Vec(1, -2), Vec(2, 1), Vec(2, -1), Vec(-1, 2), Vec(-1, -2), Vec(-2, 1), Vec(-2, -1))
+_PAWN_PROJECTIONS = {
+    WHITE: (Vec(1, 0), Vec(1, -1), Vec(1, 1)),
+    BLACK: (Vec(-1, 0), Vec(-1, -1), Vec(-1, 1)),
+}
 
 class Piece:
     """Piece
     Wrapper for a chess piece. This is the base class, and is subclassed and overloaded
     for each type of piece to make construction a bit more smooth.
-    Stores the projections, position, colour, move distance and activity of the piece.
+    Stores the position, colour, move distance and activity of the piece. The projections
+    are shared by every piece of a kind, so are stored on the class rather than each instance.
+
+    Each piece is given an id when it is created which never changes, so a piece can be
+    used as a dict key while it moves and is captured. Copies of a piece keep its id.
     """
+    __slots__ = ('_colour', '_position', '_kind', '_is_active', '_max_distance', '_id')
 
     KING = "K"
     QUEEN = "Q"
@@ -25,6 +42,11 @@ class Piece:
     BISHOP = "B"
     KNIGHT = "N"
     PAWN = "P"
+
+    _PROJECTIONS: Tuple[Vec, ...] = (Vec(1, 1),)
+
+    # Source of the stable ids
+    _ids = count()
     
     def __init__(
             self,
@@ -48,16 +70,17 @@ class Piece:
         :type is_active: bool
         :rtype: None
         """
-        if colour not in [WHITE, BLACK]: raise InvalidPiece("Not a valid colour")
-        if kind not in PIECE_TYPES: raise InvalidPiece("Not a valid type")
-        if max_distance not in range(1, 8): raise InvalidPiece("max_distance must be between 0, 8")
-        if not isinstance(is_active, bool): raise InvalidPiece("is_active must be bool")
+        if colour not in _COLOURS: raise InvalidPiece("Not a valid colour")
+        if kind not in _KINDS: raise InvalidPiece("Not a valid type")
+        if not 0 < max_distance < 8: raise InvalidPiece("max_distance must be between 0, 8")
+        if is_active is not True and is_active is not False: raise InvalidPiece("is_active must be bool")
 
         self._colour = colour
         self._position = position
         self._kind = kind
         self._is_active = is_active
         self._max_distance = max_distance
+        self._id = next(Piece._ids)
 
     def __repr__(self) -> str:
         return f"<{self._kind} colour {self._colour} at {self._position}>"
@@ -66,18 +89,21 @@ class Piece:
         return f"<{self._kind} colour {self._colour} at {self._position}>"
 
     def __eq__(self, other: 'Piece') -> bool:
-        return self.__hash__() == hash(other)
+        return self is other or (isinstance(other, Piece) and self._id == other._id)
 
     def __neq__(self, other: 'Piece') -> bool:
-        return self.__hash__() != hash(other)
+        return not self.__eq__(other)
 
     def __hash__(self) -> int:
         """__hash__.
-        15 bit integer hash mapped as follows:
-            000(i)000(j)0000000(char)0(active)0(colour)
+        The id of the piece, which does not change when it moves or is captured.
         :rtype: int
         """
-        return 0 | (self._position.i<<12) | (self._position.j<<9) | (ord(self.kind)<<2) | (self._is_active<<1) | (self._colour)
+        return self._id
+
+    @property
+    def id(self) -> int:
+        return self._id
 
     @property
     def colour(self) -> int:
@@ -118,110 +144,54 @@ class Piece:
         self._is_active = False
 
     @property
-    def projections(self) -> List[Vec]:
-        """A list of the directions that the piece can move in."""
-        return [Vec(1,1)]
+    def projections(self) -> Tuple[Vec, ...]:
+        """The directions that the piece can move in, shared by all pieces of its kind."""
+        return self._PROJECTIONS
 
 
 class King(Piece):
+    __slots__ = ()
+    _PROJECTIONS = _KING_PROJECTIONS
+
     def __init__(self, colour: bool, position: Position) -> None:
         super().__init__(colour, position, kind="K", max_distance=1)
 
-    @property
-    def projections(self):
-        """The directions this piece can move in"""
-        return [
-            Vec(1, 1),
-            Vec(1, 0),
-            Vec(1, -1),
-            Vec(0, 1),
-            Vec(0, -1),
-            Vec(-1, 1),
-            Vec(-1, 0),
-            Vec(-1, -1)
-        ]
-
 
 class Queen(Piece):
+    __slots__ = ()
+    _PROJECTIONS = _KING_PROJECTIONS
+
     def __init__(self, colour: bool, position: Position) -> None:
         super().__init__(colour, position, kind="Q")
 
-    @property
-    def projections(self):
-        """The directions this piece can move in"""
-        return [
-            Vec(1, 1),
-            Vec(1, 0),
-            Vec(1, -1),
-            Vec(0, 1),
-            Vec(0, -1),
-            Vec(-1, 1),
-            Vec(-1, 0),
-            Vec(-1, -1)
-        ]
-
 class Rook(Piece):
+    __slots__ = ()
+    _PROJECTIONS = _ROOK_PROJECTIONS
+
     def __init__(self, colour: bool, position: Position) -> None:
         super().__init__(colour, position, kind="R")
 
-    @property
-    def projections(self):
-        """The directions this piece can move in"""
-        return [
-            Vec(1, 0),
-            Vec(0, 1),
-            Vec(0, -1),
-            Vec(-1, 0),
-        ]
-
 class Bishop(Piece):
+    __slots__ = ()
+    _PROJECTIONS = _BISHOP_PROJECTIONS
+
     def __init__(self, colour: bool, position: Position) -> None:
         super().__init__(colour, position, kind="B")
 
-    @property
-    def projections(self):
-        """The directions this piece can move in"""
-        return [
-            Vec(1, 1),
-            Vec(1, -1),
-            Vec(-1, 1),
-            Vec(-1, -1)
-        ]
-
 class Knight(Piece):
+    __slots__ = ()
+    _PROJECTIONS = _KNIGHT_PROJECTIONS
+
     def __init__(self, colour: bool, position: Position) -> None:
         super().__init__(colour, position, kind="N", max_distance=1)
 
-    @property
-    def projections(self):
-        """The directions this piece can move in"""
-        return [
-            Vec(1, 2),
-            Vec(1, -2),
-            Vec(2, 1),
-            Vec(2, -1),
-            Vec(-1, 2),
-            Vec(-1, -2),
-            Vec(-2, 1),
-            Vec(-2, -1),
-        ]
-
 class Pawn(Piece):
+    __slots__ = ()
+
     def __init__(self, colour: bool, position: Position) -> None:
         super().__init__(colour, position, kind="P", max_distance=2)
 
     @property
-    def projections(self):
-        """The directions this piece can move in"""
-        if self._colour == WHITE:
-            return [
-                Vec(1, 0),
-                Vec(1, -1),
-                Vec(1, 1),
-            ]
-        else:
-            return [
-                Vec(-1, 0),
-                Vec(-1, -1),
-                Vec(-1, 1),
-            ]
+    def projections(self) -> Tuple[Vec, ...]:
+        """The directions this piece can move in, which depend on its colour"""
+        return _PAWN_PROJECTIONS[self._colour]
@@ -2,15 +2,14 @@
 module, and confirm that this submission complies with the policy. The content of this file is my own original work,
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
+from array import array
 from collections.abc import MutableMapping
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from Chess.bitboard import MOVE_CAPTURE, MOVE_CASTLE, bits
 from Chess.pieces import King, Piece
 from Chess.constants import ResultKeys
 
-try:
-    from libpychess import Position
-except ImportError:
-    from Chess.coordinate import Position
+from Chess.coordinate import Position
 
 
 class BaseResult(MutableMapping):
@@ -320,3 +319,140 @@ class ResultSet(BaseResult):
         for k in self.store:
             if k in pieces:
                 self.store[k] = Result()
+
+
+class PackedResultSet(ResultSet):
+    """PackedResultSet
+    Lazy ResultSet over a packed move list, as generated by Chess.bitboard: an array('H')
+    of from | to << 6 | flags. Move generation fills the array without creating any objects,
+    and the Result of a piece is only built the first time it is looked up. The flat
+    `all_valid`, `all_passive` and `all_capture` lists are read from the array directly.
+
+    Attack and defend hold the squares each piece controls (taken from a snapshot of the
+    attack maps), the king only controls the squares it can legally move to. Pins are not
+    recorded.
+    """
+
+    __slots__ = ('moves', '_squares', '_locations', '_attacks', '_own')
+
+    def __init__(self,
+                 moves: array,
+                 locations: Dict[Piece, int],
+                 squares: Sequence[Position],
+                 attacks: Sequence[int],
+                 own: int,
+                 ) -> None:
+        """__init__.
+
+        :param self:
+        :param moves: Packed moves of the pieces in `locations`
+        :type moves: array
+        :param locations: Square index of each piece in the set
+        :type locations: Dict[Piece, int]
+        :param squares: Position of each square index
+        :type squares: Sequence[Position]
+        :param attacks: Bitboard of the squares attacked from each square
+        :type attacks: Sequence[int]
+        :param own: Bitboard of the pieces on the moving side
+        :type own: int
+        :rtype: None
+        """
+        self.store = dict.fromkeys(locations)
+        self.moves = moves
+        self._squares = squares
+        self._locations = locations
+        self._attacks = attacks
+        self._own = own
+
+    def __build(self, piece: Piece) -> Result:
+        """__build.
+        Unpacks the moves of one piece into a Result.
+
+        :param self:
+        :param piece:
+        :type piece: Piece
+        :rtype: Result
+        """
+        squares = self._squares
+        sq = self._locations[piece]
+        result = Result()
+        passive, capture, attack = result[ResultKeys.passive], result[ResultKeys.capture], result[ResultKeys.attack]
+        is_king = isinstance(piece, King)
+        for mov in self.moves:
+            if mov & 63 != sq:
+                continue
+            end = squares[(mov >> 6) & 63]
+            if mov & MOVE_CAPTURE: capture.append(end)
+            else: passive.append(end)
+            if is_king and not mov & MOVE_CASTLE: attack.append(end)
+
+        if not is_king:
+            controlled = self._attacks[sq]
+            attack.extend(squares[i] for i in bits(controlled & ~self._own))
+            result[ResultKeys.defend].extend(squares[i] for i in bits(controlled & self._own))
+        return result
+
+    def __load(self) -> None:
+        """Builds the Result of every piece, before handing the store to the ResultSet methods."""
+        for piece, result in self.store.items():
+            if result is None:
+                self.store[piece] = self.__build(piece)
+
+    def __getitem__(self, k: Piece) -> Result:
+        result = self.store[k]
+        if result is None:
+            result = self.store[k] = self.__build(k)
+        return result
+
+    @property
+    def all_valid(self) -> List[Position]:
+        squares = self._squares
+        return [squares[(mov >> 6) & 63] for mov in self.moves]
+
+    @property
+    def all_passive(self) -> List[Position]:
+        squares = self._squares
+        return [squares[(mov >> 6) & 63] for mov in self.moves if not mov & MOVE_CAPTURE]
+
+    @property
+    def all_capture(self) -> List[Position]:
+        squares = self._squares
+        return [squares[(mov >> 6) & 63] for mov in self.moves if mov & MOVE_CAPTURE]
+
+    @property
+    def all_defend(self) -> List[Position]:
+        self.__load()
+        return super().all_defend
+
+    @property
+    def all_attack(self) -> List[Position]:
+        self.__load()
+        return super().all_attack
+
+    @property
+    def all_pins(self) -> List[Position]:
+        return []
+
+    @property
+    def king(self) -> Result:
+        self.__load()
+        return super().king
+
+    def lookup_pin(self, pin_loc: Position) -> Optional[Piece]:
+        return None
+
+    def filter_by_move_type(self, key: ResultKeys, test: Callable) -> ResultSet:
+        self.__load()
+        return super().filter_by_move_type(key, test)
+
+    def filter_all_by_value(self, test: Callable) -> ResultSet:
+        self.__load()
+        return super().filter_all_by_value(test)
+
+    def filter_all_by_key(self, test: Callable) -> ResultSet:
+        self.__load()
+        return super().filter_all_by_key(test)
+
+    def clear_set(self, pieces: List[Piece]) -> None:
+        self.__load()
+        super().clear_set(pieces)
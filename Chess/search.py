@@ -0,0 +1,371 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import argparse
+import time
+from typing import List, Optional
+from Chess import bitboard
+from Chess.bitboard import KING, WHITE, Bitboards, offset
+from Chess.cache import MoveCache
+from Chess.constants import MOVE_CAPTURE
+from Chess.coordinate import Move
+from Chess.evaluation import PIECE_VALUES, taper
+from Chess.perft import START_FEN, square_name
+from Chess.state import Board, construct_board, move_from_packed
+
+# Alpha-beta search over the bitboard engine which generates Board's legal moves. Run with
+# `python3 -m Chess.search [FEN] -d DEPTH [--nodes N] [--time SECONDS]`.
+#
+# Negamax with iterative deepening, so a node or time limit always leaves the result of the
+# last completed depth, and a quiescence search over captures at the leaves. Moves are tried
+# in the order: best move from the transposition table, captures by most valuable victim then
+# least valuable attacker (MVV-LVA), the two killer moves of the ply, then quiet moves by
+# their history score. The transposition table is a MoveCache owned by the search.
+
+MATE = 100_000
+INFINITY = MATE + 1
+MAX_PLY = 64
+
+# Attacker order for MVV-LVA, the king last
+_ATTACKER_RANK = (6, 5, 4, 2, 3, 1)
+
+# Transposition table bounds
+EXACT, LOWER, UPPER = 0, 1, 2
+
+_HASH_MOVE = 1 << 30
+_CAPTURE = 1 << 28
+_KILLER = 1 << 26
+
+
+class SearchResult:
+    """SearchResult
+    Outcome of a search: the best move and principal variation found at the deepest completed
+    depth, the score from the side to move's point of view (in centipawns, or +-(MATE - plies)
+    for a forced mate) and the work done.
+    """
+
+    __slots__ = ('best', 'pv', 'score', 'depth', 'nodes', 'seconds')
+
+    def __init__(self, best: Optional[Move], pv: List[Move], score: int, depth: int, nodes: int,
+                 seconds: float) -> None:
+        """__init__.
+
+        :param self:
+        :param best: None when the side to move has no legal moves
+        :type best: Optional[Move]
+        :param pv:
+        :type pv: List[Move]
+        :param score:
+        :type score: int
+        :param depth: Deepest iteration which completed
+        :type depth: int
+        :param nodes: Nodes visited, including quiescence nodes
+        :type nodes: int
+        :param seconds:
+        :type seconds: float
+        :rtype: None
+        """
+        self.best = best
+        self.pv = pv
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.seconds = seconds
+
+    @property
+    def nps(self) -> float:
+        """Nodes searched per second."""
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    @property
+    def mate_in(self) -> Optional[int]:
+        """Plies to a forced mate (negative when the side to move is mated), or None."""
+        if abs(self.score) < MATE - MAX_PLY:
+            return None
+        return MATE - self.score if self.score > 0 else -(MATE + self.score)
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(best={self.best!r}, score={self.score}, depth={self.depth}, "
+                f"nodes={self.nodes}, nps={self.nps:.0f})")
+
+
+def move_name(mov: int) -> str:
+    """Coordinate notation of a packed move, e.g. 'e2e4'."""
+    return square_name(mov & 63) + square_name((mov >> 6) & 63)
+
+
+class Search:
+    """Search
+    Searches one position, held as its own copy of the bitboards. The transposition table,
+    killer moves and history scores are kept between calls to `run`, so searching the same
+    position again (or a deeper limit) reuses the earlier work.
+    """
+
+    __slots__ = ('bb', 'table', 'killers', 'history', 'pv', 'nodes', 'completed', 'stopped', 'max_nodes',
+                 'deadline')
+
+    def __init__(self, bb: Bitboards, table_size: int = 100_000) -> None:
+        """__init__.
+
+        :param self:
+        :param bb: Position to search, which is copied
+        :type bb: Bitboards
+        :param table_size: Entries in the transposition table
+        :type table_size: int
+        :rtype: None
+        """
+        self.bb = bb.copy()
+        self.table = MoveCache(max_entries=table_size)
+        self.killers = [[0, 0] for _ in range(MAX_PLY)]
+        # Indexed by the from and to squares of a quiet move (its low 12 bits)
+        self.history = [0] * 4096
+        self.pv: List[List[int]] = [[] for _ in range(MAX_PLY + 1)]
+        self.nodes = 0
+        self.completed = 0
+        self.stopped = False
+        self.max_nodes: Optional[int] = None
+        self.deadline: Optional[float] = None
+
+    def run(self, depth: int = MAX_PLY, nodes: Optional[int] = None, seconds: Optional[float] = None) -> SearchResult:
+        """run.
+        Deepens the search one ply at a time until `depth` is reached, a forced mate is found or
+        a limit is hit. The limits are checked every 1024 nodes and not until the first
+        iteration has completed, so there is always a move to return.
+
+        :param self:
+        :param depth: Maximum depth in plies (at most MAX_PLY)
+        :type depth: int
+        :param nodes: Stop after roughly this many nodes
+        :type nodes: Optional[int]
+        :param seconds: Stop after roughly this much time
+        :type seconds: Optional[float]
+        :rtype: SearchResult
+        """
+        start = time.perf_counter()
+        self.nodes = 0
+        self.completed = 0
+        self.stopped = False
+        self.max_nodes = nodes
+        self.deadline = start + seconds if seconds is not None else None
+
+        score, pv = 0, []
+        for iteration in range(1, min(depth, MAX_PLY) + 1):
+            value = self._negamax(iteration, -INFINITY, INFINITY, 0)
+            if self.stopped:
+                # The unfinished iteration is discarded
+                break
+            score, pv = value, self.pv[0][:]
+            self.completed = iteration
+            if abs(score) >= MATE - MAX_PLY:
+                break
+
+        moves = [move_from_packed(mov) for mov in pv]
+        return SearchResult(moves[0] if moves else None, moves, score, self.completed, self.nodes,
+                            time.perf_counter() - start)
+
+    def evaluate(self) -> int:
+        """Tapered material and piece-square score (Board.tapered_evaluation) for the side to move."""
+        bb = self.bb
+        score = taper(bb.middlegame, bb.endgame, bb.phase)
+        return score if bb.to_move == WHITE else -score
+
+    def _check_limits(self) -> None:
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            self.stopped = True
+        elif self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.stopped = True
+
+    def _order(self, moves, hash_move: int, killers) -> List[int]:
+        """Sorts moves so the most promising are searched first."""
+        mailbox = self.bb.mailbox
+        history = self.history
+
+        def priority(mov: int) -> int:
+            if mov == hash_move:
+                return _HASH_MOVE
+            if mov & MOVE_CAPTURE:
+                victim = mailbox[(mov >> 6) & 63] % 6
+                return _CAPTURE + PIECE_VALUES[victim] * 8 - _ATTACKER_RANK[mailbox[mov & 63] % 6]
+            if mov == killers[0]:
+                return _KILLER + 1
+            if mov == killers[1]:
+                return _KILLER
+            return history[mov & 0xFFF]
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """_negamax.
+        Score of the position `depth` plies deep, within the window (alpha, beta).
+
+        :param self:
+        :param depth:
+        :type depth: int
+        :param alpha:
+        :type alpha: int
+        :param beta:
+        :type beta: int
+        :param ply: Distance from the root
+        :type ply: int
+        :rtype: int
+        """
+        if depth <= 0:
+            return self._quiesce(alpha, beta, ply)
+
+        self.nodes += 1
+        if self.completed and not self.nodes & 1023:
+            self._check_limits()
+        if self.stopped:
+            return 0
+        self.pv[ply] = []
+
+        bb = self.bb
+        key = bb.key
+        hash_move = 0
+        entry = self.table.get(key)
+        if entry is not None:
+            entry_depth, entry_score, bound, hash_move = entry
+            # Cut-offs are not taken at the root, which must always produce a move
+            if ply and entry_depth >= depth:
+                entry_score = _from_table(entry_score, ply)
+                if (bound == EXACT or (bound == LOWER and entry_score >= beta)
+                        or (bound == UPPER and entry_score <= alpha)):
+                    return entry_score
+
+        moves, checkers = bitboard.legal_moves(bb)
+        if not moves:
+            return -MATE + ply if checkers else 0
+
+        original_alpha = alpha
+        best, best_move = -INFINITY, 0
+        killers = self.killers[ply]
+        for mov in self._order(moves, hash_move, killers):
+            undo = bb.make(mov)
+            score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            bb.unmake(mov, undo)
+            if self.stopped:
+                return 0
+            if score > best:
+                best, best_move = score, mov
+                if score > alpha:
+                    alpha = score
+                    self.pv[ply] = [mov] + self.pv[ply + 1]
+                    if alpha >= beta:
+                        if not mov & MOVE_CAPTURE:
+                            if mov != killers[0]:
+                                killers[1], killers[0] = killers[0], mov
+                            self.history[mov & 0xFFF] += depth * depth
+                        break
+
+        bound = UPPER if best <= original_alpha else LOWER if best >= beta else EXACT
+        self.table.put(key, (depth, _to_table(best, ply), bound, best_move))
+        return best
+
+    def _quiesce(self, alpha: int, beta: int, ply: int) -> int:
+        """_quiesce.
+        Resolves the captures available at a leaf, so it is not scored in the middle of an
+        exchange. The side to move may stand pat on the static evaluation, unless it is in check,
+        in which case every evasion is searched.
+
+        :param self:
+        :param alpha:
+        :type alpha: int
+        :param beta:
+        :type beta: int
+        :param ply:
+        :type ply: int
+        :rtype: int
+        """
+        self.nodes += 1
+        if self.completed and not self.nodes & 1023:
+            self._check_limits()
+        if self.stopped:
+            return 0
+        if ply <= MAX_PLY:
+            self.pv[ply] = []
+
+        bb = self.bb
+        us = bb.to_move
+        if bb.attackers[bitboard.lsb(bb.boards[KING + offset(us)])] & bb.occupied[not us]:
+            moves, _ = bitboard.legal_moves(bb)
+            if not moves:
+                return -MATE + ply
+        else:
+            # Stalemates are not detected here, as only the captures are generated
+            stand = self.evaluate()
+            if stand >= beta:
+                return stand
+            if stand > alpha:
+                alpha = stand
+            moves, _ = bitboard.legal_moves(bb, captures=True)
+
+        for mov in self._order(moves, 0, (0, 0)):
+            undo = bb.make(mov)
+            score = -self._quiesce(-beta, -alpha, ply + 1)
+            bb.unmake(mov, undo)
+            if self.stopped:
+                return 0
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+        return alpha
+
+
+def _to_table(score: int, ply: int) -> int:
+    """Mate scores are stored as distance from the node rather than from the root."""
+    if score >= MATE - 2 * MAX_PLY: return score + ply
+    if score <= -MATE + 2 * MAX_PLY: return score - ply
+    return score
+
+
+def _from_table(score: int, ply: int) -> int:
+    if score >= MATE - 2 * MAX_PLY: return score - ply
+    if score <= -MATE + 2 * MAX_PLY: return score + ply
+    return score
+
+
+def search(board: Board, depth: Optional[int] = None, nodes: Optional[int] = None, seconds: Optional[float] = None,
+           table_size: int = 100_000) -> SearchResult:
+    """search.
+    Finds the best move for the side to move. The board itself is not changed. With no limits
+    given the search goes 4 plies deep, with only a node or time limit it deepens until the
+    limit is reached.
+
+    :param board:
+    :type board: Board
+    :param depth: Maximum depth in plies
+    :type depth: Optional[int]
+    :param nodes: Node limit
+    :type nodes: Optional[int]
+    :param seconds: Time limit
+    :type seconds: Optional[float]
+    :param table_size: Entries in the transposition table
+    :type table_size: int
+    :rtype: SearchResult
+    """
+    if depth is None:
+        depth = 4 if nodes is None and seconds is None else MAX_PLY
+    return Search(board._bb, table_size).run(depth, nodes, seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search a position for the best move")
+    parser.add_argument("fen", nargs="?", default=START_FEN)
+    parser.add_argument("-d", "--depth", type=int, default=None)
+    parser.add_argument("--nodes", type=int, default=None, help="stop after this many nodes")
+    parser.add_argument("--time", type=float, default=None, help="stop after this many seconds")
+    parser.add_argument("--hash", type=int, default=100_000, help="entries in the transposition table")
+    args = parser.parse_args()
+
+    result = search(construct_board(args.fen, lazy=True), args.depth, args.nodes, args.time, args.hash)
+    pv = " ".join(move_name(mov.to_int()) for mov in result.pv)
+    if result.mate_in is not None:
+        # Moves rather than plies, negative when the side to move is being mated
+        moves = (abs(result.mate_in) + 1) // 2
+        score = f"mate in {moves if result.mate_in > 0 else -moves}"
+    else:
+        score = f"{result.score} cp"
+    print(f"depth {result.depth}: {score}, pv {pv or '-'}")
+    print(f"{result.nodes} nodes in {result.seconds:.2f}s, {result.nps:.0f} nodes/s")
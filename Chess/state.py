@@ -2,25 +2,58 @@
 module, and confirm that this submission complies with the policy. The content of this file is my own original work,
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
-from typing import Dict, List, Tuple
-
-from Chess.constants import BLACK, WHITE, MoveSignal, WinState, USE_CPP
-from Chess.coordinate import Move
-from Chess.helpers import new_game, pieces_from_fen
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from Chess import backends, bitboard, cache
+from Chess.bitboard import Bitboards
+from Chess.constants import BLACK, WHITE, MoveSignal, WinState
+from Chess.coordinate import Move, Position
+from Chess.evaluation import taper
+from Chess.helpers import SQUARES, new_game, pieces_from_fen
 from Chess.pieces import Bishop, King, Knight, Pawn, Piece, Queen, Rook
-from Chess.result import Result, ResultKeys, ResultSet
+from Chess.result import PackedResultSet, Result, ResultKeys, ResultSet
+from Chess.tables import BETWEEN, KNIGHT_JUMPS, QUEEN_DIRS, RAY_SQUARES
 import logging
 
-try:
-    import libpychess
-    from libpychess import Position
-except ImportError:
-    print("libpychess not found, using python fallback")
-    USE_CPP = False
-    from Chess.coordinate import Position 
-
 log = logging.getLogger("State")
 
+def square_of(position) -> int:
+    """Square index (i << 3 | j) of a position, used to index Chess.tables."""
+    return (position.i << 3) | position.j
+
+def move_from_packed(mov: int) -> Move:
+    """move_from_packed.
+    Wraps a packed move generated by Chess.bitboard in a `Move` object.
+
+    :param mov:
+    :type mov: int
+    :rtype: Move
+    """
+    return Move.from_int(mov, SQUARES)
+
+class Undo():
+    """Undo
+    Record pushed by Board.push holding everything needed to take a move back
+    without recalculating the previous position."""
+    __slots__ = ('move', 'moved', 'captured', 'captured_index', 'rook', 'castle', 'turn',
+                 'is_check', 'pins', 'win_state', 'allowed_moves', 'dirty')
+
+    def __init__(self, move, moved, captured, captured_index, rook, castle, turn,
+                 is_check, pins, win_state, allowed_moves, dirty) -> None:
+        self.move = move
+        self.moved = moved
+        self.captured = captured
+        self.captured_index = captured_index
+        self.rook = rook
+        self.castle = castle
+        self.turn = turn
+        self.is_check = is_check
+        self.pins = pins
+        self.win_state = win_state
+        self.allowed_moves = allowed_moves
+        self.dirty = dirty
+
 class Board():
     """Board.
     This wraps a games state and provides utilities for interacting with it and calculating
@@ -28,8 +61,15 @@ class Board():
     state which performs internal mainpulation rather than copying, since instantiating
     this object is kind of slow...
 
-    USE_CPP controls if the function to evaluate the "psuedolegal" moves in a position should
-    be defined in libpychess or Chess.coordinate. The former is a C++ implementation of the latter"""
+    `backend` names the move generation backend (see Chess.backends), defaulting to the
+    PYCHESS_BACKEND environment variable or the bitboard engine. "bitboard" uses the engine in
+    Chess.bitboard, which keeps twelve integers in sync with the pieces and generates legal moves
+    directly from them. "python" and "cpp" filter the "psuedolegal" moves found by the ray
+    walker in this module or by libpychess (a C++ implementation of it).
+
+    With lazy=True the legal moves, check and win state are only calculated the first time
+    one of `moves`, `is_check`, `is_mate` or `is_stale` is read after a move, which saves the
+    work entirely when a sequence of moves is replayed just to reach the final position."""
 
     def __init__(self,
                  starting_position: Tuple[List[Piece], List[Piece]] = None,
@@ -38,9 +78,12 @@ class Board():
                  en_passant_opts: str = "-",
                  half_moves_since_pawn: int = 0,
                  turn: int = 1,
+                 lazy: bool = False,
+                 backend: Optional[str] = None,
                  ) -> None:
-        
-        if USE_CPP:
+
+        self._backend = backends.get(backend)
+        if self._backend.native is not None:
             self.__psuedolegal_moves = self.__cpp_psuedolegal_moves
         else:
             self.__psuedolegal_moves = self.__py_psuedolegal_moves
@@ -55,24 +98,39 @@ class Board():
         self._to_move = to_move
         self._opposition = WHITE if to_move == BLACK else BLACK
 
+        # Stack of Undo records for moves applied with `push`
+        self._history: List[Undo] = []
+
         # Setup properties which we will later bind in the `calculate` function
         self.__is_check = []
+        # Pieces of the side moving which are pinned to their king -> bitboard of the pin line
+        self.__pins: Dict[Piece, int] = {}
         self.__win_state = WinState.cont
-        self._evaluation = 0
+        self._allowed_moves: ResultSet = None
+        # Set by `calculate` in lazy mode until the position is actually evaluated
+        self._lazy = lazy
+        self.__dirty = False
 
         # This is just while castling and en-passant is not implemented
         self._castle = self.__parse_castle(can_castle) # castle[4] : white kingside, queenside, black kingside, queenside
 
+        # Location maps, updated in place as pieces move
+        self.__loc_map: Dict[Position, Piece] = {piece.position: piece for piece in self.all_pieces}
+        self.__piece_map: Dict[Piece, Position] = {piece: piece.position for piece in self.all_pieces}
+
+        # Bitboard mirror of the pieces, shares the castling list with the board
+        self._bb = Bitboards.from_pieces(self._white + self._black, to_move, self._castle)
         
-        if USE_CPP:
+        native = self._backend.native
+        if native is not None:
             # Define some conversion tables
             self._cpp_py_piece_conversion = {
-                "K" : libpychess.pieces.king,
-                "Q" : libpychess.pieces.queen,
-                "R" : libpychess.pieces.rook,
-                "N" : libpychess.pieces.knight,
-                "B" : libpychess.pieces.bishop,
-                "P" : libpychess.pieces.pawn,
+                "K" : native.pieces.king,
+                "Q" : native.pieces.queen,
+                "R" : native.pieces.rook,
+                "N" : native.pieces.knight,
+                "B" : native.pieces.bishop,
+                "P" : native.pieces.pawn,
             }
 
             self._py_cpp_conv = {
@@ -84,6 +142,11 @@ class Board():
                 "p" : Pawn
             }
 
+        # libpychess analyser for the current position, see __cpp_analyser
+        self.__analyser = None
+        self.__analyser_key = None
+        self.__analyser_results: Dict[bool, ResultSet] = {}
+
         self.calculate()
 
     def __repr__(self) -> str:
@@ -120,57 +183,132 @@ class Board():
 
     def __cpp_get_pieces(self):
         """__cpp_get_pieces.
-        Converts all the active pieces in the state into the version defined by libpychess
+        Converts all the active pieces in the state into the version defined by libpychess,
+        placed on the backend's own positions.
 
         :param self:
         """
+        squares = self._backend.squares
+        # Read from loc_map, which still holds a king lifted by __filter_moves
         return [
-            self._cpp_py_piece_conversion[p.kind](p.colour, Position(p.position.i, p.position.j)) 
-            for p in self.all_pieces
+            self._cpp_py_piece_conversion[p.kind](p.colour, squares[square_of(position)])
+            for position, p in self.loc_map.items()
         ]
 
+    def __cpp_analyser(self):
+        """__cpp_analyser.
+        The MoveAnalyser for the current position. One analyser is kept per Board and only
+        rebuilt once the position's Zobrist key changes, rather than for every call. Lifting the
+        king while its moves are filtered does not change the key, see __cpp_lift_king.
+
+        :param self:
+        """
+        key = self._bb.key
+        if self.__analyser_key != key:
+            self.__analyser = self._backend.native.MoveAnalyser(self.__cpp_get_pieces())
+            self.__analyser_key = key
+            self.__analyser_results = {}
+        return self.__analyser
+
     def __py_convert_result(self, c_result):
         """__py_convert_result.
         Converts the output of libpychess MoveAnalyser into the same type returned by
-        __py_psuedolegal_moves
+        __py_psuedolegal_moves. Results are keyed by the board's own pieces, since pieces
+        compare by identity, and squares are replaced by the interned SQUARES so no Position
+        objects outlive the call.
 
         :param self:
         :param c_result: Value returned by libpychess::MoveAnalyser.PsuedolegalMoves
         """
-        result = ResultSet(
-            {self._py_cpp_conv[k.kind](k.colour, Position(k.position.i, k.position.j)) : Result(v) 
-             for k, v in c_result.items()}
-        )
+        loc_map = self.loc_map
+        result = ResultSet({
+            loc_map[SQUARES[(k.position.i << 3) | k.position.j]]:
+                Result({kind: [SQUARES[(p.i << 3) | p.j] for p in squares] for kind, squares in v.items()})
+            for k, v in c_result.items()
+        })
         return result
 
     def __cpp_psuedolegal_moves(self, pieces: List[Piece]) -> ResultSet:
         """__cpp_psuedolegal_moves.
         Wraps function calls to convert and retrieve data from the libpychess module.
+        The converted result for the opposing side is kept until the analyser is rebuilt, as it
+        is asked for several times (and only read) while one position is evaluated. The moving
+        side's result is filtered in place, so it is converted afresh.
 
         :param self:
         :param pieces:
         :type pieces: List[Piece]
         :rtype: ResultSet
         """
-        # Get the pieces into the correct format (might be helpful to just change all my underlying
-        # types lol)
-        c_pieces = self.__cpp_get_pieces()
-        analysis = libpychess.MoveAnalyser(c_pieces)
-
-        # This isnt exacltly the same api as the python version
-        # Needs to be updated so we instantiate a new MoveAnalyser on each
-        # self.calculate (and free the previous)
-        # Then we can pass the constructor a list of each piece, and
-        # slightly change the PsuedolegalMoves call to take a pointer 
-        # to a list of pieces to analyse instead of having to go through all the pain
-        # For now it works since we only ever look at one colour at a time.
-        # Need to account for the edge case of when we check for checkmate and have to 
-        # evaluate a position without the king there... That relies on the live update of
-        # the list and so we might need to define a callback from that function
-        # to reinstantiate our analyser object each time - or could try some funkier stuff...
-        c_result = analysis.PsuedolegalMoves(pieces[0].colour)
-        py_result = self.__py_convert_result(c_result)
-        return py_result
+        analysis = self.__cpp_analyser()
+        colour = pieces[0].colour
+        if colour == self._to_move:
+            return self.__py_convert_result(analysis.PsuedolegalMoves(colour))
+        if colour not in self.__analyser_results:
+            # For now this works since we only ever look at one colour at a time.
+            c_result = analysis.PsuedolegalMoves(colour)
+            self.__analyser_results[colour] = self.__py_convert_result(c_result)
+        king = self.__lifted_king()
+        if king is not None:
+            return self.__cpp_lift_king(self.__analyser_results[colour], king)
+        return self.__analyser_results[colour]
+
+    def __lifted_king(self) -> Optional[King]:
+        """__lifted_king.
+        The king of the side moving while __filter_moves has it marked as captured, otherwise None.
+
+        :param self:
+        :rtype: Optional[King]
+        """
+        for piece in (self._white if self._to_move == WHITE else self._black):
+            if piece.kind == "K":
+                return None if piece.is_active else piece
+        return None
+
+    def __cpp_lift_king(self, results: ResultSet, king: King) -> ResultSet:
+        """__cpp_lift_king.
+        Masks the lifted king out of the opposing moves found by the analyser, which still has
+        the king on the board. Only the sliders giving check see through the king's square, so
+        their rays are continued past it (as the ray walker would without the king there) and
+        every other result is shared with the memoised set.
+
+        :param self:
+        :param results: Opposing moves with the king on the board
+        :type results: ResultSet
+        :param king: The lifted king
+        :type king: King
+        :rtype: ResultSet
+        """
+        loc_map = self.loc_map
+        king_position = self.piece_map[king]
+        king_sq = square_of(king_position)
+        masked = ResultSet(dict(results.store))
+        for checker in self.__is_check:
+            if checker.kind not in "QRB":
+                continue
+            start = self.piece_map[checker]
+            direction = ((king_position.i > start.i) - (king_position.i < start.i),
+                         (king_position.j > start.j) - (king_position.j < start.j))
+            result = Result({k: list(v) for k, v in results[checker].items()})
+            if king_position in result[ResultKeys.capture]:
+                result[ResultKeys.capture].remove(king_position)
+            result[ResultKeys.passive].append(king_position)
+            result[ResultKeys.attack].append(king_position)
+            for sq in RAY_SQUARES[direction][king_sq]:
+                landed_on = SQUARES[sq]
+                occupier = loc_map.get(landed_on)
+                if occupier is None:
+                    result[ResultKeys.passive].append(landed_on)
+                    result[ResultKeys.attack].append(landed_on)
+                    continue
+                if occupier.colour == checker.colour:
+                    result[ResultKeys.defend].append(landed_on)
+                else:
+                    result[ResultKeys.capture].append(landed_on)
+                    result[ResultKeys.attack].append(landed_on)
+                break
+            masked[checker] = result
+        return masked
 
     def __py_allowed_move(self, position, piece) -> MoveSignal:
         """__py_allowed_move.
@@ -239,20 +377,15 @@ class Board():
         results = ResultSet(dict.fromkeys(pieces))
         for piece in pieces:
             result = Result()
+            sq = square_of(self.piece_map[piece])
             for dir in piece.projections:
                 # Iterate over all the directions a piece can move in
                 # Reset the pinned marker.
                 pinned = None
-                for step in range(1, piece.distance + 1):
-                    # Count up all the steps the piece can take until it meets
-                    # a stop condition
-                    loc = self.piece_map[piece]
-                    ni = loc.i + (dir.i * step)
-                    nj = loc.j + (dir.j * step)
-                    if ni > 7 or ni < 0 or nj > 7 or nj < 0: break
-                    landed_on = Position((ni, nj))
-                    # try: landed_on = self.piece_map[piece] + (dir * step)
-                    # except InvalidFormat: break
+                # The precomputed ray already stops at the board edge, so just take
+                # as many steps as the piece can move.
+                for landed in RAY_SQUARES[(dir.i, dir.j)][sq][:piece.distance]:
+                    landed_on = SQUARES[landed]
                     allowed = self.__py_allowed_move(landed_on, piece)
 
                     # Reordered expressions to make use of short-circuiting
@@ -272,7 +405,7 @@ class Board():
                         result[ResultKeys.attack].append(landed_on)
                         # Snapshot the current location and check if this piece which can
                         # be captures is pinned to the king.
-                        pinned = Position((landed_on.i, landed_on.j))
+                        pinned = landed_on
                     elif not pinned and allowed == MoveSignal.attacks: 
                         # Do not save an attack if we are scanning for a pin
                         # This will only ever be pawn attacks (to separate their passive
@@ -312,8 +445,8 @@ class Board():
         :type results: ResultSet
         :rtype: ResultSet
         """
-        # Fetches enemy psuedolegal moves and returns attacking pieces
-        attackers = self.__is_check[:]
+        # Checks and pins are found by __king_threats when the position is evaluated
+        attackers = self.is_check[:]
         king = self.__get_king()
         if len(attackers) > 1:
             # Remove all other piece moves
@@ -340,7 +473,7 @@ class Board():
             attacker = attackers.pop()
             assert attacker
 
-        opposing_moves = self.__psuedolegal_moves(self.opposing)
+        king_sq = square_of(self.piece_map[king])
         for piece in results.keys():
             # If there is only one attacker, non-king pieces can only move on the path attacker - king
             # If the piece is a king then fetch the king_moves from __filter_king_moves algorithm
@@ -348,17 +481,16 @@ class Board():
                 continue
             if attacker:
                 # Get the path from the attacker to the king, filter moves to only that path.
-                path = self.piece_map[attacker].path_to(self.piece_map[king])
-                results[piece] = results[piece].filter_valid(lambda x: x in path)
+                attacker_sq = square_of(self.piece_map[attacker])
+                path = BETWEEN[attacker_sq][king_sq] | (1 << attacker_sq)
+                results[piece] = results[piece].filter_valid(lambda x: (path >> square_of(x)) & 1)
 
             # Finally, if attackers <=1 resolve pins.
-            piece_loc = self.piece_map[piece]
-            pin = opposing_moves.lookup_pin(piece_loc)
-            if pin:
+            line = self.__pins.get(piece)
+            if line:
                 # Only valid moves for a pinned piece will be on the axis of the opposing piece
                 # and king.
-                path = self.piece_map[pin].path_to(self.piece_map[king])
-                results[piece] = results[piece].filter_valid(lambda x: x in path)
+                results[piece] = results[piece].filter_valid(lambda x: (line >> square_of(x)) & 1)
 
         return results
 
@@ -378,11 +510,22 @@ class Board():
         :rtype: None
         """
 
+        # Pieces hash by a stable id, so loc_map and piece_map are updated in place
         if isinstance(new_position, Position):
-            # Change this to just update the map in the future.
+            if self.__loc_map.get(piece._position) is piece:
+                del self.__loc_map[piece._position]
+            self.__loc_map[new_position] = piece
+            self.__piece_map[piece] = new_position
             piece._position = new_position
         if isinstance(is_active, bool):
             piece.is_active = is_active
+            if is_active:
+                self.__loc_map[piece._position] = piece
+                self.__piece_map[piece] = piece._position
+            else:
+                if self.__loc_map.get(piece._position) is piece:
+                    del self.__loc_map[piece._position]
+                self.__piece_map.pop(piece, None)
 
     def __get_king(self) -> King:
         """__get_king.
@@ -393,20 +536,51 @@ class Board():
         """
         return [i for i in self.moving if isinstance(i, King)].pop()
 
-    def __evaluate_check(self) -> List[Piece]:
-        """__evaluate_check.
-        Calculates if a position is in check (if the king is under attack).
-        Returns a list of all the pieces which directly attack the king.
+    def __king_threats(self) -> Tuple[List[Piece], Dict[Piece, int]]:
+        """__king_threats.
+        Finds the pieces giving check and the pieces pinned to the king in one pass, by looking
+        outward from the king along each ray and knight jump rather than generating every
+        opposing move. Returns the checking pieces and a mapping of each pinned piece to the
+        bitboard of its pin line (the squares it may still move to).
 
         :param self:
-        :rtype: List[Piece]
+        :rtype: Tuple[List[Piece], Dict[Piece, int]]
         """
-        moves = self.__psuedolegal_moves(self.opposing)
         king = self.__get_king()
+        king_sq = square_of(self.piece_map[king])
+        loc_map = self.loc_map
+        checkers = []
+        pins = {}
+
+        for jump in KNIGHT_JUMPS:
+            landed = RAY_SQUARES[jump][king_sq][:1]
+            piece = loc_map.get(SQUARES[landed[0]]) if landed else None
+            if piece and piece.colour != king.colour and piece.kind == "N":
+                checkers.append(piece)
+
+        # Enemy pawns attack towards the king, so from the rank above a white king
+        pawn_step = 1 if king.colour == WHITE else -1
+        for di, dj in QUEEN_DIRS:
+            slider = "B" if di and dj else "R"
+            shield: Optional[Piece] = None
+            for distance, sq in enumerate(RAY_SQUARES[(di, dj)][king_sq], 1):
+                piece = loc_map.get(SQUARES[sq])
+                if not piece:
+                    continue
+                if piece.colour == king.colour:
+                    # A second allied piece on the ray blocks any pin
+                    if shield: break
+                    shield = piece
+                    continue
+                attacks = piece.kind == "Q" or piece.kind == slider
+                if distance == 1 and piece.kind == "P":
+                    attacks = slider == "B" and di == pawn_step
+                if attacks:
+                    if shield: pins[shield] = BETWEEN[king_sq][sq] | (1 << sq)
+                    else: checkers.append(piece)
+                break
 
-        king_loc = self.piece_map[king]
-        moves = moves.filter_by_move_type(ResultKeys.capture, lambda x: x == king_loc)
-        return [i for i in moves if moves[i][ResultKeys.capture]]
+        return checkers, pins
 
     def __evaluate_mate(self) -> WinState:
         """__evaluate_mate.
@@ -423,9 +597,27 @@ class Board():
             else: return WinState.stalemate
         return WinState.cont
 
-    # def _evaluate_score(self):
-    #     """_evaluate_score."""
-    #     pass
+    def __bb_result_set(self, moves: array, pieces: List[Piece]) -> ResultSet:
+        """__bb_result_set.
+        Wraps the packed moves generated by Chess.bitboard in a PackedResultSet, which gives
+        the same dict api as the reference implementation but only unpacks a piece's moves
+        when they are looked up. Attack and defend hold the squares each piece controls.
+
+        :param self:
+        :param moves: Packed moves from bitboard.legal_moves
+        :type moves: array
+        :param pieces: Pieces to include in the result
+        :type pieces: List[Piece]
+        :rtype: ResultSet
+        """
+        bb = self._bb
+        locations = {piece: square_of(self.piece_map[piece]) for piece in pieces}
+        if len(locations) != len(self.moving):
+            included = 0
+            for sq in locations.values(): included |= 1 << sq
+            moves = array('H', [mov for mov in moves if (included >> (mov & 63)) & 1])
+        # The attack maps change as moves are made, so the view keeps its own copy
+        return PackedResultSet(moves, locations, SQUARES, bb.attacks[:], bb.occupied[self._to_move])
 
     def legal_moves(self, pieces: List[Piece] = None) -> ResultSet:
         """legal_moves.
@@ -442,6 +634,10 @@ class Board():
         if not pieces: pieces = self.moving
         else: pieces = [i for i in pieces if i in self.moving]
 
+        if self._backend.bitboards:
+            moves, _ = bitboard.legal_moves(self._bb)
+            return self.__bb_result_set(moves, pieces)
+
         # Get psuedolegal moves for allied pieces
         psl = self.__psuedolegal_moves(pieces)
 
@@ -458,16 +654,44 @@ class Board():
     def calculate(self) -> None:
         """calculate.
         Should be called on every change of state.
-        Updates internal attributes used in calculation and rechecks the state of the game.
-        All the legal moves are redefined for the side moving and the win state is updated.
+        Rechecks the state of the game: all the legal moves are redefined for the side moving
+        and the win state is updated. In lazy mode this is deferred until one of them is read.
+        The location maps are kept up to date by `move` and `pop` rather than rebuilt here.
 
         :param self:
         :rtype: None
         """
-        self.__loc_map = { piece.position: piece for piece in self.moving + self.opposing if piece.is_active}
-        self.__piece_map = { piece: piece.position for piece in self.moving + self.opposing if piece.is_active}
+        if self._lazy:
+            self.__dirty = True
+            return
+        self.__evaluate()
 
-        self.__is_check = self.__evaluate_check()
+    def __evaluate(self) -> None:
+        """__evaluate.
+        Calculates the check state, legal moves and win state of the position.
+
+        :param self:
+        :rtype: None
+        """
+        # Cleared first so reads of the properties while evaluating see the values in progress
+        self.__dirty = False
+        if self._backend.bitboards:
+            # Repeated positions are served from the process-wide cache when it is enabled
+            move_cache = cache.active()
+            entry = move_cache.get(self._bb.key) if move_cache is not None else None
+            if entry is None:
+                moves, checkers = bitboard.legal_moves(self._bb)
+                if moves: win_state = WinState.cont
+                elif checkers: win_state = WinState.mate
+                else: win_state = WinState.stalemate
+                entry = (moves, checkers, win_state)
+                if move_cache is not None: move_cache.put(self._bb.key, entry)
+            moves, checkers, self.__win_state = entry
+            self.__is_check = [self.loc_map[SQUARES[sq]] for sq in bitboard.bits(checkers)]
+            self._allowed_moves = self.__bb_result_set(moves, self.moving)
+            return
+
+        self.__is_check, self.__pins = self.__king_threats()
 
         # Calculate the possible moves
         self._allowed_moves = self.legal_moves(self.moving)
@@ -487,23 +711,23 @@ class Board():
             castle_short = self._castle[0]
             castle_long  = self._castle[1]
 
-            king_start = Position("E1")
+            king_start = SQUARES[4] # E1
 
-            rook_short = Position("H1")
-            rook_long  = Position("A1")
+            rook_short = SQUARES[7] # H1
+            rook_long  = SQUARES[0] # A1
         else:
             castle_short = self._castle[2]
             castle_long  = self._castle[3]
 
-            king_start = Position("E8")
+            king_start = SQUARES[60] # E8
 
-            rook_short = Position("H8")
-            rook_long  = Position("A8")
+            rook_short = SQUARES[63] # H8
+            rook_long  = SQUARES[56] # A8
 
         if not (castle_short or castle_long):
             return []
 
-        if self.__is_check:
+        if self.is_check:
             return []
 
         king = self.__get_king()
@@ -525,8 +749,8 @@ class Board():
             if not isinstance(self.loc_map[rook], Rook):
                 continue
 
-            path = self.piece_map[king].path_to(rook)
-            path = [i for i in path if i != self.piece_map[king]]
+            # Squares strictly between the king and rook
+            path = [SQUARES[sq] for sq in bitboard.bits(BETWEEN[square_of(king_start)][square_of(rook)])]
             if [i for i in path if i in self.loc_map]:
                 continue
 
@@ -534,15 +758,10 @@ class Board():
             if [i for i in path if i in enemy_moves.all_valid + enemy_moves.all_attack]:
                 continue
 
-            final = [king_start.i, king_start.j]
             if rook.j == 0:
-                final[1] = final[1] - 2
+                valid.append(SQUARES[square_of(king_start) - 2])
             else:
-                final[1] = final[1] + 2
-
-            final = (final[0], final[1])
-                
-            valid.append(Position(final))
+                valid.append(SQUARES[square_of(king_start) + 2])
 
         return valid
 
@@ -561,8 +780,24 @@ class Board():
             log.error(f"{mov.start} does not appear as a piece in loc_map")
             return False
 
-        # Set the new position
+        # Mirror the move on the bitboards, removing any captured piece first. Whether the move
+        # captures is read from the bitboards rather than trusting `mov.takes`.
+        start_sq = (mov.start.i << 3) | mov.start.j
+        end_sq = (mov.end.i << 3) | mov.end.j
+        if (self._bb.occupied[self._to_move] >> end_sq) & 1:
+            log.error(f"{mov.end} is occupied by a piece of the side moving")
+            return False
+        takes = self._bb.mailbox[end_sq] != bitboard.EMPTY
+        if takes:
+            self._bb.remove(end_sq)
+        self._bb.move(start_sq, end_sq)
+
+        # Remove captured pieces so they dont remain forever.
         moving_piece = self.loc_map[mov.start]
+        if takes:
+            self.__update_piece(self.loc_map[mov.end], is_active=False)
+
+        # Set the new position
         self.__update_piece(moving_piece, new_position=mov.end)
 
         # Check if the move is a castle
@@ -578,42 +813,39 @@ class Board():
                 rook_end_j = 3
             else:
                 raise Exception()
-            rook = self.loc_map[Position((rook_i, rook_j))]
-            rook_end = Position((rook_i, rook_end_j))
+            rook = self.loc_map[SQUARES[(rook_i << 3) | rook_j]]
+            rook_end = SQUARES[(rook_i << 3) | rook_end_j]
             self.__update_piece(rook, rook_end)
+            self._bb.move((rook_i << 3) | rook_j, (rook_i << 3) | rook_end_j)
             if self._to_move:
-                self._castle[0] = False
-                self._castle[1] = False
+                self._bb.set_castle(0, False)
+                self._bb.set_castle(1, False)
             else:
-                self._castle[2] = False
-                self._castle[3] = False
-
-        # Remove captured pieces so they dont remain forever.
-        if mov.takes:
-            captured = self.loc_map[mov.end]
-            self.__update_piece(captured, is_active=False)
+                self._bb.set_castle(2, False)
+                self._bb.set_castle(3, False)
 
         if self._to_move:
             self._to_move = BLACK
         else:
             self._to_move = WHITE
             self._turn = self._turn + 1
+        self._opposition = not self._to_move
+        self._bb.switch_side()
 
         self.calculate()
         return True
 
 
-    def to_fen(self) -> str:
-        """to_fen.
-        Calculate the FEN string of the current state
+    def __placement(self) -> str:
+        """__placement.
+        Piece placement field of the FEN string, built from loc_map.
 
         :param self:
         :rtype: str
         """
-        fields = []
-        ranks = [["" for _ in range(8)] for _ in range(8)]
         # The rank of a piece will be calculated as 7 - i; 
         # In FEN the 8th rank (list index 7) is at i=0
+        ranks = [["" for _ in range(8)] for _ in range(8)]
         for position, piece in self.loc_map.items():
             symbol = piece.kind
             if piece.colour == BLACK: symbol = symbol.lower()
@@ -636,8 +868,92 @@ class Board():
                 new_rank.append(char)
             irreducable_ranks.append("".join(new_rank))
         
-        fields.append("/".join(irreducable_ranks))
-        
+        return "/".join(irreducable_ranks)
+
+    def push(self, mov: Move) -> bool:
+        """push.
+        Runs a move like `move`, but first stores an undo record so it can be taken back with `pop`.
+
+        :param self:
+        :param mov:
+        :type mov: Move
+        :rtype: bool
+        """
+        if mov.start not in self.loc_map:
+            log.error(f"{mov.start} does not appear as a piece in loc_map")
+            return False
+
+        # As in `move`, the captured piece is whatever stands on the destination
+        captured = self.loc_map.get(mov.end)
+        captured_index = self._bb.mailbox[(mov.end.i << 3) | mov.end.j]
+
+        rook = None
+        if mov.is_castle:
+            rook = self.loc_map[SQUARES[(mov.start.i << 3) | (7 if mov.is_castle == "short" else 0)]]
+
+        undo = Undo(mov, self.loc_map[mov.start], captured, captured_index, rook, self._castle[:],
+                    self._turn, self.__is_check, self.__pins, self.__win_state, self._allowed_moves, self.__dirty)
+        if not self.move(mov):
+            return False
+        self._history.append(undo)
+        return True
+
+    def pop(self) -> Move:
+        """pop.
+        Takes back the last move applied with `push` and returns it. The previous position
+        is restored from the undo record rather than being recalculated.
+
+        :param self:
+        :rtype: Move
+        """
+        if not self._history:
+            raise IndexError("There are no moves to pop")
+        undo = self._history.pop()
+        mov = undo.move
+
+        start_sq = (mov.start.i << 3) | mov.start.j
+        end_sq = (mov.end.i << 3) | mov.end.j
+        self._bb.move(end_sq, start_sq)
+        self.__update_piece(undo.moved, new_position=mov.start)
+
+        if undo.captured:
+            self._bb.put(end_sq, undo.captured_index)
+            self.__update_piece(undo.captured, is_active=True)
+
+        if undo.rook:
+            rook_i = mov.start.i
+            rook_j, rook_end_j = (7, 5) if mov.is_castle == "short" else (0, 3)
+            self._bb.move((rook_i << 3) | rook_end_j, (rook_i << 3) | rook_j)
+            self.__update_piece(undo.rook, new_position=SQUARES[(rook_i << 3) | rook_j])
+
+        # The castling list is shared with the bitboards, which also update the key
+        for right, allowed in enumerate(undo.castle):
+            self._bb.set_castle(right, allowed)
+        self._turn = undo.turn
+        self._to_move = not self._to_move
+        self._opposition = not self._to_move
+        self._bb.switch_side()
+
+        self.__is_check = undo.is_check
+        self.__pins = undo.pins
+        self.__win_state = undo.win_state
+        self._allowed_moves = undo.allowed_moves
+        self.__dirty = undo.dirty
+        return mov
+
+    def to_fen(self) -> str:
+        """to_fen.
+        Calculate the FEN string of the current state
+
+        :param self:
+        :rtype: str
+        """
+        fields = []
+        if self._backend.bitboards:
+            fields.append(self._bb.placement())
+        else:
+            fields.append(self.__placement())
+
         next_move = "w" if self._to_move == WHITE else 'b'
         fields.append(next_move)
 
@@ -654,6 +970,20 @@ class Board():
         fields.append(str(self._turn)) # Full move clock
         return " ".join(fields)
 
+    def to_planes(self, out=None):
+        """to_planes.
+        Encodes the position as uint8 planes of shape (17, 8, 8): the twelve piece boards
+        (white then black, in the order KQRNBP), side to move and the four castling rights.
+        See Chess.batch.planes.
+
+        :param self:
+        :param out: Array of shape (17, 8, 8) to write into, allocated if not given
+        :rtype: np.ndarray
+        """
+        # NumPy is only needed for the tensor encoding, so keep it out of the import of this module
+        from Chess.batch import pack_bitboards, planes
+        return planes(pack_bitboards([self._bb]), None if out is None else out[None])[0]
+
     @property
     def moving(self) -> List[Piece]:
         """moving.
@@ -710,6 +1040,41 @@ class Board():
         """
         return self.__piece_map
 
+    @property
+    def zobrist(self) -> int:
+        """zobrist.
+        64-bit Zobrist hash of the position (pieces, castling rights and side to move),
+        maintained incrementally as moves are made.
+
+        :param self:
+        :rtype: int
+        """
+        return self._bb.key
+
+    @property
+    def evaluation(self) -> int:
+        """evaluation.
+        Material and piece-square table score in centipawns, positive when white is ahead,
+        maintained incrementally as pieces are moved, captured and taken back.
+        See Chess.evaluation.
+
+        :param self:
+        :rtype: int
+        """
+        return self._bb.middlegame
+
+    @property
+    def tapered_evaluation(self) -> int:
+        """tapered_evaluation.
+        As `evaluation`, but blended from the middlegame towards the endgame tables (which
+        favour an active king and advanced pawns) as pieces come off the board.
+
+        :param self:
+        :rtype: int
+        """
+        bb = self._bb
+        return taper(bb.middlegame, bb.endgame, bb.phase)
+
     @property
     def turn(self) -> int:
         """turn.
@@ -722,14 +1087,17 @@ class Board():
 
     @property
     def is_check(self) -> List[Piece]:
+        if self.__dirty: self.__evaluate()
         return self.__is_check
 
     @property
     def is_mate(self) -> bool:
+        if self.__dirty: self.__evaluate()
         return self.__win_state == WinState.mate
     
     @property
     def is_stale(self) -> bool:
+        if self.__dirty: self.__evaluate()
         return self.__win_state == WinState.stalemate
     
     @property
@@ -750,16 +1118,21 @@ class Board():
         :param self:
         :rtype: ResultSet
         """
+        if self.__dirty: self.__evaluate()
         return self._allowed_moves
 
 
-def construct_board(fen):
+def construct_board(fen, lazy: bool = False, backend: Optional[str] = None):
     """construct_board.
     Used to mock a board from a FEN string.
 
     :param fen:
+    :param lazy: Construct the board in lazy mode
+    :type lazy: bool
+    :param backend: Move generation backend, see Chess.backends
+    :type backend: Optional[str]
     """
     params = pieces_from_fen(fen)
-    board = Board(*params)
+    board = Board(*params, lazy=lazy, backend=backend)
     return board
 
@@ -0,0 +1,251 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+import struct
+from typing import Iterable, List, Optional, Union
+import numpy as np
+from Chess.batch import CHUNK, POSITION_DTYPE, pack_fens
+from Chess.state import Board, construct_board
+
+# Fixed width binary storage for positions. A file is a 16 byte header followed by one 40 byte
+# record per position, so it can be memory mapped and indexed without parsing anything.
+#
+# board: 64 squares at 4 bits each, square sq in the low nibble of byte sq // 2 when sq is even
+#        and the high nibble when it is odd. 0 is an empty square, otherwise the Chess.bitboard
+#        board index + 1 (1-6 white KQRNBP, 7-12 black).
+# game:  index of the game the position came from
+# turn:  full move number
+# flags: bit 0 set when white is to move, bits 1-4 the castling rights KQkq
+
+RECORD_DTYPE = np.dtype([("board", "u1", (32,)), ("game", "<u4"), ("turn", "<u2"), ("flags", "u1"),
+                         ("reserved", "u1")])
+
+MAGIC = b"PYCHPOS1"
+_HEADER = struct.Struct("<8sII")  # magic, record size, reserved
+HEADER_SIZE = _HEADER.size
+
+_SYMBOLS = np.array(list(".KQRNBPkqrnbp"))
+
+
+def pack(positions: np.ndarray, games: Optional[np.ndarray] = None, turns: Optional[np.ndarray] = None) -> np.ndarray:
+    """pack.
+    Converts an array of Chess.batch.POSITION_DTYPE into records.
+
+    :param positions:
+    :type positions: np.ndarray
+    :param games: Game index of each position (0 if not given)
+    :type games: Optional[np.ndarray]
+    :param turns: Full move number of each position (1 if not given)
+    :type turns: Optional[np.ndarray]
+    :rtype: np.ndarray
+    """
+    n = len(positions)
+    boards = positions["boards"].astype("<u8").view(np.uint8).reshape(n, 12, 8)
+    bits = np.unpackbits(boards, axis=2, bitorder="little").reshape(n, 12, 64)
+    codes = (bits * np.arange(1, 13, dtype=np.uint8)[None, :, None]).sum(axis=1, dtype=np.uint8)
+
+    records = np.zeros(n, dtype=RECORD_DTYPE)
+    records["board"] = codes[:, 0::2] | (codes[:, 1::2] << 4)
+    records["game"] = 0 if games is None else games
+    records["turn"] = 1 if turns is None else turns
+    flags = positions["to_move"].astype(np.uint8)
+    for right in range(4):
+        flags |= positions["castle"][:, right].astype(np.uint8) << (right + 1)
+    records["flags"] = flags
+    return records
+
+
+def _codes(records: np.ndarray) -> np.ndarray:
+    """The (N, 64) square codes of some records."""
+    board = records["board"].reshape(-1, 32)
+    codes = np.empty((len(board), 64), dtype=np.uint8)
+    codes[:, 0::2] = board & 0x0F
+    codes[:, 1::2] = board >> 4
+    return codes
+
+
+def unpack(records: np.ndarray) -> np.ndarray:
+    """unpack.
+    Converts records back into an array of Chess.batch.POSITION_DTYPE, for use with the rest of
+    Chess.batch.
+
+    :param records:
+    :type records: np.ndarray
+    :rtype: np.ndarray
+    """
+    records = np.atleast_1d(records)
+    codes = _codes(records)
+    positions = np.zeros(len(records), dtype=POSITION_DTYPE)
+    for index in range(12):
+        bits = np.packbits(codes == index + 1, axis=1, bitorder="little")
+        positions["boards"][:, index] = bits.view("<u8")[:, 0]
+    positions["to_move"] = records["flags"] & 1
+    positions["castle"] = (records["flags"][:, None] >> np.arange(1, 5, dtype=np.uint8)) & 1
+    return positions
+
+
+def to_fen(record: np.void) -> str:
+    """to_fen.
+    FEN string of a single record, in the same form as Board.to_fen.
+
+    :param record:
+    :type record: np.void
+    :rtype: str
+    """
+    squares = _SYMBOLS[_codes(np.atleast_1d(record))[0]].reshape(8, 8)[::-1]
+    ranks = []
+    for row in squares:
+        rank, empty = "", 0
+        for symbol in row:
+            if symbol == ".":
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            rank += symbol
+        ranks.append(rank + (str(empty) if empty else ""))
+    flags = int(record["flags"])
+    castle = "".join(right for bit, right in enumerate("KQkq") if flags >> (bit + 1) & 1) or "-"
+    side = "w" if flags & 1 else "b"
+    return f"{'/'.join(ranks)} {side} {castle} - 0 {int(record['turn'])}"
+
+
+class PositionWriter:
+    """PositionWriter
+    Appends positions to a new position file. FENs are buffered and packed CHUNK at a time, use
+    as a context manager (or call `close`) to write the last of them.
+    """
+
+    __slots__ = ('path', 'count', '_file', '_fens', '_games')
+
+    def __init__(self, path: str) -> None:
+        """__init__.
+
+        :param self:
+        :param path: File to create (any existing file is replaced)
+        :type path: str
+        :rtype: None
+        """
+        self.path = path
+        self.count = 0
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, RECORD_DTYPE.itemsize, 0))
+        self._fens: List[str] = []
+        self._games: List[int] = []
+
+    def write(self, fen: str, game: int = 0) -> None:
+        """write.
+        Queues one position, given as a FEN string, and the index of its game.
+
+        :param self:
+        :param fen:
+        :type fen: str
+        :param game:
+        :type game: int
+        :rtype: None
+        """
+        self._fens.append(fen)
+        self._games.append(game)
+        if len(self._fens) >= CHUNK:
+            self.flush()
+
+    def write_records(self, records: np.ndarray) -> None:
+        """Writes records which are already packed, e.g. from `pack` or another store."""
+        self.flush()
+        self._file.write(np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes())
+        self.count += len(records)
+
+    def flush(self) -> None:
+        """Packs and writes the queued positions."""
+        if not self._fens:
+            return
+        turns = [int(fields[5]) if len(fields) > 5 else 1 for fields in map(str.split, self._fens)]
+        records = pack(pack_fens(self._fens), np.array(self._games), np.array(turns))
+        self._fens, self._games = [], []
+        self.write_records(records)
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "PositionWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PositionStore:
+    """PositionStore
+    Read only view of a position file. The records are memory mapped, so opening a file costs
+    nothing however many positions it holds. Indexing gives the records themselves (slices are
+    views of the file), `positions` converts them for Chess.batch and `fen`/`board` decode one.
+    """
+
+    __slots__ = ('path', 'records')
+
+    def __init__(self, path: str) -> None:
+        """__init__.
+
+        :param self:
+        :param path:
+        :type path: str
+        :rtype: None
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+            f.seek(0, 2)
+            size = f.tell()
+        if len(header) < HEADER_SIZE or _HEADER.unpack(header)[:2] != (MAGIC, RECORD_DTYPE.itemsize):
+            raise ValueError(f"{path} is not a position file")
+
+        n = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if n:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(n,))
+        else:
+            # Empty maps are not allowed
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[np.void, np.ndarray]:
+        return self.records[index]
+
+    def positions(self, index: Union[slice, np.ndarray] = slice(None)) -> np.ndarray:
+        """positions.
+        Unpacks the selected records into an array of Chess.batch.POSITION_DTYPE.
+
+        :param self:
+        :param index:
+        :type index: Union[slice, np.ndarray]
+        :rtype: np.ndarray
+        """
+        return unpack(self.records[index])
+
+    def fen(self, index: int) -> str:
+        return to_fen(self.records[index])
+
+    def board(self, index: int) -> Board:
+        """Builds a Board for one position."""
+        return construct_board(self.fen(index))
+
+
+def write_fens(path: str, fens: Iterable[str]) -> int:
+    """write_fens.
+    Writes a position file from FEN strings, numbering the games in order. Returns the number
+    of positions written.
+
+    :param path:
+    :type path: str
+    :param fens:
+    :type fens: Iterable[str]
+    :rtype: int
+    """
+    with PositionWriter(path) as writer:
+        for game, fen in enumerate(fens):
+            writer.write(fen, game)
+    return writer.count
@@ -0,0 +1,141 @@
+"""I, Ellis Lunnon, have read and understood the School's Academic Integrity Policy, as well as guidance relating to this
+module, and confirm that this submission complies with the policy. The content of this file is my own original work,
+with any significant material copied or adapted from other sources clearly indicated and attributed."""
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+from Chess.constants import BLACK, WHITE
+
+# Lookup tables built once at import time. Squares are indexed as (i << 3) | j (the same as
+# Position.__hash__) and every set of squares is a 64-bit integer with bit `sq` set.
+
+ROOK_DIRS = ((1, 0), (0, 1), (0, -1), (-1, 0))
+BISHOP_DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+QUEEN_DIRS = ROOK_DIRS + BISHOP_DIRS
+KNIGHT_JUMPS = ((1, 2), (1, -2), (2, 1), (2, -1), (-1, 2), (-1, -2), (-2, 1), (-2, -1))
+
+_Direction = Tuple[int, int]
+
+
+def _walk(sq: int, direction: _Direction) -> Tuple[int, ...]:
+    """Squares reached by repeatedly stepping in `direction` from `sq`, nearest first."""
+    di, dj = direction
+    i, j = (sq >> 3) + di, (sq & 7) + dj
+    squares = []
+    while 0 <= i < 8 and 0 <= j < 8:
+        squares.append((i << 3) | j)
+        i += di
+        j += dj
+    return tuple(squares)
+
+
+def _mask(squares: Iterable[int]) -> int:
+    mask = 0
+    for sq in squares:
+        mask |= 1 << sq
+    return mask
+
+
+def _leaper_table(jumps: Iterable[_Direction]) -> List[int]:
+    """The 64 attack sets of a piece which jumps by fixed offsets."""
+    table = []
+    for sq in range(64):
+        walks = [_walk(sq, jump) for jump in jumps]
+        table.append(_mask(walk[0] for walk in walks if walk))
+    return table
+
+
+# Every square reached along each direction (queen directions and knight jumps), nearest first.
+# Used by the reference ray walker in Board, which truncates them to a piece's move distance.
+RAY_SQUARES: Dict[_Direction, List[Tuple[int, ...]]] = {
+    direction: [_walk(sq, direction) for sq in range(64)] for direction in QUEEN_DIRS + KNIGHT_JUMPS
+}
+
+# The same rays for the sliding directions as bitboards
+RAYS: Dict[_Direction, List[int]] = {
+    direction: [_mask(squares) for squares in RAY_SQUARES[direction]] for direction in QUEEN_DIRS
+}
+
+# Whether a direction moves towards higher square indices, which decides if the nearest
+# blocker on a ray is its lowest or highest set bit
+POSITIVE: Dict[_Direction, bool] = {(di, dj): di > 0 or (di == 0 and dj > 0) for di, dj in QUEEN_DIRS}
+
+KNIGHT_ATTACKS = _leaper_table(KNIGHT_JUMPS)
+KING_ATTACKS = _leaper_table(QUEEN_DIRS)
+PAWN_ATTACKS = {
+    WHITE: _leaper_table(((1, 1), (1, -1))),
+    BLACK: _leaper_table(((-1, 1), (-1, -1))),
+}
+
+
+def _pair_tables() -> Tuple[List[List[int]], List[List[int]]]:
+    """Builds BETWEEN and LINE for every pair of squares."""
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        for direction in QUEEN_DIRS:
+            reverse = (-direction[0], -direction[1])
+            full = RAYS[direction][a] | RAYS[reverse][a] | (1 << a)
+            passed = 0
+            for b in RAY_SQUARES[direction][a]:
+                between[a][b] = passed
+                line[a][b] = full
+                passed |= 1 << b
+    return between, line
+
+
+# BETWEEN[a][b]: squares strictly between a and b, LINE[a][b]: the whole rank, file or diagonal
+# through both. Both are 0 when a and b do not share a line.
+BETWEEN, LINE = _pair_tables()
+
+
+def slide(sq: int, occ: int, dirs: Iterable[Tuple[int, int]]) -> int:
+    """slide.
+    Walks each direction from `sq` until the board edge or the first occupied
+    square (which is included, so blockers are reported as attacked). This is the ray
+    walking reference for the magic bitboard lookups in Chess.magic.
+
+    :param sq: Square of the sliding piece
+    :type sq: int
+    :param occ: Occupancy of the whole board
+    :type occ: int
+    :param dirs: Directions the piece moves in
+    :rtype: int
+    """
+    attacks = 0
+    for direction in dirs:
+        ray = RAYS[direction][sq]
+        blockers = ray & occ
+        if blockers:
+            # Cut the ray off past the nearest blocker
+            if POSITIVE[direction]: first = (blockers & -blockers).bit_length() - 1
+            else: first = blockers.bit_length() - 1
+            ray ^= RAYS[direction][first]
+        attacks |= ray
+    return attacks
+
+
+def _relevant_mask(sq: int, dirs: Iterable[_Direction]) -> int:
+    """Squares whose occupancy can change a slider's attacks from `sq` (its rays less the board edge)."""
+    return _mask(s for direction in dirs for s in RAY_SQUARES[direction][sq][:-1])
+
+
+# Relevant occupancy masks for magic bitboard lookups (see Chess.magic)
+ROOK_MASKS = [_relevant_mask(sq, ROOK_DIRS) for sq in range(64)]
+BISHOP_MASKS = [_relevant_mask(sq, BISHOP_DIRS) for sq in range(64)]
+
+
+def subsets(mask: int) -> Iterator[int]:
+    """subsets.
+    Every subset of the squares in `mask`, starting with the empty set
+    (the carry-rippler trick).
+
+    :param mask:
+    :type mask: int
+    :rtype: Iterator[int]
+    """
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if not subset:
+            return
@@ -0,0 +1,98 @@
+import pytest
+from types import SimpleNamespace
+from Chess import backends
+from Chess.coordinate import Move, Position
+from Chess.exceptions import BackendUnavailable
+from Chess.pieces import Bishop, King, Knight, Pawn, Queen, Rook
+from Chess.result import ResultKeys
+from Chess.state import Board, construct_board
+
+fen = "r1bqkb1r/ppp2ppp/2n5/1B1pp3/4n3/3P1N2/PPP2PPP/RNBQR1K1 b kq - 0 6"
+
+
+def test_default(monkeypatch):
+    monkeypatch.delenv(backends.ENV_VAR, raising=False)
+    assert Board()._backend.name == backends.DEFAULT == "bitboard"
+
+def test_environment(monkeypatch):
+    monkeypatch.setenv(backends.ENV_VAR, "python")
+    assert Board()._backend.name == "python"
+    # A backend given to the board wins over the environment
+    assert Board(backend="bitboard")._backend.name == "bitboard"
+
+def test_same_moves():
+    def moves(board):
+        return sorted((str(board.piece_map[p]), str(sq)) for p in board.moves for kind in (ResultKeys.passive, ResultKeys.capture) for sq in board.moves[p][kind])
+    assert moves(construct_board(fen, backend="python")) == moves(construct_board(fen, backend="bitboard"))
+
+def test_positions():
+    for name in backends.available():
+        board = construct_board(fen, backend=name)
+        assert all(type(position) is Position for position in board.loc_map)
+        assert all(type(sq) is Position for sq in board.moves.all_valid)
+
+def test_unknown():
+    with pytest.raises(ValueError):
+        Board(backend="quantum")
+
+def test_register():
+    backends.register("reference", lambda: backends.Backend("reference"))
+    try:
+        assert "reference" in backends.available()
+        assert construct_board(fen, backend="reference")._backend.bitboards is False
+    finally:
+        backends._loaders.pop("reference")
+        backends._loaded.pop("reference")
+
+def test_cpp_unavailable():
+    if "cpp" in backends.available():
+        pytest.skip("libpychess is installed")
+    with pytest.raises(BackendUnavailable):
+        Board(backend="cpp")
+
+
+class StubAnalyser:
+    """Stands in for libpychess.MoveAnalyser, finding the moves with the python backend."""
+    built = 0
+
+    def __init__(self, pieces):
+        StubAnalyser.built += 1
+        self.pieces = pieces
+
+    def PsuedolegalMoves(self, colour):
+        board = Board(([p for p in self.pieces if p.colour], [p for p in self.pieces if not p.colour]),
+                      to_move=colour, can_castle="-", lazy=True, backend="python")
+        results = board._Board__py_psuedolegal_moves(board.moving)
+        return {piece: dict(result.items()) for piece, result in results.items()}
+
+stub = SimpleNamespace(
+    MoveAnalyser=StubAnalyser,
+    pieces=SimpleNamespace(king=King, queen=Queen, rook=Rook, knight=Knight, bishop=Bishop, pawn=Pawn),
+)
+
+@pytest.fixture
+def native():
+    backends.register("stub", lambda: backends.Backend("stub", native=stub))
+    StubAnalyser.built = 0
+    yield
+    backends._loaders.pop("stub")
+    backends._loaded.pop("stub", None)
+
+def test_native_analyser_per_position(native):
+    board = construct_board(fen, backend="stub")
+    assert StubAnalyser.built == 1
+    for start, end in (("C8", "G4"), ("D3", "E4"), ("D5", "E4")):
+        before = StubAnalyser.built
+        assert board.move(Move(Position(start), Position(end), False))
+        assert StubAnalyser.built == before + 1
+
+def test_native_lifted_king(native):
+    # The king may not step back along the checking rook's file, which the analyser only sees
+    # past the king once it is masked out
+    check = "4r2k/8/8/8/8/8/4K3/8 w - - 0 1"
+    moves = construct_board(check, backend="stub").moves
+    assert Position("E1") not in moves.all_valid
+    assert StubAnalyser.built == 1
+    for position in (check, fen):
+        assert sorted(map(str, construct_board(position, backend="stub").moves.all_valid)) == \
+            sorted(map(str, construct_board(position, backend="bitboard").moves.all_valid))
@@ -0,0 +1,87 @@
+from collections import Counter
+import numpy as np
+from Chess.batch import ANALYSIS_DTYPE, CHECK, MATE, PLANES, STALEMATE, analyse, encode_fens, legal_destinations, pack_bitboards, pack_fens, planes, pseudo_legal_destinations
+from Chess.bitboard import legal_moves
+from Chess.perft import SUITE
+from Chess.state import construct_board
+
+fens = [fen for _, fen, _ in SUITE] + [
+    "4k3/8/8/8/1b6/8/3N4/4K3 w - - 0 1",  # knight pinned
+    "4k3/8/8/8/1b6/8/3P4/4K2R w K - 0 1",  # pawn pinned, castling allowed
+    "4k3/8/8/8/7b/8/8/4K2R w K - 0 1",  # castling through an attacked square
+    "4k3/8/8/8/4r3/3n4/8/4K3 w - - 0 1",  # double check
+    "4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1",  # rook pinned along its file
+    "r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1",
+]
+
+
+def expected(fen):
+    counts = np.zeros(64, dtype=np.uint8)
+    for sq, n in Counter(hash(pos) for pos in construct_board(fen).moves.all_valid).items():
+        counts[sq] = n
+    return counts
+
+
+def test_matches_board():
+    destinations = legal_destinations(fens)
+    assert destinations.shape == (len(fens), 64)
+    for fen, row in zip(fens, destinations):
+        assert (row == expected(fen)).all(), fen
+
+def test_start_position():
+    row = legal_destinations([SUITE[0][1]])[0]
+    assert row.sum() == 20
+    assert row[19] == 1 and row[18] == 2  # d3 (pawn), c3 (pawn and knight)
+
+def test_double_check():
+    row = legal_destinations(["4k3/8/8/8/4r3/3n4/8/4K3 w - - 0 1"])[0]
+    assert set(np.nonzero(row)[0]) == {3, 5, 11}  # d1, f1 and d2 with the king
+
+def test_pack_bitboards():
+    board = construct_board(SUITE[1][1])
+    packed = pack_bitboards([board._bb])
+    assert packed.tobytes() == pack_fens([SUITE[1][1]]).tobytes()
+    assert legal_destinations(packed).sum() == len(legal_moves(board._bb)[0])
+
+def test_pseudo_legal():
+    # The pinned knight moves and the king may step into check, castling is not counted
+    pinned, castle = pseudo_legal_destinations(["4k3/8/8/8/1b6/8/3N4/4K3 w - - 0 1",
+                                                "4k3/8/8/8/7b/8/8/4K2R w K - 0 1"])
+    assert pinned.sum() == 6 + 4
+    assert castle.sum() == 5 + 5
+
+def test_to_planes():
+    board = construct_board(SUITE[1][1])
+    encoded = board.to_planes()
+    assert encoded.shape == (PLANES, 8, 8) and encoded.dtype == np.uint8
+    for position, piece in board.loc_map.items():
+        index = "KQRNBP".index(piece.kind) + (0 if piece.colour else 6)
+        assert encoded[index, position.i, position.j] == 1
+    assert encoded[:12].sum() == len(board.loc_map)
+    assert encoded[12].all() and encoded[13:].all()
+
+def test_encode_fens(tmp_path):
+    out = np.lib.format.open_memmap(tmp_path / "planes.npy", mode="w+", dtype=np.uint8,
+                                    shape=(len(fens), PLANES, 8, 8))
+    assert encode_fens(iter(fens), out) == len(fens)
+    for fen, encoded in zip(fens, out):
+        assert (encoded == construct_board(fen).to_planes()).all()
+    assert (planes(fens) == out).all()
+
+def test_analyse():
+    positions = ["4k3/8/8/8/8/8/5PPP/r5K1 w - - 0 1",  # back rank mate
+                 "7k/5Q2/6K1/8/8/8/8/8 b - - 0 1",  # stalemate
+                 "4k3/8/8/8/8/8/8/4K2r w - - 0 1",  # check
+                 SUITE[0][1]]
+    result = analyse(positions)
+    assert result.dtype == ANALYSIS_DTYPE and result.flags["C_CONTIGUOUS"]
+    assert list(result["flags"]) == [CHECK | MATE, STALEMATE, CHECK, 0]
+    assert (result["destinations"] == legal_destinations(positions)).all()
+    for fen, flags in zip(positions, result["flags"]):
+        board = construct_board(fen)
+        assert bool(board.is_check) == bool(flags & CHECK)
+        assert board.is_mate == bool(flags & MATE) and board.is_stale == bool(flags & STALEMATE)
+
+def test_analyse_threads(monkeypatch):
+    monkeypatch.setattr("Chess.batch.CHUNK", 2)
+    assert (analyse(fens, threads=3) == analyse(fens)).all()
@@ -0,0 +1,112 @@
+import pytest
+from Chess.bitboard import Bitboards, legal_moves, between, bits, king_threats, KING, ROOK, EMPTY, MOVE_CASTLE
+from Chess.constants import WHITE, BLACK, ResultKeys
+from Chess.helpers import new_game
+from Chess.coordinate import Move
+from Chess.state import Board, construct_board
+
+start_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+checkmate_fen = "r1bQkbnr/1pp1pppp/8/8/p3p3/N3B3/PP3PPP/3RKBNR b KQkq - 0 8"
+pinned_knight_fen = "r1bqkbnr/pppp1ppp/8/4n3/8/4Q3/PPPPPPPP/RNB1KBNR b KQkq - 0 1"
+white_can_castle_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1"
+kiwipete_fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_from_pieces():
+    white, black = new_game()
+    bb = Bitboards.from_pieces(white + black)
+    assert bb.occupied[WHITE] == 0xFFFF
+    assert bb.occupied[BLACK] == 0xFFFF << 48
+    assert bb.mailbox[4] == KING
+    assert bb.mailbox[63] == ROOK + 6
+    assert bb.mailbox[32] == EMPTY
+
+def test_placement():
+    board = Board()
+    assert board._bb.placement() == start_fen.split(" ")[0]
+
+def test_move():
+    bb = Board()._bb
+    bb.move(12, 28)
+    assert bb.placement() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR"
+
+def test_between():
+    assert list(bits(between(0, 63))) == [9, 18, 27, 36, 45, 54]
+    assert list(bits(between(4, 7))) == [5, 6]
+    assert between(0, 17) == 0
+
+def test_start_moves():
+    moves, checkers = legal_moves(Board()._bb)
+    assert len(moves) == 20
+    assert checkers == 0
+
+def test_kiwipete_moves():
+    moves, _ = legal_moves(construct_board(kiwipete_fen)._bb)
+    assert len(moves) == 48
+    assert len([m for m in moves if m & MOVE_CASTLE]) == 2
+
+def test_pinned_knight():
+    board = construct_board(pinned_knight_fen)
+    knight = [p for p in board.moves if str(board.piece_map[p]) == "E5"].pop()
+    assert not board.moves[knight].has_valid
+
+def test_checkmate():
+    board = construct_board(checkmate_fen)
+    assert board.is_check
+    assert board.is_mate
+
+def test_king_threats():
+    checkers, pinned = king_threats(construct_board(pinned_knight_fen)._bb, BLACK)
+    assert checkers == 0
+    # The E5 knight is pinned by the E3 queen, its line runs from the king to the queen
+    assert pinned == {36: (1 << 52) | (1 << 44) | (1 << 36) | (1 << 28) | (1 << 20)}
+    checkers, pinned = king_threats(construct_board(checkmate_fen)._bb, BLACK)
+    assert list(bits(checkers)) == [59]
+    assert pinned == {}
+
+def test_no_pin_through_two_pieces():
+    board = construct_board("r1bqkb1r/ppp2ppp/2n5/1B1pp3/4n3/3P1N2/PPP2PPP/RNBQR1K1 b kq - 0 6")
+    # The E4 knight and E5 pawn both stand between the E1 rook and the king, so neither is
+    # pinned, while the C6 knight is pinned by the B5 bishop
+    assert king_threats(board._bb, BLACK)[1] == {42: (1 << 51) | (1 << 42) | (1 << 33)}
+
+def test_king_cannot_retreat_along_check():
+    board = construct_board("8/5pk1/Q5b1/1p6/7q/8/5PPK/8 w - - 0 40")
+    assert board.is_check
+    assert "H1" not in [str(i) for i in board.moves.all_valid]
+
+def test_castle_moves():
+    board = construct_board(white_can_castle_fen)
+    king = [p for p in board.moves if p.kind == "K"].pop()
+    assert {"C1", "G1"} <= {str(i) for i in board.moves[king][ResultKeys.passive]}
+
+@pytest.mark.parametrize('fen', [start_fen, checkmate_fen, pinned_knight_fen, kiwipete_fen])
+def test_fen_roundtrip(fen):
+    board = construct_board(fen)
+    assert board.to_fen() == fen
+
+def test_attack_counts():
+    bb = Board()._bb
+    # F3 is covered by the G1 knight and the E2 and G2 pawns
+    assert bb.attack_count(21, WHITE) == 3
+    assert bb.attack_count(21, BLACK) == 0
+    assert bb.is_attacked(45, BLACK)
+
+def test_attack_maps_incremental():
+    board = construct_board(kiwipete_fen)
+    seen = 0
+    for piece in list(board.moves):
+        for end in board.moves[piece][ResultKeys.capture] + board.moves[piece][ResultKeys.passive]:
+            start = board.piece_map[piece]
+            castle = ""
+            if piece.kind == "K" and abs(end.j - start.j) == 2:
+                castle = "short" if end.j == 6 else "long"
+            board.push(Move(start, end, end in board.loc_map, castle))
+            bb = board._bb
+            attacks, attackers = bb.attacks[:], bb.attackers[:]
+            bb.refresh_attacks()
+            assert attacks == bb.attacks and attackers == bb.attackers
+            board.pop()
+            seen += 1
+    assert seen == 48
+    assert board.to_fen() == kiwipete_fen
@@ -1,4 +1,6 @@
 import pytest
+from Chess.constants import ResultKeys
+from Chess.coordinate import Move, Position
 from Chess.state import Board, construct_board
 
 fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
@@ -58,3 +60,118 @@ def test_pawn_capture_valid():
 
 def test_pawn_capture_invalid():
     ...
+
+def test_push_pop():
+    board = Board()
+    board.push(Move(Position("E2"), Position("E4"), False))
+    assert board.to_fen() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    board.pop()
+    assert board.to_fen() == fen
+    assert len(board.moves.all_valid) == 20
+
+def test_push_pop_capture():
+    board = construct_board(Nf3)
+    board.push(Move(Position("D7"), Position("D5"), False))
+    board.push(Move(Position("E4"), Position("D5"), True))
+    assert board.to_fen().startswith("rnbqkbnr/pp2pppp/8/2pP4/8/5N2/PPPP1PPP/RNBQKB1R b")
+    board.pop()
+    board.pop()
+    assert board.to_fen() == construct_board(Nf3).to_fen()
+    assert len(board.moves.all_valid) == len(construct_board(Nf3).moves.all_valid)
+
+def test_push_pop_castle():
+    castle_fen = "r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1"
+    board = construct_board(castle_fen)
+    board.push(Move(Position("E1"), Position("G1"), False, "short"))
+    assert board.to_fen() == "r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R4RK1 b kq - 0 1"
+    board.pop()
+    assert board.to_fen() == castle_fen
+
+def test_pop_empty():
+    with pytest.raises(IndexError):
+        Board().pop()
+
+def test_zobrist_transposition():
+    a = Board()
+    for start, end in [("G1", "F3"), ("G8", "F6"), ("B1", "C3")]:
+        a.move(Move(Position(start), Position(end), False))
+    b = Board()
+    for start, end in [("B1", "C3"), ("G8", "F6"), ("G1", "F3")]:
+        b.move(Move(Position(start), Position(end), False))
+    assert a.zobrist == b.zobrist
+    assert a.zobrist == construct_board(a.to_fen()).zobrist
+    assert a.zobrist != Board().zobrist
+
+def test_zobrist_push_pop():
+    board = construct_board("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
+    key = board.zobrist
+    board.push(Move(Position("E1"), Position("C1"), False, "long"))
+    assert board.zobrist == board._bb.compute_key()
+    assert board.zobrist != key
+    board.pop()
+    assert board.zobrist == key
+
+def test_lazy():
+    eager = Board()
+    lazy = Board(lazy=True)
+    for start, end in [("E2", "E4"), ("F7", "F6"), ("D1", "H5")]:
+        eager.move(Move(Position(start), Position(end), False))
+        lazy.move(Move(Position(start), Position(end), False))
+    assert lazy._Board__dirty
+    assert len(lazy.is_check) == len(eager.is_check) == 1
+    assert not lazy._Board__dirty
+    assert sorted(map(str, lazy.moves.all_valid)) == sorted(map(str, eager.moves.all_valid))
+    assert lazy.is_mate == eager.is_mate
+
+def test_lazy_push_pop():
+    board = Board(lazy=True)
+    board.push(Move(Position("E2"), Position("E4"), False))
+    board.push(Move(Position("E7"), Position("E5"), False))
+    assert len(board.moves.all_valid) == 29
+    board.pop()
+    assert board.to_fen() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    assert sorted(map(str, board.moves.all_valid)) == sorted(map(str, construct_board(board.to_fen()).moves.all_valid))
+    board.pop()
+    assert len(board.moves.all_valid) == 20
+
+def test_reference_king_threats():
+    board = construct_board("r1bqkb1r/ppp2ppp/2n5/1B1pp3/4n3/3P1N2/PPP2PPP/RNBQR1K1 b kq - 0 6", backend="python")
+    knights = {str(board.piece_map[p]): p for p in board.moves if p.kind == "N"}
+    # E4 is not pinned since E5 also stands in front of the king, C6 is pinned by the B5 bishop
+    e4 = board.moves[knights["E4"]]
+    assert len(e4[ResultKeys.passive] + e4[ResultKeys.capture]) == 8
+    assert not board.moves[knights["C6"]].has_valid
+
+def test_maps_updated_in_place():
+    board = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    loc_map = board.loc_map
+    before = dict(loc_map)
+    board.push(Move(Position("E5"), Position("F7"), True))
+    board.push(Move(Position("E8"), Position("C8"), False, "long"))
+    board.push(Move(Position("E1"), Position("G1"), False, "short"))
+    assert board.loc_map is loc_map
+    assert loc_map == {p.position: p for p in board.all_pieces}
+    assert board.piece_map == {p: p.position for p in board.all_pieces}
+    for _ in range(3):
+        board.pop()
+    assert loc_map == before
+    assert board.piece_map == {p: p.position for p in board.all_pieces}
+
+def test_move_capture_without_takes():
+    # The capture is taken from the board, not from Move.takes
+    board = construct_board("4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1", lazy=True)
+    assert board.push(Move(Position("D1"), Position("D5"), False))
+    after = construct_board("4k3/8/8/3R4/8/8/8/4K3 b - - 0 1")
+    assert board.to_fen() == after.to_fen()
+    assert board.zobrist == board._bb.compute_key() == after.zobrist
+    assert board.evaluation == after.evaluation
+    board.pop()
+    assert board.to_fen() == "4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1"
+    assert board.zobrist == board._bb.compute_key()
+
+def test_move_onto_own_piece():
+    board = construct_board("4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1", lazy=True)
+    key = board.zobrist
+    assert not board.move(Move(Position("D1"), Position("E1"), False))
+    assert board.zobrist == key
+    assert board.to_fen() == "4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1"
@@ -0,0 +1,44 @@
+from Chess import cache
+from Chess.cache import MoveCache
+from Chess.coordinate import Move, Position
+from Chess.state import Board
+
+
+def test_lru_eviction():
+    c = MoveCache(max_entries=2)
+    c.put(1, ((), 0, 1))
+    c.put(2, ((), 0, 1))
+    assert c.get(1) is not None
+    c.put(3, ((), 0, 1))
+    assert 2 not in c
+    assert 1 in c and 3 in c
+    assert c.evictions == 1
+
+def test_byte_budget():
+    c = MoveCache(max_entries=None, max_bytes=3 * MoveCache.sizeof((tuple(range(20)), 0, 1)))
+    for key in range(10):
+        c.put(key, (tuple(range(20)), 0, 1))
+    assert len(c) == 3
+    assert c.nbytes <= c.max_bytes
+
+def test_counters():
+    c = MoveCache()
+    assert c.get(1) is None
+    c.put(1, ((), 0, 1))
+    assert c.get(1) == ((), 0, 1)
+    assert (c.hits, c.misses) == (1, 1)
+    assert c.hit_rate == 0.5
+
+def test_board_uses_cache():
+    c = cache.enable(max_entries=100)
+    try:
+        Board()
+        Board()
+        assert c.hits == 1 and c.misses == 1
+        board = Board()
+        board.move(Move(Position("G1"), Position("F3"), False))
+        assert len(board.moves.all_valid) == 20
+        assert board.zobrist in c
+    finally:
+        cache.disable()
+    assert cache.active() is None
@@ -0,0 +1,21 @@
+from Chess.coordinate import Position as pypos
+from Chess.coordinate import Vec
+
+def test_interned_py():
+    p = pypos.of(1, 4)
+    assert p is pypos.of(1, 4)
+    assert p is pypos.from_index(12)
+    assert p is pypos.from_algebraic("E2")
+    assert p == pypos("E2")
+    assert hash(p) == 12
+
+def test_interned_off_board_py():
+    p = pypos.of(8, 0)
+    assert not p.is_valid()
+    assert p is not pypos.of(8, 0)
+
+def test_interned_arithmetic_py():
+    p = pypos.of(1, 4)
+    assert p + Vec(1, 0) is pypos.of(2, 4)
+    assert p - Vec(1, 1) is pypos.of(0, 3)
+    assert all(q is pypos.of(q.i, q.j) for q in p.path_to(pypos.of(5, 4)))
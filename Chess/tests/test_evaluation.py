@@ -0,0 +1,67 @@
+import random
+from Chess.bitboard import legal_moves
+from Chess.coordinate import Move, Position
+from Chess.evaluation import TOTAL_PHASE, evaluate, taper
+from Chess.state import Board, construct_board, move_from_packed
+
+kiwipete = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+def test_start():
+    board = Board()
+    assert board.evaluation == 0
+    assert board.tapered_evaluation == 0
+    assert board._bb.phase == TOTAL_PHASE
+
+def test_move():
+    board = Board()
+    board.move(Move(Position("E2"), Position("E4"), False))
+    # The pawn's table value goes from -20 on e2 to +20 on e4
+    assert board.evaluation == 40
+    board.move(Move(Position("E7"), Position("E5"), False))
+    assert board.evaluation == 0
+
+def test_capture():
+    board = construct_board("4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1")
+    before = board.evaluation
+    board.push(Move(Position("D1"), Position("D5"), True))
+    assert board.evaluation - before >= 900
+    board.pop()
+    assert board.evaluation == before
+
+def test_mirrored():
+    white = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    black = construct_board("r3k2r/pppbbppp/2n2q1P/1P2p3/3pn3/BN2PNP1/P1PPQPB1/R3K2R b KQkq - 0 1")
+    assert white.evaluation == -black.evaluation
+    assert white.tapered_evaluation == -black.tapered_evaluation
+
+def test_incremental():
+    rng = random.Random(1)
+    board = construct_board(kiwipete, lazy=True)
+    for _ in range(60):
+        moves, _ = legal_moves(board._bb)
+        if not moves:
+            break
+        board.push(move_from_packed(rng.choice(moves)))
+        assert (board._bb.middlegame, board._bb.endgame, board._bb.phase) == evaluate(board._bb.mailbox)
+    while board._history:
+        board.pop()
+    assert board.evaluation == construct_board(kiwipete).evaluation
+
+def test_make_unmake():
+    bb = construct_board(kiwipete)._bb
+    before = (bb.middlegame, bb.endgame, bb.phase)
+    for mov in legal_moves(bb)[0]:
+        undo = bb.make(mov)
+        assert (bb.middlegame, bb.endgame, bb.phase) == evaluate(bb.mailbox)
+        bb.unmake(mov, undo)
+        assert (bb.middlegame, bb.endgame, bb.phase) == before
+
+def test_tapered():
+    assert taper(100, 0, TOTAL_PHASE) == 100
+    assert taper(100, 0, 0) == 0
+    assert taper(100, 0, TOTAL_PHASE // 2) == 50
+    # Kings and pawns only, so entirely the endgame tables
+    board = construct_board("8/4k3/8/8/3P4/8/8/4K3 w - - 0 1")
+    assert board._bb.phase == 0
+    assert board.tapered_evaluation == board._bb.endgame
+    assert board.tapered_evaluation != board.evaluation
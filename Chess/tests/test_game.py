@@ -0,0 +1,27 @@
+import pytest
+from Chess.game import Game
+from Chess.state import Board, construct_board
+
+ruy_lopez = "e4 e5 Nf3 Nc6 Bb5 a6 Ba4 Nf6 O-O Be7 Re1 b5 Bb3 d6 c3 O-O h3 Nb8 d4 Nbd7".split()
+ruy_lopez_fen = "r1bq1rk1/2pnbppp/p2p1n2/1p2p3/3PP3/1BP2N1P/PP3PP1/RNBQR1K1 w - - 0 11"
+
+
+@pytest.mark.parametrize('verify', [False, True])
+def test_replay(verify):
+    board = Game().replay(ruy_lopez, verify=verify)
+    assert isinstance(board, Board)
+    assert board.to_fen() == ruy_lopez_fen
+
+def test_replay_bad_move():
+    assert Game().replay(["e4", "e5", "Ke3"]) == 2
+    assert Game().replay(["e4", "e5", "Ke3"], verify=True) == 2
+
+def test_replay_pinned_candidate():
+    # Both knights can reach D2, but the F3 knight is pinned to the king by the D5 bishop
+    board = Game(start_state=construct_board("4k3/8/8/3b4/8/5N2/8/1N5K w - - 0 1")).replay(["Nd2"])
+    assert board.to_fen().startswith("4k3/8/8/3b4/8/5N2/3N4/7K b")
+
+def test_replay_disambiguation():
+    board = Game(start_state=construct_board("4k3/8/8/8/8/5N2/8/1N5K w - - 0 1")).replay(["Nfd2"])
+    assert board.to_fen().startswith("4k3/8/8/8/8/8/3N4/1N5K b")
+    assert Game(start_state=construct_board("4k3/8/8/8/8/5N2/8/1N5K w - - 0 1")).replay(["Nd2"]) == 0
@@ -0,0 +1,53 @@
+import random
+from Chess.magic import bishop_attacks, queen_attacks, rook_attacks
+from Chess.tables import BISHOP_DIRS, BISHOP_MASKS, ROOK_DIRS, ROOK_MASKS, slide, subsets
+
+# Reference walker, independent of Chess.tables (which the magic tables are built from):
+# steps one square at a time by (rank, file) until it leaves the board or hits a piece.
+ROOK_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_STEPS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+def walk(sq, occ, steps):
+    attacks = 0
+    for di, dj in steps:
+        i, j = sq // 8 + di, sq % 8 + dj
+        while 0 <= i < 8 and 0 <= j < 8:
+            attacks |= 1 << (i * 8 + j)
+            if occ & (1 << (i * 8 + j)):
+                break
+            i, j = i + di, j + dj
+    return attacks
+
+def test_walk():
+    # a1 rook on an empty board sees the a file and first rank, blocked by a piece on a4
+    assert walk(0, 0, ROOK_STEPS) == 0x01010101010101FE
+    assert walk(0, 1 << 24, ROOK_STEPS) == 0x010101FE
+    assert walk(0, 0, BISHOP_STEPS) == 0x8040201008040200
+
+def test_rook_exhaustive():
+    for sq in range(64):
+        for occ in subsets(ROOK_MASKS[sq]):
+            assert rook_attacks(sq, occ) == walk(sq, occ, ROOK_STEPS), (sq, occ)
+
+def test_bishop_exhaustive():
+    for sq in range(64):
+        for occ in subsets(BISHOP_MASKS[sq]):
+            assert bishop_attacks(sq, occ) == walk(sq, occ, BISHOP_STEPS), (sq, occ)
+
+def test_no_collisions():
+    # Every relevant occupancy maps to the attacks the tables were generated from
+    for sq in range(64):
+        for occ in subsets(ROOK_MASKS[sq]):
+            assert rook_attacks(sq, occ) == slide(sq, occ, ROOK_DIRS), (sq, occ)
+        for occ in subsets(BISHOP_MASKS[sq]):
+            assert bishop_attacks(sq, occ) == slide(sq, occ, BISHOP_DIRS), (sq, occ)
+
+def test_irrelevant_occupancy():
+    # Pieces on the board edge or off the slider's lines must not change the lookup
+    rng = random.Random(1)
+    for _ in range(2000):
+        sq = rng.randrange(64)
+        occ = rng.getrandbits(64) & rng.getrandbits(64)
+        assert rook_attacks(sq, occ) == walk(sq, occ, ROOK_STEPS)
+        assert bishop_attacks(sq, occ) == walk(sq, occ, BISHOP_STEPS)
+        assert queen_attacks(sq, occ) == walk(sq, occ, ROOK_STEPS + BISHOP_STEPS)
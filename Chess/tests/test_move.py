@@ -0,0 +1,35 @@
+from Chess.bitboard import legal_moves
+from Chess.coordinate import Move, Position
+from Chess.state import construct_board, move_from_packed
+
+kiwipete_fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_init():
+    m = Move(Position("E2"), Position("E4"), False)
+    assert m.start == Position("E2")
+    assert m.end == Position("E4")
+    assert not m.takes
+    assert not m.is_castle
+
+def test_slots():
+    m = Move(Position("E2"), Position("E4"), False)
+    assert not hasattr(m, "__dict__")
+
+def test_eq():
+    assert Move(Position("E2"), Position("E4"), False) == Move(Position("E2"), Position("E4"), False)
+    assert Move(Position("E2"), Position("E4"), False) != Move(Position("E2"), Position("E3"), False)
+    assert len({Move(Position("E2"), Position("E4"), False), Move(Position("E2"), Position("E4"), False)}) == 1
+
+def test_to_int():
+    assert Move(Position("E2"), Position("E4"), False).to_int() == 12 | 28 << 6
+    assert Move(Position("E1"), Position("G1"), False, "short").to_int() == 4 | 6 << 6 | 1 << 13
+
+def test_round_trip():
+    moves, _ = legal_moves(construct_board(kiwipete_fen)._bb)
+    for packed in moves:
+        move = Move.from_int(packed)
+        assert move.to_int() == packed
+        assert move == move_from_packed(packed)
+        assert Move.from_int(move.to_int()) == move
+    assert {Move.from_int(m).is_castle for m in moves} == {"", "short", "long"}
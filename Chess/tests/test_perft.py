@@ -0,0 +1,41 @@
+import pytest
+from Chess.bitboard import legal_moves
+from Chess.perft import BACKENDS, SUITE, available, describe, perft
+from Chess.state import construct_board
+
+cases = [(fen, depth, count) for _, fen, expected in SUITE for depth, count in expected.items() if count < 10000]
+
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+@pytest.mark.parametrize('fen,depth,count', cases)
+def test_suite(backend, fen, depth, count):
+    if not available(backend):
+        pytest.skip(f"the {backend} backend is not available")
+    counts, _ = perft(fen, depth, backend)
+    assert sum(counts.values()) == count
+
+def test_hash_table():
+    fen, depth, count = cases[2]
+    counts, _ = perft(fen, depth, hash_entries=1000)
+    assert sum(counts.values()) == count
+
+def test_describe(monkeypatch):
+    assert describe("bitboard") == "bitboard"
+    assert describe("python") == "board (python)"
+    monkeypatch.setenv("PYCHESS_BACKEND", "python")
+    assert describe("board") == "board (python)"
+
+def test_divide():
+    counts, _ = perft(SUITE[0][1], 2)
+    assert len(counts) == 20
+    assert counts["g1f3"] == 20
+
+def test_make_unmake():
+    board = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    bb = board._bb
+    before = (bb.key, bb.boards[:], bb.mailbox[:], bb.castle[:], bb.attacks[:])
+    for mov in legal_moves(bb)[0]:
+        undo = bb.make(mov)
+        assert bb.key == bb.compute_key()
+        bb.unmake(mov, undo)
+        assert (bb.key, bb.boards, bb.mailbox, bb.castle, bb.attacks) == before
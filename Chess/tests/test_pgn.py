@@ -0,0 +1,51 @@
+from Chess.pgn import PGNReader, movetext_tokens, read_games
+
+PGN = """[Event "Rated Blitz game"]
+[White "A \\"quoted\\" name"]
+[Result "1-0"]
+
+1. e4 { [%clk 0:03:00] } 1... e5 { [%clk 0:03:00] } 2. Nf3!? $1 (2. f4 exf4 (2... d5) 3. Nf3) 2... Nc6
+3. Bb5 { a comment spanning
+[%clk 0:02:50] two lines } a6 ; rest of line { comment
+4. Ba4 Nf6 5. O-O Be7 6. Qxe7+?? Kxe7 1-0
+
+[Event "Second"]
+[Result "*"]
+1.d4 d5 2.c4 *
+[Event "No moves"]
+[Result "*"]
+
+*
+"""
+
+
+def write(tmp_path, text=PGN):
+    path = tmp_path / "games.pgn"
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def test_headers_and_moves(tmp_path):
+    games = list(read_games(write(tmp_path)))
+    assert len(games) == 3
+    headers, moves = games[0]
+    assert headers == {"Event": "Rated Blitz game", "White": 'A "quoted" name', "Result": "1-0"}
+    assert moves == ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O", "Be7", "Qxe7+", "Kxe7"]
+    assert games[1] == ({"Event": "Second", "Result": "*"}, ["d4", "d5", "c4"])
+    assert games[2][1] == []
+
+def test_movetext_tokens():
+    assert movetext_tokens(b"1. e4 (1. d4 (1. c4) 1... d5) 1... e5 $2 2. Nf3 {2. Nc3} 0-1") == ["e4", "e5", "Nf3"]
+    assert movetext_tokens(b"1. e4 e5 2. Nf3 (2. f4 exf4") == ["e4", "e5", "Nf3"]
+    assert movetext_tokens(b"1/2-1/2") == []
+
+def test_throughput(tmp_path):
+    path = write(tmp_path, PGN * 10)
+    reader = PGNReader(path)
+    assert sum(1 for _ in reader) == 30
+    assert reader.games == 30
+    assert reader.bytes_read == len((PGN * 10).encode("utf-8"))
+    assert reader.mb_per_second > 0
+
+def test_empty_file(tmp_path):
+    assert list(read_games(write(tmp_path, ""))) == []
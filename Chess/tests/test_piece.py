@@ -1,3 +1,4 @@
+import copy
 from Chess.constants import PIECE_TYPES, WHITE, BLACK
 from Chess.coordinate import Position
 from Chess.pieces import Piece, King, Queen, Knight, Rook, Bishop, Pawn
@@ -9,7 +10,10 @@ def test_init():
 def test_eq():
     p = Piece(WHITE, Position("A1"), 'K', 7, is_active = True)
     r = Piece(WHITE, Position("A1"), 'K', 7, is_active = True)
-    assert p == r
+    assert p == p
+    assert p == copy.copy(p)
+    # Pieces are identified by id, not by their properties
+    assert p != r
 
 def test_neq():
     p = Piece(WHITE, Position("A1"), 'K', 7, is_active = True)
@@ -21,8 +25,14 @@ def test_neq():
 
 def test_hash():
     p = Piece(WHITE, Position("B7"), 'K', 7, is_active = True)
-    # 111 001 1001011 1 1
-    assert hash(p) == int(0b110001100101111)
+    r = Piece(WHITE, Position("B7"), 'K', 7, is_active = True)
+    assert hash(p) == p.id
+    assert hash(p) != hash(r)
+    # The hash does not change when the piece moves or is captured
+    before = hash(p)
+    p._position = Position("B6")
+    p.is_active = False
+    assert hash(p) == before
 
 def test_active():
     p = Piece(WHITE, Position("B7"), 'K', 7, is_active = True)
@@ -48,3 +58,12 @@ def test_subclass_projections():
     assert len(b.projections) == 4
 
     assert len(p.projections) == 3
+
+def test_slots():
+    p = Pawn(WHITE, Position("A2"))
+    assert not hasattr(p, "__dict__")
+
+def test_shared_projections():
+    assert Rook(WHITE, Position("A1")).projections is Rook(BLACK, Position("H8")).projections
+    assert Pawn(WHITE, Position("A2")).projections is Pawn(WHITE, Position("B2")).projections
+    assert Pawn(WHITE, Position("A2")).projections != Pawn(BLACK, Position("A7")).projections
@@ -0,0 +1,33 @@
+from array import array
+from Chess.constants import ResultKeys
+from Chess.result import PackedResultSet
+from Chess.state import Board, construct_board
+
+
+def test_packed_moves():
+    board = Board()
+    assert isinstance(board.moves, PackedResultSet)
+    assert isinstance(board.moves.moves, array)
+    assert board.moves.moves.typecode == "H"
+    assert len(board.moves.all_valid) == 20
+
+def test_packed_lazy():
+    board = Board()
+    moves = board.moves
+    knight = [p for p in moves if str(board.piece_map[p]) == "G1"].pop()
+    assert all(v is None for v in moves.store.values())
+    assert sorted(str(i) for i in moves[knight][ResultKeys.passive]) == ["F3", "H3"]
+    assert sorted(str(i) for i in moves[knight][ResultKeys.defend]) == ["E2"]
+    assert len([v for v in moves.store.values() if v is not None]) == 1
+
+def test_packed_captures():
+    board = construct_board("r1bqkbnr/pppp1ppp/8/4n3/8/4Q3/PPPPPPPP/RNB1KBNR w KQkq - 0 1")
+    assert sorted(str(i) for i in board.moves.all_capture) == ["A7", "E5"]
+    assert len(board.moves.all_valid) == len(board.moves.all_passive) + 2
+    queen = [p for p in board.moves if p.kind == "Q"].pop()
+    assert sorted(str(i) for i in board.moves[queen][ResultKeys.capture]) == ["A7", "E5"]
+
+def test_packed_filter():
+    board = Board()
+    filtered = board.moves.filter_all_by_value(lambda x: str(x) == "E4")
+    assert len(filtered.all_valid) == 1
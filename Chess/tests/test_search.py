@@ -0,0 +1,77 @@
+from Chess.bitboard import MOVE_CAPTURE, legal_moves
+from Chess.coordinate import Position
+from Chess.search import MATE, Search, search
+from Chess.state import construct_board
+
+def test_mate_in_one():
+    board = construct_board("6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+    result = search(board, depth=3)
+    assert result.best.end == Position((7, 0))
+    assert result.score == MATE - 1
+    assert result.mate_in == 1
+
+def test_mate_in_two():
+    board = construct_board("7k/8/8/8/8/8/R7/1R4K1 w - - 0 1")
+    result = search(board, depth=4)
+    assert result.mate_in == 3
+    assert len(result.pv) == 3
+
+def test_wins_hanging_queen():
+    board = construct_board("4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1")
+    result = search(board, depth=3)
+    assert (result.best.start, result.best.end, result.best.takes) == (Position((0, 3)), Position((4, 3)), True)
+    assert 400 < result.score < 600
+
+def test_avoids_defended_pawn():
+    # Qxd5 wins a pawn and loses the queen to exd5
+    board = construct_board("4k3/8/4p3/3p4/8/8/8/3QK3 w - - 0 1")
+    result = search(board, depth=2)
+    assert not result.best.takes
+
+def test_no_moves():
+    result = search(construct_board("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1"), depth=3)
+    assert result.best is None and result.pv == [] and result.score == 0
+    result = search(construct_board("k1R5/8/1K6/8/8/8/8/8 b - - 0 1"), depth=3)
+    assert result.best is None and result.score == -MATE
+
+def test_pv_is_legal():
+    board = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    result = search(board, depth=3)
+    assert result.pv[0] == result.best
+    for mov in result.pv:
+        assert mov.to_int() in legal_moves(board._bb)[0]
+        board.push(mov)
+
+def test_board_unchanged():
+    board = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    fen, key = board.to_fen(), board.zobrist
+    search(board, depth=2)
+    assert (board.to_fen(), board.zobrist) == (fen, key)
+
+def test_node_limit():
+    board = construct_board("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10")
+    result = search(board, nodes=3000)
+    assert result.depth >= 1 and result.best is not None
+    # Limits are checked every 1024 nodes, once the first iteration is complete
+    assert result.nodes < 3000 + 1024
+    assert result.nps > 0
+
+def test_time_limit():
+    board = construct_board("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10")
+    result = search(board, seconds=0.2)
+    assert result.best is not None
+    assert result.seconds < 1.0
+
+def test_table_reused():
+    board = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    engine = Search(board._bb)
+    first = engine.run(3)
+    second = engine.run(3)
+    assert second.nodes < first.nodes
+    assert second.score == first.score
+
+def test_capture_generation():
+    bb = construct_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")._bb
+    every, _ = legal_moves(bb)
+    captures, _ = legal_moves(bb, captures=True)
+    assert list(captures) == [mov for mov in every if mov & MOVE_CAPTURE]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from Chess.batch import legal_destinations, pack_fens
+from Chess.perft import SUITE
+from Chess.state import construct_board
+from Chess.store import PositionStore, PositionWriter, RECORD_DTYPE, write_fens
+
+fens = [fen for _, fen, _ in SUITE] + ["8/p5p1/2pk2P1/1p5P/3K4/8/P7/2b5 b - - 0 42"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = str(tmp_path / "positions")
+    assert write_fens(path, fens) == len(fens)
+    return PositionStore(path)
+
+
+def test_round_trip(store):
+    assert len(store) == len(fens)
+    for index, fen in enumerate(fens):
+        assert store.fen(index) == construct_board(fen).to_fen()
+    assert store.board(1).to_fen() == construct_board(fens[1]).to_fen()
+
+def test_records(store):
+    assert RECORD_DTYPE.itemsize == 40
+    assert list(store[:]["game"]) == list(range(len(fens)))
+    assert store[-1]["turn"] == 42
+    records = store[1:3]
+    assert len(records) == 2 and np.shares_memory(records, store.records)
+    assert isinstance(store.records, np.memmap)
+
+def test_positions(store):
+    assert (store.positions() == pack_fens(fens)).all()
+    assert (legal_destinations(store.positions(slice(0, 2))) == legal_destinations(fens[:2])).all()
+
+def test_writer_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("Chess.store.CHUNK", 2)
+    path = str(tmp_path / "positions")
+    with PositionWriter(path) as writer:
+        for fen in fens:
+            writer.write(fen, 7)
+        writer.write_records(np.zeros(0, RECORD_DTYPE))
+    store = PositionStore(path)
+    assert len(store) == len(fens) and (store[:]["game"] == 7).all()
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "not_positions"
+    path.write_bytes(b"rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1\n")
+    with pytest.raises(ValueError):
+        PositionStore(str(path))
+
+def test_empty(tmp_path):
+    path = str(tmp_path / "positions")
+    write_fens(path, [])
+    assert len(PositionStore(path)) == 0
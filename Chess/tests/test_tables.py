@@ -0,0 +1,30 @@
+from Chess.constants import WHITE, BLACK
+from Chess.tables import BETWEEN, KING_ATTACKS, KNIGHT_ATTACKS, LINE, PAWN_ATTACKS, RAY_SQUARES, RAYS
+
+def popcount(x):
+    return bin(x).count("1")
+
+def test_leapers():
+    assert popcount(KNIGHT_ATTACKS[0]) == 2
+    assert popcount(KNIGHT_ATTACKS[27]) == 8
+    assert popcount(KING_ATTACKS[0]) == 3
+    assert popcount(KING_ATTACKS[27]) == 8
+    assert PAWN_ATTACKS[WHITE][8] == 1 << 17
+    assert PAWN_ATTACKS[BLACK][55] == (1 << 46)
+
+def test_rays():
+    assert RAY_SQUARES[(1, 0)][0] == (8, 16, 24, 32, 40, 48, 56)
+    assert RAY_SQUARES[(1, 2)][0] == (10, 20, 30)
+    assert RAY_SQUARES[(-1, -1)][0] == ()
+    assert RAYS[(0, 1)][0] == 0xFE
+
+def test_between():
+    assert BETWEEN[0][63] == BETWEEN[63][0]
+    assert BETWEEN[0][7] == 0x7E
+    assert BETWEEN[0][1] == 0
+    assert BETWEEN[0][17] == 0
+
+def test_line():
+    assert LINE[0][9] == LINE[63][54]
+    assert LINE[0][9] & (1 << 0) and LINE[0][9] & (1 << 63)
+    assert LINE[0][17] == 0
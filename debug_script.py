@@ -9,10 +9,7 @@ from Chess.helpers import pieces_from_fen
 from Chess.pieces import Pawn
 from Chess.state import Board, construct_board
 from Chess.view import view_board_mono
-try:
-    from libpychess import Position
-except ImportError:
-    from Chess.coordinate import Position
+from Chess.coordinate import Position
 
 starting_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
 checkmate_fen = "r1bQkbnr/1pp1pppp/8/8/p3p3/N3B3/PP3PPP/3RKBNR b KQkq - 0 8"
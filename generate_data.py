@@ -2,16 +2,18 @@
 module, and confirm that this submission complies with the policy. The content of this file is my own original work,
 with any significant material copied or adapted from other sources clearly indicated and attributed."""
 
+import argparse
 import os
-import re
 import pickle
-from itertools import repeat
-from re import Pattern
-from typing import List
-from Chess import state
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+from Chess import cache
 from Chess.state import Board
 from Chess.game import Game
-from Chess.helpers import pieces_from_fen
+from Chess.pgn import read_games
+from Chess.store import PositionWriter
 from tqdm import tqdm
 import logging, logging.handlers
 
@@ -30,23 +32,9 @@ statelog.addHandler(handler)
 
 
 def read_pgn_file(filename: str):
-    """ Open a file of type pgn and extract a 2d list of games -> moves in the standard algebraic notation"""
-    with open(filename, 'r') as pgn_file:
-        data = pgn_file.readlines()
-
-    games = [i for i in data if i[0] == "1"]
-    moves_expr = re.compile(r"([RNBQK])?([a-h]\d?)?x?([a-h]\d)(=[RNBQ])?|(O-O)(-O)?")
-    # Breakdown of the regex: ([RNBQK])? matches an optional piece identifier (pawn if not present)
-    # ([a-h]\d?)? optionally matches any letter a-h with a digit next to it or not.
-    # x? optionally inculdes "x" in its own match group if present
-    #([a-h]\d) matches the "destination" of the piece which must be present
-    # (=[RNBQ])? includes matches for "promotions" ie c8=Q meaning the c pawn promotes to a queen.
-    # |(O-O)(-O)? means also consider matching O-O and O-O-O which are the strings to represent castling. 
-    return map(get_game_moves, games, repeat(moves_expr))
-
-def get_game_moves(move_str: str, expr: Pattern):
-    """Match using the compiled regex and return a list of the moves extracted"""
-    return ["".join(i) for i in expr.findall(move_str)]
+    """ Stream the games of a pgn file as lists of moves in the standard algebraic notation, skipping games
+    without any moves (see Chess.pgn)"""
+    return (moves for _, moves in read_games(filename) if moves)
 
 def get_random_boards(move_set):
     boards = list(map(get_board_fen, move_set))
@@ -58,39 +46,88 @@ def get_board_fen(moves: List[str]) -> str:
     # of checkmates
     game = Game()
     end = -12 if len(moves) > 20 else len(moves)
-    moves = moves[:end]
-    for move in moves:
-        # If the move executor does not return True then the move failed,
-        # this can happen due to :
-        # - Existing bug in castling
-        # - Piece promotion (not supported)
-        # - Pawns doing en-passant (most frequent)
-        # These things will be supported soon, for now we just break from the calculation
-        # and keep the game in its last "good" state
-        if not game.execute_move_str(move):
-            break
+    # The moves come from real games, so they are replayed without generating the legal moves of
+    # each position. If a move cannot be applied, replay stops there, this can happen due to :
+    # - Existing bug in castling
+    # - Piece promotion (not supported)
+    # - Pawns doing en-passant (most frequent)
+    # These things will be supported soon, for now we keep the game in its last "good" state
+    game.replay(moves[:end], verify=False)
     return game.peek.to_fen()
 
+def _init_worker(max_entries: int, max_bytes: int) -> None:
+    """Runs once in each worker process, which then stays warm (imports, backend and move cache) for every chunk"""
+    cache.enable(max_entries=max_entries, max_bytes=max_bytes)
+    Board(lazy=True)
+
+def _convert_chunk(games: List[List[str]]) -> List[str]:
+    return [get_board_fen(moves) for moves in games]
+
+def convert_games(games: Iterable[List[str]], workers: int = 1, chunk_size: int = 256,
+                  in_flight: Optional[int] = None, max_entries: int = 500_000,
+                  max_bytes: int = 2 * 1024 ** 3) -> Iterator[str]:
+    """Yield the final FEN of every game, in the same order as `games`.
+
+    With more than one worker the games are sent to a process pool in chunks of `chunk_size`. At most
+    `in_flight` chunks (default twice the workers) are queued at once, so a long or lazy stream of games is
+    only read as fast as the workers get through it. Results are taken back in submission order, so the
+    output is the same as a single process. The move cache budget is split between the workers."""
+    if workers <= 1:
+        for moves in games:
+            yield get_board_fen(moves)
+        return
+
+    games = iter(games)
+    in_flight = in_flight or 2 * workers
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(max_entries // workers, max_bytes // workers)) as pool:
+        pending = deque()
+        for chunk in iter(lambda: list(islice(games, chunk_size)), []):
+            pending.append(pool.submit(_convert_chunk, chunk))
+            if len(pending) >= in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
 if __name__ == "__main__":
-    # Create the games data if it does not exist
+    parser = argparse.ArgumentParser(description="Convert the lichess games into final positions")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=256, help="games sent to a worker at a time")
+    parser.add_argument("--write-moves", action="store_true",
+                        help="also pickle the move lists for Chess.bench and profile_app.py (holds every game in memory)")
+    args = parser.parse_args()
+
     pgn_input_path = "imported_games/lichess_db_standard_rated_2013-01.pgn"
     move_sequence_path = "generated_data/lichess_db_standard_rated_2013-01.pickle"
     games_output_csv_path = "generated_data/lichess_db_standard_rated_2013-01.txt"
+    positions_output_path = "generated_data/lichess_db_standard_rated_2013-01.positions"
 
-    if not os.path.exists(move_sequence_path):
-        games = read_pgn_file(pgn_input_path)
+    if args.write_moves:
         with open(move_sequence_path, 'wb') as f:
-            # convert games to a list to exhaust the map
-            pickle.dump(list(games), f)
- 
-    # Load the set of moves back into memory (just quicker than using a CSV)
-    with open(move_sequence_path, 'rb') as f:
-        games = pickle.load(f)
+            pickle.dump(list(read_pgn_file(pgn_input_path)), f)
+
+    if os.path.exists(pgn_input_path):
+        # Stream the games from the PGN file, so only the chunks in flight are ever in memory
+        games = read_pgn_file(pgn_input_path)
+    else:
+        # Without the PGN fall back to the pickled move lists, which can only be loaded whole
+        with open(move_sequence_path, 'rb') as f:
+            games = pickle.load(f)
+
+    # Games share most of their opening positions, so cache legal moves by position hash
+    # (each worker keeps its own cache)
+    if args.workers <= 1:
+        move_cache = cache.enable(max_entries=500_000, max_bytes=2 * 1024 ** 3)
 
     # Write the converted games into a txt file, newline delimeted.
-    # Each "final position" is stored as a FEN string.
-    with open(games_output_csv_path, 'w', newline='') as f:
-        # Use tqdm to get a nice status bar
-        for game in tqdm(games):
-            fen = get_board_fen(game)
+    # Each "final position" is stored as a FEN string, and again in the binary position format
+    # (see Chess.store) which can be memory mapped instead of parsed.
+    with open(games_output_csv_path, 'w', newline='') as f, PositionWriter(positions_output_path) as writer:
+        # Use tqdm to get a nice status bar (the number of games is not known while streaming)
+        games_iter = convert_games(games, args.workers, args.chunk_size)
+        for index, fen in enumerate(tqdm(games_iter, unit="games")):
             f.write(fen + '\n')
+            writer.write(fen, index)
+
+    if args.workers <= 1:
+        print(f"Move cache: {move_cache.stats()}")